@@ -0,0 +1,79 @@
+"""
+Memory used by AST of large queries: bytes per node of the tree.
+
+The tree is built by parser and measured with tracemalloc, tokens are prepared before the measurement.
+
+    python benchmarks/ast_memory.py [--dialect mindsdb]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_queries():
+    # a function in rows: values are nodes, not plain values
+    rows = ', '.join(f"({i}, lower('name {i}'), {i}.5, null, true)" for i in range(10000))
+    columns = ', '.join(f't.col_{i} + {i} as c{i}' for i in range(5000))
+    conditions = ' or '.join(f"(t.col_{i} = {i} and t.name not in ('a', 'b'))" for i in range(2000))
+    return {
+        'insert 10k rows': f'insert into tbl (a, b, c, d, e) values {rows}',
+        'select 5k columns': f'select {columns} from db.tbl t',
+        'select 2k conditions': f'select * from db.tbl t where {conditions}',
+    }
+
+
+def count_nodes(node):
+    from mindsdb_sql.parser.ast.base import ASTNode
+
+    count = 0
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            count += 1
+            # all attributes: get_fields of Insert gives constants of rows as plain values
+            stack.extend(getattr(value, name, None) for name in value._field_names)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+    return count
+
+
+def measure(lexer, parser, sql):
+    tokens = list(lexer.tokenize(sql))
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        tree = parser.parse(tokens)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return count_nodes(tree), size
+
+
+def main():
+    from mindsdb_sql import DIALECTS, get_dialect_classes
+
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--dialect', default='mindsdb', choices=DIALECTS)
+    args = arg_parser.parse_args()
+
+    lexer_class, parser_class = get_dialect_classes(args.dialect)
+    lexer, parser = lexer_class(), parser_class()
+
+    print(f'{"query":<22} {"nodes":>8} {"size, KB":>10} {"bytes/node":>11}')
+    for name, sql in make_queries().items():
+        nodes, size = measure(lexer, parser, sql)
+        print(f'{name:<22} {nodes:>8} {size / 1024:>10,.0f} {size / nodes:>11.0f}')
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
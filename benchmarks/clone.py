@@ -0,0 +1,75 @@
+"""
+Copying of AST: copy.deepcopy against generated clone of nodes, and time of planning which copies queries many times.
+
+    python benchmarks/clone.py [--repeat N]
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_queries():
+    conditions = ' and '.join(f"t.col_{i} = {i}" for i in range(50))
+    return {
+        'join tables': (
+            f'select t.a, t2.b, sum(t3.c) from int1.tab1 t join int2.tab2 t2 on t.id = t2.id '
+            f'left join int1.tab3 t3 on t3.id = t2.id and t3.x > 1 where {conditions} group by 1, 2',
+            {},
+        ),
+        'join predictor': (
+            f'select t.*, p.y from int1.tab1 t join mindsdb.pred p where {conditions} limit 10',
+            {'pred': {}},
+        ),
+        'timeseries': (
+            "select * from int1.tab1 t join mindsdb.tp p "
+            "where t.time > latest and t.vendor_id in (1, 2, 3) limit 10",
+            {'tp': {'timeseries': True, 'order_by_column': 'time', 'group_by_columns': ['vendor_id'], 'window': 10}},
+        ),
+    }
+
+
+def best_time(func, repeat, number):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    from mindsdb_sql import parse_sql
+    from mindsdb_sql.planner import plan_query
+
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--number', type=int, default=200)
+    args = arg_parser.parse_args()
+
+    print(f'{"query":<16} {"deepcopy, us":>13} {"clone, us":>10} {"speedup":>8} {"planning, us":>13}')
+    for name, (sql, predictors) in make_queries().items():
+        query = parse_sql(sql)
+
+        deepcopy_time = best_time(lambda: copy.deepcopy(query), args.repeat, args.number)
+        clone_time = best_time(lambda: query.clone(), args.repeat, args.number)
+        plan_time = best_time(
+            lambda: plan_query(
+                parse_sql(sql), integrations=['int1', 'int2'],
+                predictor_namespace='mindsdb', predictor_metadata=predictors,
+            ),
+            args.repeat, args.number
+        ) - best_time(lambda: parse_sql(sql), args.repeat, args.number)
+
+        print(f'{name:<16} {deepcopy_time * 1e6:>13.1f} {clone_time * 1e6:>10.1f} '
+              f'{deepcopy_time / clone_time:>7.1f}x {plan_time * 1e6:>13.1f}')
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
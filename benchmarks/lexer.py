@@ -0,0 +1,66 @@
+"""
+Speed of lexers: tokens per second on large queries, with lookup of keywords and without it
+(all keywords are alternatives of the master regex).
+
+    python benchmarks/lexer.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_queries():
+    columns = ', '.join(f'col_{i}' for i in range(50))
+    rows = ', '.join(f"({i}, 'name {i}', {i}.5, null, true)" for i in range(20000))
+    conditions = ' or '.join(f"(t.col_{i} = {i} and t.name not in ('a', 'b') and x is not null)" for i in range(2000))
+    return {
+        'insert 20k rows': f'insert into tbl (a, b, c, d, e) values {rows}',
+        'select 2k conditions': f'select {columns} from db.tbl t where {conditions} group by a order by b limit 10',
+    }
+
+
+def make_legacy_lexer(lexer_class):
+    from sly.lex import LexerMeta
+
+    # the same rules, keywords are in the master regex
+    namespace = LexerMeta.__prepare__(lexer_class.__name__, (lexer_class,))
+    namespace['tokens'] = lexer_class.tokens
+    namespace['keyword_token'] = None
+    return LexerMeta(lexer_class.__name__, (lexer_class,), namespace)
+
+
+def measure(lexer_class, sql, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in lexer_class().tokenize(sql))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count, count / best
+
+
+def main():
+    from mindsdb_sql import DIALECTS, get_dialect_classes
+
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    queries = make_queries()
+
+    print(f'{"dialect":<10} {"query":<22} {"tokens":>8} {"regex, tok/s":>14} {"lookup, tok/s":>14} {"speedup":>8}')
+    for dialect in DIALECTS:
+        lexer_class, _ = get_dialect_classes(dialect)
+        legacy_class = make_legacy_lexer(lexer_class)
+        for name, sql in queries.items():
+            count, legacy_speed = measure(legacy_class, sql, args.repeat)
+            _, speed = measure(lexer_class, sql, args.repeat)
+            print(f'{dialect:<10} {name:<22} {count:>8} {legacy_speed:>14,.0f} {speed:>14,.0f} {speed / legacy_speed:>7.1f}x')
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
@@ -0,0 +1,56 @@
+"""
+Startup cost of mindsdb_sql: time of `import mindsdb_sql` and of loading every dialect.
+
+Every measurement runs in a fresh interpreter, with and without the cache of parsing tables.
+
+    python benchmarks/startup.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE_CODE = '''
+import json, sys, time
+start = time.perf_counter()
+import mindsdb_sql
+import_time = time.perf_counter() - start
+start = time.perf_counter()
+mindsdb_sql.warmup([sys.argv[1]])
+warmup_time = time.perf_counter() - start
+print(json.dumps({'import': import_time, 'warmup': warmup_time}))
+'''
+
+
+def measure(dialect, tables_dir):
+    env = dict(os.environ, MINDSDB_SQL_TABLES_DIR=tables_dir, PYTHONPATH=ROOT)
+    out = subprocess.check_output([sys.executable, '-c', MEASURE_CODE, dialect], env=env, cwd=ROOT)
+    return json.loads(out)
+
+
+def main():
+    from mindsdb_sql import DIALECTS
+
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f'{"dialect":<10} {"tables":<8} {"import, s":>10} {"warmup, s":>10}')
+    with tempfile.TemporaryDirectory() as tables_dir:
+        for dialect in DIALECTS:
+            # the first run fills the cache
+            for title, cache_dir in (('no cache', ''), ('cached', tables_dir)):
+                measure(dialect, cache_dir)
+                results = [measure(dialect, cache_dir) for _ in range(args.repeat)]
+                import_time = min(r['import'] for r in results)
+                warmup_time = min(r['warmup'] for r in results)
+                print(f'{dialect:<10} {title:<8} {import_time:>10.3f} {warmup_time:>10.3f}')
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
@@ -0,0 +1,105 @@
+"""
+Traversal of AST of large queries: recursive query_traversal of old revision against the current one.
+
+  - visit: callback is called for every node and keeps it
+  - find identifiers: callback checks the type of every node
+  - node_types: the same search with node_types filter of the current version, callback is called only for identifiers
+  - replace: every constant is replaced with a parameter
+
+The old version is loaded from git.
+
+    python benchmarks/traversal.py [--repeat N] [--old REVISION]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the last revision with recursive query_traversal
+OLD_REVISION = 'd34d520'
+
+
+def make_queries():
+    rows = ', '.join(f"({i}, lower('name {i}'), {i}.5, null, true)" for i in range(10000))
+    columns = ', '.join(f't.col_{i} + {i} as c{i}' for i in range(5000))
+    conditions = ' or '.join(f"(t.col_{i} = {i} and t.name not in ('a', 'b'))" for i in range(2000))
+    return {
+        'insert 10k rows': f'insert into tbl (a, b, c, d, e) values {rows}',
+        'select 5k columns': f'select {columns} from db.tbl t',
+        'select 2k conditions': f'select * from db.tbl t where {conditions}',
+    }
+
+
+def best_time(func, repeat, setup=lambda: None):
+    best = None
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def load_old_traversal(revision):
+    source = subprocess.check_output(
+        ['git', 'show', f'{revision}:mindsdb_sql/planner/utils.py'], cwd=ROOT, text=True
+    )
+    module = types.ModuleType('old_utils')
+    exec(compile(source, f'{revision}:mindsdb_sql/planner/utils.py', 'exec'), module.__dict__)
+    return module.query_traversal
+
+
+def main():
+    from mindsdb_sql import parse_sql
+    from mindsdb_sql.parser import ast
+    from mindsdb_sql.planner.utils import query_traversal
+
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--old', default=OLD_REVISION, help='git revision of the old version')
+    args = arg_parser.parse_args()
+
+    old_traversal = load_old_traversal(args.old)
+
+    def visit(node, **kwargs):
+        pass
+
+    def find_identifiers(node, **kwargs):
+        if isinstance(node, ast.Identifier):
+            return node
+
+    def replace_constants(node, **kwargs):
+        if isinstance(node, ast.Constant):
+            return ast.Parameter('?')
+
+    print(f'{"query":<22} {"operation":<18} {"old, ms":>9} {"new, ms":>9} {"speedup":>8}')
+    for name, sql in make_queries().items():
+        query = parse_sql(sql)
+
+        # node_types of the new version is compared with the search by callback of the old one
+        operations = [
+            ('visit', lambda _: old_traversal(query, visit), lambda _: query_traversal(query, visit), None),
+            ('find identifiers', lambda _: old_traversal(query, find_identifiers),
+             lambda _: query_traversal(query, find_identifiers), None),
+            ('node_types', lambda _: old_traversal(query, find_identifiers),
+             lambda _: query_traversal(query, find_identifiers, node_types=ast.Identifier), None),
+            # every run replaces constants of a fresh copy
+            ('replace', lambda copy: old_traversal(copy, replace_constants),
+             lambda copy: query_traversal(copy, replace_constants), query.clone),
+        ]
+        for operation, old_func, new_func, setup in operations:
+            setup = setup or (lambda: None)
+            old_time = best_time(old_func, args.repeat, setup=setup)
+            new_time = best_time(new_func, args.repeat, setup=setup)
+            print(f'{name:<22} {operation:<18} {old_time * 1e3:>9.1f} {new_time * 1e3:>9.1f} '
+                  f'{old_time / new_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
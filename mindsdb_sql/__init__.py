@@ -1,20 +1,30 @@
 import re
+import importlib
+import itertools
+import threading
 from collections import defaultdict
-
-from sly.lex import Token
+from contextlib import contextmanager
 
 from mindsdb_sql.exceptions import ParsingException
 from mindsdb_sql.parser.ast import *
+from mindsdb_sql.parser.parse_cache import ParseCache
+from mindsdb_sql.parser.splitter import read_chunks, split_statements
+from mindsdb_sql.parser.batch import parse_many, iter_parse_many
 
 
 class ErrorHandling:
+    # limit of steps of parser's automaton which are done to check suggestions
+    SUGGESTIONS_BUDGET = 100000
 
-    def __init__(self, lexer, parser):
+    def __init__(self, lexer, parser, suggestions=True, budget=None):
         self.parser = parser
         self.lexer = lexer
+        self.suggestions = suggestions
+        self.budget = self.SUGGESTIONS_BUDGET if budget is None else budget
 
     def process(self, error_info):
-        self.tokens = [t for t in error_info['tokens'] if t is not None]
+        # all tokens of the query, the list is shared with the parser
+        self.tokens = error_info['tokens']
         self.bad_token = error_info['bad_token']
         self.expected_tokens = error_info['expected_tokens']
 
@@ -25,7 +35,7 @@ class ErrorHandling:
         msgs = self.error_location()
 
         # suggestion
-        suggestions = self.make_suggestion()
+        suggestions = self.make_suggestion() if self.suggestions else []
 
         if suggestions:
             prefix = 'Possible inputs: ' if len(suggestions) > 1 else 'Expected symbol: '
@@ -131,67 +141,157 @@ class ErrorHandling:
                 return list(expected.keys())
 
             # not every suggestion satisfy the end of the query. we have to check if it works
-            for value, token_name in expected.items():
-                # make up a token
-                token = Token()
-                token.type = token_name
-                token.value = value
-                token.end = 0
-                token.index = 0
-                token.lineno = 0
+            types = [token.type for token in self.tokens]
+
+            # states of the parser before the bad token and before the previous token
+            states_before_prev = self.run_states([0], types[:error_index - 1]) if error_index > 0 else None
+            states_before_bad = [0] if error_index == 0 else None
+            if states_before_prev is not None:
+                states_before_bad = self.run_states(list(states_before_prev), [types[error_index - 1]])
 
+            for value, token_name in expected.items():
                 # try to add token
-                tokens2 = self.tokens[:error_index] + [token] + self.tokens[error_index:]
-                if self.query_is_valid(tokens2):
+                if states_before_bad is not None and self.is_valid_end(states_before_bad, token_name, types[error_index:]):
                     suggestions.append(value)
                     continue
 
                 # try to replace token
-                tokens2 = self.tokens[:error_index - 1] + [token] + self.tokens[error_index:]
-                if self.query_is_valid(tokens2):
+                if states_before_prev is not None and self.is_valid_end(states_before_prev, token_name, types[error_index:]):
                     suggestions.append(value)
                     continue
 
         return suggestions
 
-    def query_is_valid(self, tokens):
-        # try to parse list of tokens
-
-        ast = self.parser.parse(iter(tokens))
-        return ast is not None
+    def run_states(self, statestack, types):
+        # moves the parser's automaton by types of tokens without parsing
+        # returns None on syntax error or if the budget is exhausted
+        for ltype in types:
+            steps = self.parser.feed_state(statestack, ltype)
+            if steps <= 0:
+                return None
+            self.budget -= steps
+            if self.budget < 0:
+                return None
+        return statestack
+
+    def is_valid_end(self, statestack, token_type, types):
+        # checks if the query is valid with the token and the rest of types after the state
+        statestack = list(statestack)
+        for ltype in itertools.chain([token_type], types, ['$end']):
+            steps = self.parser.feed_state(statestack, ltype)
+            if steps == -1:
+                return True
+            if steps == 0:
+                return False
+            self.budget -= steps
+            if self.budget < 0:
+                return False
+        return False
+
+
+# Registry of dialects: name -> (lexer class, parser class).
+#   Modules are imported (and parsing tables are built) only on first use of the dialect
+DIALECTS = {
+    'sqlite': ('mindsdb_sql.parser.lexer.SQLLexer', 'mindsdb_sql.parser.parser.SQLParser'),
+    'mysql': ('mindsdb_sql.parser.dialects.mysql.lexer.MySQLLexer',
+              'mindsdb_sql.parser.dialects.mysql.parser.MySQLParser'),
+    'mindsdb': ('mindsdb_sql.parser.dialects.mindsdb.lexer.MindsDBLexer',
+                'mindsdb_sql.parser.dialects.mindsdb.parser.MindsDBParser'),
+}
+
+_dialect_classes = {}
+
+
+def _import_class(path):
+    module_name, class_name = path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_dialect_classes(dialect):
+    classes = _dialect_classes.get(dialect)
+    if classes is None:
+        if dialect not in DIALECTS:
+            raise ParsingException(f'Unknown dialect {dialect}. Available options are: {", ".join(DIALECTS)}.')
+        lexer_path, parser_path = DIALECTS[dialect]
+        classes = _import_class(lexer_path), _import_class(parser_path)
+        _dialect_classes[dialect] = classes
+    return classes
 
 
 def get_lexer_parser(dialect):
-    if dialect == 'sqlite':
-        from mindsdb_sql.parser.lexer import SQLLexer
-        from mindsdb_sql.parser.parser import SQLParser
-        lexer, parser = SQLLexer(), SQLParser()
-    elif dialect == 'mysql':
-        from mindsdb_sql.parser.dialects.mysql.lexer import MySQLLexer
-        from mindsdb_sql.parser.dialects.mysql.parser import MySQLParser
-        lexer, parser = MySQLLexer(), MySQLParser()
-    elif dialect == 'mindsdb':
-        from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
-        from mindsdb_sql.parser.dialects.mindsdb.parser import MindsDBParser
-        lexer, parser = MindsDBLexer(), MindsDBParser()
-    else:
-        raise ParsingException(f'Unknown dialect {dialect}. Available options are: sqlite, mysql.')
-    return lexer, parser
-
-
-def parse_sql(sql, dialect='mindsdb'):
+    lexer_class, parser_class = get_dialect_classes(dialect)
+    return lexer_class(), parser_class()
+
+
+def warmup(dialects=None):
+    """
+    Loads dialects in advance, for example before forking workers of a server.
+    :param dialects: list of dialect names, all dialects by default
+    """
+    if dialects is None:
+        dialects = list(DIALECTS)
+    for dialect in dialects:
+        get_dialect_classes(dialect)
+
+
+# Lexer and parser instances are reused between calls of parse_sql. sly keeps the state of the current
+#   parse in these objects, therefore instances are not shared between threads: every thread has own pool
+_local = threading.local()
+
+
+@contextmanager
+def pooled_lexer_parser(dialect):
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = _local.pool = {}
+
+    # taken from the pool while it is in use: nested call in the same thread gets another pair
+    pair = pool.pop(dialect, None)
+    if pair is None:
+        pair = get_lexer_parser(dialect)
+    try:
+        yield pair
+    finally:
+        pool[dialect] = pair
+
+
+def parse_sql(sql, dialect='mindsdb', cache=None, suggestions=True):
+    # suggestions: add expected inputs to the message of syntax error, they are not required for high loaded services
     # remove ending semicolon and spaces
     sql = re.sub(r'[\s;]+$', '', sql)
 
-    lexer, parser = get_lexer_parser(dialect)
-    tokens = lexer.tokenize(sql)
-    ast = parser.parse(tokens)
+    if cache is not None:
+        ast = cache.get(sql, dialect)
+        if ast is not None:
+            return ast
+
+    with pooled_lexer_parser(dialect) as (lexer, parser):
+        tokens = lexer.tokenize(sql)
+        ast = parser.parse(tokens)
 
-    if ast is None:
+        if ast is None:
 
-        eh = ErrorHandling(lexer, parser)
-        message = eh.process(parser.error_info)
+            eh = ErrorHandling(lexer, parser, suggestions=suggestions)
+            message = eh.process(parser.error_info)
+            parser.error_info = None
 
-        raise ParsingException(message)
+            raise ParsingException(message)
 
+    if cache is not None:
+        ast = cache.put(sql, dialect, ast)
     return ast
+
+
+def parse_sql_stream(source, dialect='mindsdb', cache=None, encoding='utf-8'):
+    """
+    Parses sql script statement by statement, the script is not loaded in memory at once.
+    :param source: string, file object (text or binary), mmap or iterable of str/bytes chunks
+    :param dialect: dialect of the statements
+    :param cache: ParseCache, optional
+    :param encoding: encoding of bytes in source
+    :return: generator of AST of statements
+    """
+    lexer_class, _ = get_dialect_classes(dialect)
+    chunks = read_chunks(source, encoding=encoding)
+    for sql in split_statements(chunks, backslash_escapes=lexer_class.backslash_escapes):
+        yield parse_sql(sql, dialect=dialect, cache=cache)
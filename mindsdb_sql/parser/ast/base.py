@@ -1,10 +1,45 @@
 import copy
 
 from mindsdb_sql import ParsingException
-from mindsdb_sql.parser.utils import to_single_line
 
 
 class ASTNode:
+    # nodes don't have __dict__: attributes of each class are listed in __slots__
+    __slots__ = ('alias', 'parentheses')
+
+    # attributes which don't define the node (hints for parser or render):
+    #   they are skipped in comparison and hash, as well as private attributes
+    hint_fields = ()
+
+    # names of attributes which define the node, computed for each class from __slots__
+    _field_names = ('alias', 'parentheses')
+    # fields can be read directly by comparison (node has only slots and standard get_fields)
+    _plain_fields = True
+    # all attributes of the class, including private and hints
+    _slot_names = ('alias', 'parentheses')
+
+    # frozen node is an instance of frozen version of the class (see freeze), node_class is the class of the node
+    _frozen = False
+    node_class = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in names:
+                    names.append(name)
+        cls._slot_names = tuple(names)
+        cls._field_names = tuple(
+            name for name in names
+            if name[0] != '_' and name not in cls.hint_fields
+        )
+        cls._plain_fields = cls.__dictoffset__ == 0 and cls.get_fields is ASTNode.get_fields
+        if 'node_class' not in cls.__dict__:
+            cls.node_class = cls
+        if 'clone' not in cls.__dict__:
+            cls.clone = make_clone(cls)
+
     def __init__(self, alias=None, parentheses=False):
         self.alias = alias
         self.parentheses = parentheses
@@ -33,20 +68,389 @@ class ASTNode:
     def to_string(self, alias=True):
         return self.maybe_add_alias(self.maybe_add_parentheses(self.get_string()), alias=alias)
 
+    def clone(self):
+        # generated for every class by make_clone, copy of frozen node is mutable
+        raise NotImplementedError
+
     def copy(self):
-        return copy.deepcopy(self)
+        return self.clone()
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
+    def freeze(self):
+        """
+        Makes the tree immutable: attributes of nodes can't be set,
+        lists and dicts are replaced with FrozenList and FrozenDict, other values are not changed.
+        Class of frozen node is a subclass of the class of the node without __setattr__: nodes which are not frozen
+        don't pay for the check. Use isinstance or node_class to check type of node
+        Frozen tree can be shared (by cache, between threads), clone() makes a mutable copy of it.
+        Frozen subtrees are not traversed again: they can be parts of many trees
+        :return: the node
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._frozen:
+                continue
+            for name in node._slot_names:
+                value = getattr(node, name, _unset)
+                if value is not _unset and type(value) not in _leaf_types:
+                    setattr(node, name, freeze_value(value, stack))
+            if type(node).__dictoffset__ != 0:
+                for name, value in vars(node).items():
+                    vars(node)[name] = freeze_value(value, stack)
+            node.__class__ = frozen_class(type(node))
+        return self
+
+    def is_frozen(self):
+        return self._frozen
+
+    def replace(self, **fields):
+        """
+        Shallow copy of the node with changed attributes, other attributes are shared with the node.
+        Copy of frozen node is frozen
+        """
+        node = object.__new__(self.node_class)
+        for name in self._slot_names:
+            value = fields.pop(name, getattr(self, name, _unset))
+            if value is not _unset:
+                setattr(node, name, value)
+        if fields:
+            raise AttributeError(f'{type(self).__name__} has no attributes: {", ".join(fields)}')
+        if type(self).__dictoffset__ != 0:
+            vars(node).update(vars(self))
+        if self._frozen:
+            node.freeze()
+        return node
 
     def __str__(self):
         return self.to_string()
 
+    def get_fields(self):
+        # attributes which define the node, unset attribute is None
+        fields = {name: getattr(self, name, None) for name in self._field_names}
+
+        # subclasses without __slots__ can have other attributes
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            for k in sorted(extra):
+                if k[0] != '_' and k not in self.hint_fields:
+                    fields[k] = extra[k]
+        return fields
+
     def __eq__(self, other):
         if isinstance(other, ASTNode):
-            return self.to_tree() == other.to_tree() and to_single_line(str(self)) == to_single_line(str(other))
+            return structure_equal(self, other)
         else:
             return False
 
+    def __hash__(self):
+        # nodes can be changed in place: hash is not cached.
+        #  it is computed in one pass without building strings, like the comparison
+        return hash(tuple(structure_items(self)))
+
     def __repr__(self):
         sql = self.to_string().replace('\n', ' ')
         if len(sql) > 500:
             sql = sql[:500] + '...'
         return f'{self.__class__.__name__}:<{sql}>'
+
+
+# values which are compared directly, they are immutable and not copied by clone
+_leaf_types = frozenset([str, int, float, bool, type(None)])
+
+_unset = object()
+
+# frozen version of every node class, they are made by freeze
+_frozen_classes = {}
+
+
+def _frozen_setattr(self, name, value):
+    raise AttributeError(f"Can't set '{name}': {type(self).__name__} is frozen, change its clone instead")
+
+
+def _frozen_delattr(self, name):
+    raise AttributeError(f"Can't delete '{name}': {type(self).__name__} is frozen, change its clone instead")
+
+
+def _unpickle_frozen(node):
+    return node.freeze()
+
+
+def frozen_class(cls):
+    frozen_cls = _frozen_classes.get(cls)
+    if frozen_cls is None:
+        # it looks like the class: the same name and module
+        frozen_cls = type(cls.__name__, (cls,), {
+            '__slots__': (),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__setattr__': _frozen_setattr,
+            '__delattr__': _frozen_delattr,
+            # the class can't be found by pickle by name: mutable copy is pickled
+            '__reduce__': lambda self: (_unpickle_frozen, (self.clone(),)),
+            # immutable object is its own copy
+            '__copy__': lambda self: self,
+            '_frozen': True,
+            'node_class': cls,
+            'clone': make_clone(cls, thaw=True),
+        })
+        frozen_cls = _frozen_classes.setdefault(cls, frozen_cls)
+    return frozen_cls
+
+
+class FrozenList(list):
+    """
+    List of frozen node: it can't be changed, otherwise it is the same list
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('List of frozen node can not be changed')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """
+    Dict of frozen node: it can't be changed, otherwise it is the same dict
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('Dict of frozen node can not be changed')
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze_value(value, stack):
+    # immutable version of value, nodes are added to stack to be frozen
+    value_type = type(value)
+    if value_type in _leaf_types:
+        return value
+    if isinstance(value, ASTNode):
+        stack.append(value)
+        return value
+    if value_type in (FrozenList, FrozenDict):
+        # it is made by freeze, items are frozen
+        return value
+    if value_type is list:
+        return FrozenList(freeze_value(item, stack) for item in value)
+    if value_type is tuple:
+        items = tuple(freeze_value(item, stack) for item in value)
+        if all(item is old for item, old in zip(items, value)):
+            return value
+        return items
+    if value_type is dict:
+        return FrozenDict((key, freeze_value(item, stack)) for key, item in value.items())
+    return value
+
+
+def thaw_value(value):
+    # mutable copy of value of frozen node
+    value_type = type(value)
+    if value_type in _leaf_types:
+        return value
+    if isinstance(value, ASTNode):
+        return value.clone()
+    if value_type is FrozenList:
+        return [thaw_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(thaw_value(item) for item in value)
+    if value_type is FrozenDict:
+        return {key: thaw_value(item) for key, item in value.items()}
+    return clone_value(value)
+
+
+def clone_value(value):
+    # copy of value of the node attribute: nodes are cloned, containers are copied, leaves are shared
+    value_type = type(value)
+    if value_type in _leaf_types:
+        return value
+    if isinstance(value, ASTNode):
+        return value.clone()
+    if value_type is list:
+        return [clone_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(clone_value(item) for item in value)
+    if value_type is dict:
+        return {key: clone_value(item) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+
+def make_clone(cls, thaw=False):
+    """
+    Generates clone method for the class: a deep copy of the node which copies only attributes of the class,
+    without memo of copy.deepcopy. The same object used twice in the tree becomes two objects in the copy.
+    thaw: clone of frozen node, containers of frozen node are replaced with list and dict
+    """
+    lines = ['def clone(self):', '    node = new(cls)']
+    for name in cls._slot_names:
+        lines += [
+            f'    value = getattr(self, {name!r}, unset)',
+            '    if value is not unset:',
+            f'        node.{name} = value if type(value) in leaf_types else copy_value(value)',
+        ]
+    if cls.__dictoffset__ != 0:
+        # subclass without __slots__
+        lines.append('    node.__dict__.update({k: copy_value(v) for k, v in vars(self).items()})')
+    lines.append('    return node')
+
+    namespace = {
+        'new': object.__new__, 'cls': cls, 'unset': _unset, 'leaf_types': _leaf_types,
+        'copy_value': thaw_value if thaw else clone_value,
+    }
+    exec('\n'.join(lines), namespace)
+    clone = namespace['clone']
+    clone.__qualname__ = f'{cls.__qualname__}.clone'
+    return clone
+
+
+ASTNode.node_class = ASTNode
+ASTNode.clone = make_clone(ASTNode)
+
+
+def transform(node, callback):
+    """
+    Rewrites the tree without changing it (path copying): callback gets every node in pre-order,
+    if it returns not None the node is replaced with the result (and the result is not traversed).
+    Parents of replaced nodes are copied by replace(), unchanged subtrees are shared with the new tree.
+    Result of transformation of frozen tree is frozen
+    :return: new tree or the same node if nothing is replaced
+    """
+    new_node = _transform_value(node, callback)
+    if new_node is not node and isinstance(node, ASTNode) and node.is_frozen():
+        new_node.freeze()
+    return new_node
+
+
+def _transform_value(value, callback):
+    if isinstance(value, ASTNode):
+        new_node = callback(value)
+        if new_node is not None:
+            return new_node
+
+        changed = {}
+        for name in value._slot_names:
+            item = getattr(value, name, None)
+            if type(item) in _leaf_types:
+                continue
+            new_item = _transform_value(item, callback)
+            if new_item is not item:
+                changed[name] = new_item
+        if not changed:
+            return value
+        return value.replace(**changed)
+
+    # new containers are mutable, they are frozen with the node
+    if isinstance(value, (list, tuple)):
+        items = [_transform_value(item, callback) for item in value]
+        if all(item is old for item, old in zip(items, value)):
+            return value
+        return tuple(items) if isinstance(value, tuple) else items
+
+    if isinstance(value, dict):
+        items = {key: _transform_value(item, callback) for key, item in value.items()}
+        if all(items[key] is item for key, item in value.items()):
+            return value
+        return items
+
+    return value
+
+
+def structure_equal(node1, node2):
+    """
+    Compares nodes by type and fields, lists and tuples of items are the same.
+    Tree is traversed without recursion: deep trees don't hit the limit of recursion
+    """
+    stack = [(node1, node2)]
+    while stack:
+        value1, value2 = stack.pop()
+
+        if isinstance(value1, ASTNode):
+            if type(value1) is not type(value2) and value1.node_class is not getattr(value2, 'node_class', None):
+                return False
+            if value1._plain_fields:
+                pairs = [
+                    (getattr(value1, k, None), getattr(value2, k, None))
+                    for k in value1._field_names
+                ]
+            else:
+                fields1, fields2 = value1.get_fields(), value2.get_fields()
+                if fields1.keys() != fields2.keys():
+                    return False
+                pairs = [(item1, fields2[k]) for k, item1 in fields1.items()]
+
+        elif isinstance(value1, (list, tuple)):
+            if not isinstance(value2, (list, tuple)) or len(value1) != len(value2):
+                return False
+            pairs = zip(value1, value2)
+
+        elif isinstance(value1, dict):
+            if not isinstance(value2, dict) or value1.keys() != value2.keys():
+                return False
+            pairs = [(value1[k], value2[k]) for k in value1]
+
+        # types are compared too: 1, 1.0 and True are different constants
+        elif type(value1) is not type(value2) or value1 != value2:
+            return False
+
+        else:
+            continue
+
+        for item1, item2 in pairs:
+            if item1 is item2:
+                continue
+            if type(item1) in _leaf_types:
+                if type(item1) is not type(item2) or item1 != item2:
+                    return False
+            else:
+                stack.append((item1, item2))
+
+    return True
+
+
+def structure_items(node):
+    """
+    Flat sequence of types, field names and values of the tree in pre-order.
+    Equal nodes (see structure_equal) give the same sequence
+    """
+    stack = [node]
+    while stack:
+        value = stack.pop()
+
+        if type(value) in _leaf_types:
+            yield value
+
+        elif isinstance(value, ASTNode):
+            fields = value.get_fields()
+            keys = list(fields)
+            yield value.node_class
+            yield tuple(keys)
+            stack.extend(fields[k] for k in reversed(keys))
+
+        elif isinstance(value, (list, tuple)):
+            yield list
+            yield len(value)
+            stack.extend(reversed(value))
+
+        elif isinstance(value, dict):
+            keys = sorted(value, key=repr)
+            yield dict
+            yield tuple(keys)
+            stack.extend(value[k] for k in reversed(keys))
+
+        else:
+            try:
+                hash(value)
+            except TypeError:
+                # values which can't be hashed contribute only with type
+                value = type(value)
+            yield value
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class CommitTransaction(ASTNode):
+    __slots__ = ()
+
     def __init__(self,
                  *args, **kwargs):
         super().__init__(*args, **kwargs)
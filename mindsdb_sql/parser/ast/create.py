@@ -2,10 +2,15 @@ from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.utils import indent
 from typing import List
 
-try:
-    from sqlalchemy import types as sa_types
-except ImportError:
-    sa_types = None
+
+def get_sa_types():
+    # sqlalchemy is imported on demand: it is slow to import and is only needed
+    # if a column type is given as a sqlalchemy type
+    try:
+        from sqlalchemy import types as sa_types
+    except ImportError:
+        sa_types = None
+    return sa_types
 
 
 class TableColumn():
@@ -31,6 +36,8 @@ class TableColumn():
 
 
 class CreateTable(ASTNode):
+    __slots__ = ('name', 'is_replace', 'from_select', 'columns', 'if_not_exists')
+
     def __init__(self,
                  name,
                  from_select=None,
@@ -85,8 +92,12 @@ class CreateTable(ASTNode):
         columns_str = ''
         if self.columns is not None:
             columns = []
+            sa_types = None
             for col in self.columns:
 
+                if not isinstance(col.type, str) and sa_types is None:
+                    sa_types = get_sa_types()
+
                 if not isinstance(col.type, str) and sa_types is not None:
                     if issubclass(col.type, sa_types.Integer):
                         type = 'int'
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Explain(ASTNode):
+    __slots__ = ('target',)
+
     def __init__(self,
                  target,
                  *args, **kwargs):
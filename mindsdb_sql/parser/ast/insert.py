@@ -2,9 +2,19 @@ from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.utils import indent
 from mindsdb_sql.parser.ast.create import TableColumn
 from mindsdb_sql.parser.ast.select.identifier import Identifier
-from mindsdb_sql.parser.ast.select.constant import Constant
+from mindsdb_sql.parser.ast.select.constant import Constant, NullConstant
+
+def plain_value(val):
+    if isinstance(val, Constant) and val.node_class in (Constant, NullConstant) and val.with_quotes:
+        return val.value
+    return val
+
 
 class Insert(ASTNode):
+    # is_plain is computed by parser and used by render
+    __slots__ = ('table', 'values', 'from_select', 'is_plain', 'columns')
+
+    hint_fields = ('is_plain',)
 
     def __init__(self,
                  table,
@@ -31,6 +41,16 @@ class Insert(ASTNode):
         # True if values in query are constant (without subselects and operations)
         self.is_plain = is_plain
 
+    def get_fields(self):
+        fields = dict(super().get_fields())
+        if self.values is not None:
+            # plain values are stored as python values, they are the same as constants
+            fields['values'] = [
+                [plain_value(val) for val in row]
+                for row in self.values
+            ]
+        return fields
+
     def to_column(self, col):
         if isinstance(col, str):
             return TableColumn(col)
@@ -41,9 +61,12 @@ class Insert(ASTNode):
         return TableColumn(str(col))
 
     def to_value(self, val):
-        if isinstance(val, ASTNode) :
+        if isinstance(val, ASTNode):
             return val.to_string()
-        return repr(val)
+        # plain value
+        if val is None:
+            return 'NULL'
+        return Constant(val).to_string()
 
     def to_tree(self, *args, level=0, **kwargs):
         ind = indent(level)
@@ -4,6 +4,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Case(ASTNode):
+    __slots__ = ('arg', 'rules', 'default')
+
     def __init__(self, rules, default=None, arg=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -4,6 +4,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Constant(ASTNode):
+    __slots__ = ('value', 'with_quotes')
+
     def __init__(self, value, with_quotes=True, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = value
@@ -27,6 +29,8 @@ class Constant(ASTNode):
 
 
 class NullConstant(Constant):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(value=None, *args, **kwargs)
 
@@ -38,6 +42,8 @@ class NullConstant(Constant):
 
 
 class Last(Constant):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         self.value = 'last'
         super().__init__(self.value)
@@ -1,5 +1,4 @@
 import re
-from copy import copy, deepcopy
 
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.parser.utils import indent
@@ -22,19 +21,29 @@ RESERVED_KEYWORDS = {
 }
 
 
+_reserved_words = None
+
+
 def get_reserved_words():
-    from mindsdb_sql.parser.lexer import SQLLexer
-    from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
+    global _reserved_words
+    if _reserved_words is None:
+        # lexers are imported here because of circular imports
+        from mindsdb_sql.parser.lexer import SQLLexer
+        from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
 
-    reserved = RESERVED_KEYWORDS
-    for word in SQLLexer.tokens | MindsDBLexer.tokens:
-        if '_' not in word:
-            # exclude combinations
-            reserved.add(word)
-    return reserved
+        reserved = set(RESERVED_KEYWORDS)
+        for word in SQLLexer.tokens | MindsDBLexer.tokens:
+            if '_' not in word:
+                # exclude combinations
+                reserved.add(word)
+        _reserved_words = reserved
+    return _reserved_words
 
 
 class Identifier(ASTNode):
+    # sub_select is set by planner for subqueries replaced with identifiers, it is unset by default
+    __slots__ = ('parts', 'sub_select')
+
     def __init__(self, path_str=None, parts=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         assert path_str or parts, "Either path_str or parts must be provided for an Identifier"
@@ -77,17 +86,5 @@ class Identifier(ASTNode):
         return self.parts_to_str()
 
     def __copy__(self):
-        identifier = Identifier(parts=copy(self.parts))
-        identifier.alias = deepcopy(self.alias)
-        identifier.parentheses = self.parentheses
-        if hasattr(self, 'sub_select'):
-            identifier.sub_select = deepcopy(self.sub_select)
-        return identifier
-
-    def __deepcopy__(self, memo):
-        identifier = Identifier(parts=copy(self.parts))
-        identifier.alias = deepcopy(self.alias)
-        identifier.parentheses = self.parentheses
-        if hasattr(self, 'sub_select'):
-            identifier.sub_select = deepcopy(self.sub_select)
-        return identifier
+        # copy of identifier is deep: sub_select is copied too
+        return self.clone()
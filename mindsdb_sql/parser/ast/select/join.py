@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Join(ASTNode):
+    __slots__ = ('join_type', 'left', 'right', 'condition', 'implicit')
+
     def __init__(self, join_type, left, right, condition=None, implicit=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if join_type is not None:
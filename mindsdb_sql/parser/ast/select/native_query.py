@@ -6,6 +6,7 @@ class NativeQuery(ASTNode):
     """
         Not parsed query to integration
     """
+    __slots__ = ('integration', 'query')
 
     def __init__(self, integration, query: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
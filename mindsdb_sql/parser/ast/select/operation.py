@@ -4,6 +4,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Operation(ASTNode):
+    __slots__ = ('op', 'args')
+
     def __init__(self, op, args, *args_, **kwargs):
         super().__init__(*args_, **kwargs)
 
@@ -31,6 +33,8 @@ class Operation(ASTNode):
 
 
 class BetweenOperation(Operation):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(op='between', *args, **kwargs)
 
@@ -40,6 +44,44 @@ class BetweenOperation(Operation):
 
 
 class BinaryOperation(Operation):
+    # associative operations: a chain of them is one operation with all arguments of the chain,
+    #   it keeps the tree flat for long conditions like 'a=1 or a=2 or ...'
+    __slots__ = ()
+
+    chain_ops = ('and', 'or', '||')
+
+    def __init__(self, op, args, *args_, **kwargs):
+        super().__init__(op, args, *args_, **kwargs)
+
+        if self.op in self.chain_ops:
+            flat_args = []
+            for arg in self.args:
+                if self.is_chain_link(arg):
+                    flat_args.extend(arg.args)
+                else:
+                    flat_args.append(arg)
+            self.args = flat_args
+
+    def is_chain_link(self, arg):
+        # the argument is a part of the chain: the same operation without parentheses.
+        #   node_class: frozen node is a part of the chain too
+        return (
+            getattr(arg, 'node_class', None) is self.node_class and arg.op == self.op and self.op in self.chain_ops
+            and not arg.parentheses and arg.alias is None
+        )
+
+    @classmethod
+    def chain(cls, op, left, right):
+        # is used by parsers: the chain at the left side is extended in place instead of copying of its arguments,
+        #   frozen chain is copied by constructor
+        if type(left) is cls and left.op == op.lower() and left.is_chain_link(left):
+            if left.is_chain_link(right):
+                left.args.extend(right.args)
+            else:
+                left.args.append(right)
+            return left
+        return cls(op=op, args=(left, right))
+
     def get_string(self, *args, **kwargs):
         arg_strs = []
         for arg in self.args:
@@ -49,14 +91,19 @@ class BinaryOperation(Operation):
             #     arg_str = f'({arg_str})'
             arg_strs.append(arg_str)
 
-        return f'{arg_strs[0]} {self.op.upper()} {arg_strs[1]}'
+        return f' {self.op.upper()} '.join(arg_strs)
 
     def assert_arguments(self):
-        if len(self.args) != 2:
+        if self.op in self.chain_ops:
+            if len(self.args) < 2:
+                raise ParsingException(f'Expected two or more arguments for operation "{self.op}"')
+        elif len(self.args) != 2:
             raise ParsingException(f'Expected two arguments for operation "{self.op}"')
 
 
 class UnaryOperation(Operation):
+    __slots__ = ()
+
     def get_string(self, *args, **kwargs):
         return f'{self.op} {self.args[0].to_string()}'
 
@@ -66,6 +113,8 @@ class UnaryOperation(Operation):
 
 
 class Function(Operation):
+    __slots__ = ('distinct', 'from_arg', 'namespace')
+
     def __init__(self, *args, distinct=False, from_arg=None, namespace=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.distinct = distinct
@@ -98,6 +147,8 @@ class Function(Operation):
 
 
 class WindowFunction(ASTNode):
+    __slots__ = ('function', 'partition', 'order_by', 'modifier')
+
     def __init__(self, function, partition=None, order_by=None, alias=None, modifier=None):
         super().__init__()
         self.function = function
@@ -149,6 +200,8 @@ class WindowFunction(ASTNode):
 
 
 class Object(ASTNode):
+    __slots__ = ('type', 'params')
+
     def __init__(self, type, params=None, **kwargs):
         super().__init__(**kwargs)
 
@@ -175,6 +228,8 @@ class Object(ASTNode):
 
 class Interval(Operation):
 
+    __slots__ = ()
+
     def __init__(self, info):
         super().__init__(op='interval', args=[info, ])
 
@@ -195,12 +250,32 @@ class Interval(Operation):
 
 
 class Exists(Operation):
+    __slots__ = ()
+
     def __init__(self, query):
-        self.query = query
         super().__init__(op='exists', args=[query])
 
+    @property
+    def query(self):
+        # the only argument: traversal and copying see one subquery
+        return self.args[0]
+
+    @query.setter
+    def query(self, value):
+        self.args = [value]
+
 
 class NotExists(Operation):
+    __slots__ = ()
+
     def __init__(self, query):
-        self.query = query
         super().__init__(op='not exists', args=[query])
+
+    @property
+    def query(self):
+        # the only argument: traversal and copying see one subquery
+        return self.args[0]
+
+    @query.setter
+    def query(self, value):
+        self.args = [value]
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Star(ASTNode):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         if 'alias' in kwargs:
             from mindsdb_sql import ParsingException
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class Tuple(ASTNode):
+    __slots__ = ('items',)
+
     def __init__(self, items, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.items = items
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class TypeCast(ASTNode):
+    __slots__ = ('type_name', 'arg', 'precision')
+
     def __init__(self, type_name, arg, precision=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
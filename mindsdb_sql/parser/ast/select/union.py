@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class CombiningQuery(ASTNode):
+    __slots__ = ('left', 'right', 'unique')
+
     operation = None
 
     def __init__(self,
@@ -44,12 +46,18 @@ class CombiningQuery(ASTNode):
 
 
 class Union(CombiningQuery):
+    __slots__ = ()
+
     operation = 'UNION'
 
 
 class Intersect(CombiningQuery):
+    __slots__ = ()
+
     operation = 'INTERSECT'
 
 
 class Except(CombiningQuery):
+    __slots__ = ()
+
     operation = 'EXCEPT'
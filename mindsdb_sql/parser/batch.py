@@ -0,0 +1,92 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from mindsdb_sql.exceptions import ParsingException
+
+
+def _init_worker(dialect):
+    from mindsdb_sql import warmup
+
+    # tables are loaded from the cache which is filled by the main process
+    warmup([dialect])
+
+
+def _parse_chunk(sqls, dialect):
+    from mindsdb_sql import parse_sql
+
+    results = []
+    for sql in sqls:
+        try:
+            results.append(parse_sql(sql, dialect=dialect))
+        except ParsingException as e:
+            results.append(e)
+        except Exception as e:
+            # results are pickled back from workers: errors of lexer can't be unpickled
+            results.append(ParsingException(str(e)))
+    return results
+
+
+def _chunks(sqls, chunksize):
+    sqls = iter(sqls)
+    while True:
+        chunk = list(itertools.islice(sqls, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_parse_many(sqls, dialect='mindsdb', workers=None, chunksize=100, max_pending=None):
+    """
+    Parses queries in worker processes, results are returned in order of queries.
+    Result of a query is AST or ParsingException if the query can't be parsed.
+    Queries are read from iterable only when there is a room for them: not more than
+      max_pending chunks (2 per worker by default) are sent to workers at the same time.
+
+    :param sqls: iterable of sql strings
+    :param dialect: dialect of queries
+    :param workers: count of processes, cpu count by default. 0 or 1: parse in current process
+    :param chunksize: count of queries sent to a worker at once
+    :param max_pending: limit of chunks in process
+    :return: generator of results
+    """
+    from mindsdb_sql import warmup
+
+    if chunksize < 1:
+        raise ValueError(f'Wrong size of chunk: {chunksize}')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = workers * 2
+
+    # build the tables once, workers will reuse them
+    warmup([dialect])
+
+    if workers <= 1:
+        for chunk in _chunks(sqls, chunksize):
+            yield from _parse_chunk(chunk, dialect)
+        return
+
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(dialect,))
+    pending = deque()
+    try:
+        for chunk in _chunks(sqls, chunksize):
+            pending.append(executor.submit(_parse_chunk, chunk, dialect))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # generator can be closed before the end
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+
+def parse_many(sqls, dialect='mindsdb', workers=None, chunksize=100):
+    """
+    The same as iter_parse_many, but returns list of results
+    """
+    return list(iter_parse_many(sqls, dialect=dialect, workers=workers, chunksize=chunksize))
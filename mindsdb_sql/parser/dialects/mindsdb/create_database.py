@@ -4,6 +4,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class CreateDatabase(ASTNode):
+    __slots__ = ('name', 'engine', 'parameters', 'is_replace', 'if_not_exists')
+
     def __init__(self,
                  name,
                  engine,
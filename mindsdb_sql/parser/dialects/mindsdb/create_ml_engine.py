@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 
 
 class CreateMLEngine(ASTNode):
+    __slots__ = ('name', 'handler', 'params', 'if_not_exists')
+
     def __init__(self,
                  name,
                  handler,
@@ -6,6 +6,23 @@ from mindsdb_sql.parser.ast.select.operation import Object
 
 
 class CreatePredictorBase(ASTNode):
+    __slots__ = (
+        'name',
+        'integration_name',
+        'query_str',
+        'targets',
+        'order_by',
+        'group_by',
+        'window',
+        'horizon',
+        'using',
+        'is_replace',
+        'if_not_exists',
+        'task',
+        '_action',
+        '_object',
+    )
+
     def __init__(self,
                  name,
                  targets=None,
@@ -137,6 +154,8 @@ class CreatePredictorBase(ASTNode):
 
 
 class CreatePredictor(CreatePredictorBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._object = 'MODEL'
@@ -144,6 +163,8 @@ class CreatePredictor(CreatePredictorBase):
 
 # Models by task type
 class CreateAnomalyDetectionModel(CreatePredictorBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._object = 'ANOMALY DETECTION MODEL'
@@ -3,6 +3,8 @@ from mindsdb_sql.parser.utils import indent
 from mindsdb_sql.parser.ast.select.identifier import Identifier
 
 class CreateView(ASTNode):
+    __slots__ = ('name', 'query_str', 'from_table', 'if_not_exists')
+
     def __init__(self,
                  name,
                  query_str,
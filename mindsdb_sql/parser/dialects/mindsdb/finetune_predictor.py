@@ -2,6 +2,8 @@ from .create_predictor import CreatePredictorBase
 
 
 class FinetunePredictor(CreatePredictorBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._action = 'FINETUNE'
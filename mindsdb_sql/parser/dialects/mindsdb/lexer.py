@@ -13,6 +13,10 @@ class MindsDBLexer(Lexer):
     ignore = ' \t\r'
     ignore_multi_comment = r'/\*[\s\S]*?\*/'
     ignore_line_comment = r'--[^\n]*'
+    # keywords are found by lookup of ID tokens
+    keyword_token = 'ID'
+    # chars in strings can be escaped with backslash: 'it\'s'
+    backslash_escapes = True
 
     tokens = {
         USE, DROP, CREATE, DESCRIBE, RETRAIN, REPLACE,
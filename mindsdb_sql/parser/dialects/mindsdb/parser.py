@@ -23,11 +23,15 @@ from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
 from mindsdb_sql.parser.dialects.mindsdb.retrain_predictor import RetrainPredictor
 from mindsdb_sql.parser.dialects.mindsdb.finetune_predictor import FinetunePredictor
 from mindsdb_sql.parser.logger import ParserLogger
-from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType, tokens_to_string
+from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType, tokens_to_string, get_tables_cache_dir
 
-all_tokens_list = MindsDBLexer.tokens.copy()
-all_tokens_list.remove('RPAREN')
-all_tokens_list.remove('LPAREN')
+# sorted: set order changes between runs, but the grammar (and its cached tables) has to be the same
+all_tokens_list = sorted(MindsDBLexer.tokens - {'RPAREN', 'LPAREN'})
+
+
+def is_plain_constant(node):
+    # number, string, boolean or null: can be stored as python value
+    return type(node) in (Constant, NullConstant) and node.with_quotes
 
 """
 Unfortunately the rules are not iherited from base SQLParser, because it just doesn't work with Sly due to metaclass magic.
@@ -36,6 +40,9 @@ Unfortunately the rules are not iherited from base SQLParser, because it just do
 
 class MindsDBParser(Parser):
     log = ParserLogger()
+    tabledir = get_tables_cache_dir()
+    # grammar rules don't use positions of symbols
+    track_positions = False
     tokens = MindsDBLexer.tokens
 
     precedence = (
@@ -209,7 +216,7 @@ class MindsDBParser(Parser):
     @_('CREATE TRIGGER identifier ON identifier LPAREN raw_query RPAREN')
     @_('CREATE TRIGGER identifier ON identifier COLUMNS column_list LPAREN raw_query RPAREN')
     def create_trigger(self, p):
-        query_str = tokens_to_string(p.raw_query)
+        query_str = self.raw_query_string(p.raw_query)
 
         columns = None
         if hasattr(p, 'column_list'):
@@ -238,10 +245,10 @@ class MindsDBParser(Parser):
        )
     def create_job(self, p):
         if hasattr(p, 'raw_query0'):
-            query_str = tokens_to_string(p.raw_query0)
-            if_query_str = tokens_to_string(p.raw_query1)
+            query_str = self.raw_query_string(p.raw_query0)
+            if_query_str = self.raw_query_string(p.raw_query1)
         else:
-            query_str = tokens_to_string(p.raw_query)
+            query_str = self.raw_query_string(p.raw_query)
             if_query_str = None
 
         job_schedule = getattr(p, 'job_schedule', {})
@@ -627,11 +634,24 @@ class MindsDBParser(Parser):
        'INSERT INTO identifier VALUES expr_list_set')
     def insert(self, p):
         columns = getattr(p, 'column_list', None)
-        return Insert(table=p.identifier, columns=columns, values=p.expr_list_set)
 
-    @_('expr_list_set COMMA expr_list_set')
+        # rows of constants are stored as plain values
+        values = []
+        is_plain = True
+        for row in p.expr_list_set:
+            if all(is_plain_constant(item) for item in row):
+                row = [item.value for item in row]
+            else:
+                is_plain = False
+            values.append(row)
+
+        return Insert(table=p.identifier, columns=columns, values=values, is_plain=is_plain)
+
+    # left recursion: rows are appended without copying of the list
+    @_('expr_list_set COMMA LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
-        return p.expr_list_set0 + p.expr_list_set1
+        p.expr_list_set.append(p.expr_list)
+        return p.expr_list_set
 
     @_('LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
@@ -671,7 +691,7 @@ class MindsDBParser(Parser):
     @_('CREATE VIEW if_not_exists_or_empty identifier create_view_from_table_or_nothing AS LPAREN raw_query RPAREN',
        'CREATE VIEW if_not_exists_or_empty identifier create_view_from_table_or_nothing LPAREN raw_query RPAREN')
     def create_view(self, p):
-        query_str = tokens_to_string(p.raw_query)
+        query_str = self.raw_query_string(p.raw_query)
 
         return CreateView(name=p.identifier,
                           from_table=p.create_view_from_table_or_nothing,
@@ -827,7 +847,7 @@ class MindsDBParser(Parser):
     def create_predictor(self, p):
         query_str = None
         if hasattr(p, 'raw_query'):
-            query_str = tokens_to_string(p.raw_query)
+            query_str = self.raw_query_string(p.raw_query)
 
         if hasattr(p, 'identifier'):
             # single identifier field
@@ -858,7 +878,7 @@ class MindsDBParser(Parser):
 
         query_str = None
         if hasattr(p, 'raw_query'):
-            query_str = tokens_to_string(p.raw_query)
+            query_str = self.raw_query_string(p.raw_query)
 
         if hasattr(p, 'identifier'):
             # single identifier field
@@ -896,7 +916,7 @@ class MindsDBParser(Parser):
     def create_predictor(self, p):
         query_str = None
         if hasattr(p, 'raw_query'):
-            query_str = tokens_to_string(p.raw_query)
+            query_str = self.raw_query_string(p.raw_query)
 
         if hasattr(p, 'identifier'):
             # single identifier field
@@ -918,7 +938,7 @@ class MindsDBParser(Parser):
     def create_predictor(self, p):
         query_str = None
         if hasattr(p, 'raw_query'):
-            query_str = tokens_to_string(p.raw_query)
+            query_str = self.raw_query_string(p.raw_query)
 
         if hasattr(p, 'identifier'):
             # single identifier field
@@ -948,7 +968,7 @@ class MindsDBParser(Parser):
 
         return Evaluate(
             name=name,
-            query_str=tokens_to_string(p.raw_query),
+            query_str=self.raw_query_string(p.raw_query),
             using=using
         )
 
@@ -1239,7 +1259,7 @@ class MindsDBParser(Parser):
     def from_table(self, p):
         query = NativeQuery(
             integration=p.identifier,
-            query=tokens_to_string(p.raw_query)
+            query=self.raw_query_string(p.raw_query)
         )
         return query
 
@@ -1576,7 +1596,7 @@ class MindsDBParser(Parser):
             arg1 = Last()
         else:
             arg1 = p[2]
-        return BinaryOperation(op=p[1], args=(p[0], arg1))
+        return BinaryOperation.chain(p[1], p[0], arg1)
 
     @_('MINUS expr %prec UMINUS',
        'NOT expr %prec UNOT', )
@@ -1603,7 +1623,8 @@ class MindsDBParser(Parser):
 
     @_('enumeration COMMA expr')
     def enumeration(self, p):
-        return p.enumeration + [p.expr]
+        p.enumeration.append(p.expr)
+        return p.enumeration
 
     @_('expr COMMA expr')
     def enumeration(self, p):
@@ -1868,19 +1889,19 @@ class MindsDBParser(Parser):
     def dquote_string(self, p):
         return p[0].strip('\"')
 
-    # for raw query
+    # for raw query: the value is the pair of the first and the last token of it
 
     @_('LPAREN raw_query RPAREN')
     def raw_query(self, p):
-        return [p._slice[0]] + p[1] + [p._slice[2]]
+        return p._slice[0], p._slice[2]
 
     @_('raw_query LPAREN RPAREN')
     def raw_query(self, p):
-        return p[0] + [p._slice[1], p._slice[2]]
+        return p[0][0], p._slice[2]
 
     @_('raw_query raw_query')
     def raw_query(self, p):
-        return p[0] + p[1]
+        return p[0][0], p[1][1]
 
     @_('variable')
     def table_or_subquery(self, p):
@@ -1927,7 +1948,14 @@ class MindsDBParser(Parser):
 
     @_(*all_tokens_list)
     def raw_query(self, p):
-        return p._slice
+        return p._slice[0], p._slice[0]
+
+    def raw_query_string(self, raw_query):
+        # tokens are taken from the list of all tokens of the query
+        first, last = raw_query
+        start = self.tokens.index(first)
+        end = self.tokens.index(last, start) + 1
+        return tokens_to_string(self.tokens[start:end])
 
     @_('')
     def empty(self, p):
@@ -1935,7 +1963,7 @@ class MindsDBParser(Parser):
 
     def error(self, p, expected_tokens=None):
 
-        if not hasattr(self, 'used_tokens'):
+        if not hasattr(self, 'stop'):
             # failback mode if user has another sly version module installed
             if p:
                 raise ParsingException(f"Syntax error at token {p.type}: \"{p.value}\"")
@@ -1944,9 +1972,11 @@ class MindsDBParser(Parser):
 
         # save error info for future usage
         self.error_info = dict(
-            tokens=self.used_tokens.copy() + list(self.tokens),
+            tokens=self.tokens,
             bad_token=p,
             expected_tokens=expected_tokens
         )
+        # nothing is parsed after the first error
+        self.stop()
         # don't raise exception
         return
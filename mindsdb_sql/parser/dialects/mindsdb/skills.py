@@ -6,6 +6,7 @@ class CreateSkill(ASTNode):
     """
     Node for creating a new skill
     """
+    __slots__ = ('name', 'type', 'params', 'if_not_exists')
 
     def __init__(self, name, type, params, if_not_exists=False, *args, **kwargs):
         """
@@ -43,6 +44,7 @@ class UpdateSkill(ASTNode):
     """
     Node for updating a skill
     """
+    __slots__ = ('name', 'params')
 
     def __init__(self, name, updated_params, *args, **kwargs):
         """
@@ -73,6 +75,7 @@ class DropSkill(ASTNode):
     """
     Node for dropping a skill
     """
+    __slots__ = ('name', 'if_exists')
 
     def __init__(self, name, if_exists=False, *args, **kwargs):
         """
@@ -3,13 +3,16 @@ from mindsdb_sql.parser.parser import SQLParser
 from mindsdb_sql.parser.ast import *
 from mindsdb_sql.parser.dialects.mysql.lexer import MySQLLexer
 from mindsdb_sql.exceptions import ParsingException
-from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType
+from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType, get_tables_cache_dir
 
 """
 Unfortunately the rules are not iherited from base SQLParser, because it just doesn't work with Sly due to metaclass magic.
 """
 class MySQLParser(SQLParser):
     log = ParserLogger()
+    tabledir = get_tables_cache_dir()
+    # grammar rules don't use positions of symbols
+    track_positions = False
     tokens = MySQLLexer.tokens
 
     precedence = (
@@ -397,9 +400,11 @@ class MySQLParser(SQLParser):
         columns = getattr(p, 'result_columns', None)
         return Insert(table=p.from_table, columns=columns, values=p.expr_list_set)
 
-    @_('expr_list_set COMMA expr_list_set')
+    # left recursion: rows are appended without copying of the list
+    @_('expr_list_set COMMA LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
-        return p.expr_list_set0 + p.expr_list_set1
+        p.expr_list_set.append(p.expr_list)
+        return p.expr_list_set
 
     @_('LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
@@ -880,7 +885,7 @@ class MySQLParser(SQLParser):
        'expr CONCAT expr',
        'expr IN expr')
     def expr(self, p):
-        return BinaryOperation(op=p[1], args=(p.expr0, p.expr1))
+        return BinaryOperation.chain(p[1], p.expr0, p.expr1)
 
 
     @_('MINUS expr %prec UMINUS',
@@ -6,6 +6,10 @@ class SQLLexer(Lexer):
     ignore = ' \t\n\r'
     ignore_multi_comment = r'/\*[\s\S]*?\*/'
     ignore_line_comment = r'--[^\n]*'
+    # keywords are found by lookup of ID tokens
+    keyword_token = 'ID'
+    # strings don't have escaped chars: 'it''s'
+    backslash_escapes = False
 
     tokens = {
         USE, DROP, CREATE, DESCRIBE, REPLACE,
@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+
+
+class ParseCache:
+    """
+    Size-bounded LRU cache of parsed queries, it is used by parse_sql if passed to it:
+
+        cache = ParseCache(maxsize=1000)
+        ast = parse_sql(sql, dialect='mindsdb', cache=cache)
+
+    Stored trees are never returned: every hit returns a copy of the tree, so it can be changed by the caller.
+
+    With frozen=True trees are frozen (see ASTNode.freeze) and shared without copying:
+    every hit returns the same tree, it can be used by many threads and has to be cloned to be changed
+    """
+
+    def __init__(self, maxsize=1024, frozen=False):
+        if maxsize < 1:
+            raise ValueError(f'Wrong size of cache: {maxsize}')
+        self.maxsize = maxsize
+        self.frozen = frozen
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(sql, dialect):
+        # sql is already stripped from ending semicolon and spaces
+        return dialect, sql.lstrip()
+
+    def get(self, sql, dialect):
+        key = self.make_key(sql, dialect)
+        with self._lock:
+            ast = self._data.get(key)
+            if ast is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        if self.frozen:
+            return ast
+        return ast.copy()
+
+    def put(self, sql, dialect, ast):
+        """
+        :return: tree for the caller: the passed tree or frozen tree if cache is frozen
+        """
+        key = self.make_key(sql, dialect)
+        if self.frozen:
+            # the tree is shared with the caller
+            ast = ast.freeze()
+            stored = ast
+        else:
+            # the caller owns passed object, keep own copy
+            stored = ast.copy()
+        with self._lock:
+            self._data[key] = stored
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return ast
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return dict(
+            size=len(self._data),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def __len__(self):
+        return len(self._data)
@@ -4,11 +4,14 @@ from mindsdb_sql.parser.ast import *
 from mindsdb_sql.exceptions import ParsingException
 from mindsdb_sql.parser.lexer import SQLLexer
 from mindsdb_sql.parser.logger import ParserLogger
-from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType
+from mindsdb_sql.parser.utils import ensure_select_keyword_order, JoinType, get_tables_cache_dir
 
 
 class SQLParser(Parser):
     log = ParserLogger()
+    tabledir = get_tables_cache_dir()
+    # grammar rules don't use positions of symbols
+    track_positions = False
     tokens = SQLLexer.tokens
 
     precedence = (
@@ -223,9 +226,11 @@ class SQLParser(Parser):
         columns = getattr(p, 'result_columns', None)
         return Insert(table=p.from_table, columns=columns, values=p.expr_list_set)
 
-    @_('expr_list_set COMMA expr_list_set')
+    # left recursion: rows are appended without copying of the list
+    @_('expr_list_set COMMA LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
-        return p.expr_list_set0 + p.expr_list_set1
+        p.expr_list_set.append(p.expr_list)
+        return p.expr_list_set
 
     @_('LPAREN expr_list RPAREN')
     def expr_list_set(self, p):
@@ -635,7 +640,7 @@ class SQLParser(Parser):
        'expr CONCAT expr',
        'expr IN expr')
     def expr(self, p):
-        return BinaryOperation(op=p[1], args=(p.expr0, p.expr1))
+        return BinaryOperation.chain(p[1], p.expr0, p.expr1)
 
 
     @_('MINUS expr %prec UMINUS',
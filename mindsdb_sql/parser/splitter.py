@@ -0,0 +1,162 @@
+import codecs
+import re
+
+# chars which can change the state of splitter outside of strings and comments
+_special_chars = re.compile(r"[;'\"`()\-/]")
+
+# end of quoted string or escaped char in it
+_string_ends = {
+    "'": re.compile(r"['\\]"),
+    '"': re.compile(r'["\\]'),
+    '`': re.compile(r'`'),
+}
+
+# end of quoted string if backslash is a usual char
+_string_ends_no_escapes = {
+    "'": re.compile(r"'"),
+    '"': re.compile(r'"'),
+    '`': re.compile(r'`'),
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def read_chunks(source, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Text chunks of the source:
+      - string: the whole text
+      - file object or mmap: data is read by chunks
+      - any other iterable of str or bytes chunks
+    Bytes are decoded with encoding
+    """
+    if isinstance(source, str):
+        yield source
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        chunks = [bytes(source)]
+    elif hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    decoder = None
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+
+    if decoder is not None:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
+def split_statements(chunks, backslash_escapes=True):
+    """
+    Splits sql script by semicolons and yields text of statements one by one.
+    Semicolons are skipped inside of:
+      - quoted strings and identifiers: '...', "...", `...`
+      - comments: -- and /* */
+      - parentheses: for bodies of native queries and jobs
+    Only text of the current statement is kept in memory.
+    Statements which contain only comments are skipped.
+    :param chunks: iterable of strings
+    :param backslash_escapes: chars in strings can be escaped with backslash, it depends on dialect
+    """
+    string_ends = _string_ends if backslash_escapes else _string_ends_no_escapes
+
+    pending = []  # scanned text of the current statement from previous chunks
+    buffer = ''
+    start = 0  # start of the current statement in buffer
+    pos = 0  # position of scanning
+    state = None  # quote char or comment start
+    depth = 0  # parentheses
+    has_content = False
+
+    for chunk in chunks:
+        # only a few chars after pos are not scanned yet, the scanned text is moved out of buffer
+        if start < pos:
+            pending.append(buffer[start: pos])
+        buffer = buffer[pos:] + chunk
+        start = pos = 0
+
+        while pos < len(buffer):
+            if state is None:
+                m = _special_chars.search(buffer, pos)
+                end = len(buffer) if m is None else m.start()
+                if not has_content and pos < end and not buffer[pos:end].isspace():
+                    has_content = True
+                if m is None:
+                    pos = end
+                    break
+
+                char = m.group()
+                if char in '-/':
+                    if end + 1 >= len(buffer):
+                        # wait for the next char
+                        pos = end
+                        break
+                    comment = buffer[end: end + 2]
+                    if comment in ('--', '/*'):
+                        state = comment
+                        pos = end + 2
+                        continue
+                elif char == ';' and depth == 0:
+                    if has_content:
+                        pending.append(buffer[start: end])
+                        yield ''.join(pending).strip()
+                    pending = []
+                    start = pos = end + 1
+                    has_content = False
+                    continue
+                elif char == '(':
+                    depth += 1
+                elif char == ')':
+                    depth = max(depth - 1, 0)
+                elif char in string_ends:
+                    state = char
+
+                has_content = True
+                pos = end + 1
+
+            elif state == '--':
+                end = buffer.find('\n', pos)
+                if end == -1:
+                    pos = len(buffer)
+                    break
+                state = None
+                pos = end + 1
+
+            elif state == '/*':
+                end = buffer.find('*/', pos)
+                if end == -1:
+                    # the end can be split between chunks
+                    pos = max(pos, len(buffer) - 1)
+                    break
+                state = None
+                pos = end + 2
+
+            else:
+                m = string_ends[state].search(buffer, pos)
+                if m is None:
+                    pos = len(buffer)
+                    break
+                end = m.start()
+                if m.group() == '\\':
+                    if end + 1 >= len(buffer):
+                        # escaped char is in the next chunk
+                        pos = end
+                        break
+                    pos = end + 2
+                else:
+                    state = None
+                    pos = end + 1
+
+    # the rest of the text: if it is not finished it will be an error of parsing
+    if has_content or (state is None and buffer[pos:].strip()):
+        pending.append(buffer[start:])
+        yield ''.join(pending).strip()
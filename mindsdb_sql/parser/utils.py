@@ -1,3 +1,5 @@
+import os
+
 from mindsdb_sql.exceptions import ParsingException
 
 
@@ -42,6 +44,15 @@ def ensure_select_keyword_order(select, operation):
             raise ParsingException(f"{operation} must go before {next_op}")
 
 
+def get_tables_cache_dir():
+    # directory where the computed LALR tables of parsers are stored between runs
+    #   can be changed by MINDSDB_SQL_TABLES_DIR env variable, empty value disables the cache
+    tabledir = os.environ.get('MINDSDB_SQL_TABLES_DIR')
+    if tabledir is None:
+        tabledir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+    return tabledir or None
+
+
 class JoinType:
     JOIN = 'JOIN'
     INNER_JOIN = 'INNER JOIN'
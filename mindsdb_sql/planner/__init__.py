@@ -1,6 +1,9 @@
 from .query_planner import QueryPlanner
+from .fingerprint import fingerprint, Fingerprint
+from .plan_cache import PlanCache
 
 
-def plan_query(query, *args, **kwargs):
+def plan_query(query, *args, plan_cache=None, **kwargs):
+    if plan_cache is not None:
+        return plan_cache.plan_query(query, *args, **kwargs)
     return QueryPlanner(query, *args, **kwargs).from_query()
-
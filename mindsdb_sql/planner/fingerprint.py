@@ -0,0 +1,72 @@
+import hashlib
+
+from mindsdb_sql.parser import ast
+from mindsdb_sql.planner import utils
+
+
+class Fingerprint:
+    """
+    Query with literals replaced by parameters:
+      - hash: stable key of the template, it is the same for queries different only by literals
+      - template: AST of the query with Parameter('?') instead of constants
+      - values: values of all parameters of the template, in order of utils.get_query_params
+    """
+
+    def __init__(self, hash, template, values):
+        self.hash = hash
+        self.template = template
+        self.values = values
+
+    def bind(self, values=None):
+        # build the query back from the template
+        if values is None:
+            values = self.values
+        return utils.fill_query_params(self.template.clone(), values)
+
+    def __repr__(self):
+        return f'Fingerprint({self.hash[:12]}: {self.template.to_string()})'
+
+
+def is_literal(node):
+    # only plain values: NULL, LAST and unquoted keywords (like in SET statement) are part of the query structure
+    return type(node) is ast.Constant and node.with_quotes
+
+
+def template_hash(template):
+    text = f'{template.to_tree()}\n{template.to_string()}'
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def fingerprint(query, dialect='mindsdb'):
+    """
+    :param query: sql string or AST, AST is not changed
+    :param dialect: dialect to parse sql string
+    :return: Fingerprint
+    """
+    if isinstance(query, str):
+        from mindsdb_sql import parse_sql
+        template = parse_sql(query, dialect=dialect)
+    else:
+        template = query.clone()
+
+    values = []
+
+    def replace_literals(node, parent_query=None, **kwargs):
+        if isinstance(node, ast.Parameter):
+            # parameter of the query itself stays in the template and is bound back as it is
+            values.append(node)
+        elif is_literal(node):
+            values.append(node.value)
+            return ast.Parameter('?', alias=node.alias)
+        elif isinstance(parent_query, ast.Insert) and not isinstance(node, ast.ASTNode) and node is not None:
+            # plain value of insert
+            values.append(node)
+            return ast.Parameter('?')
+
+    template = utils.query_traversal(template, replace_literals) or template
+
+    if isinstance(template, ast.Insert):
+        # values are not plain in template
+        template.is_plain = False
+
+    return Fingerprint(template_hash(template), template, values)
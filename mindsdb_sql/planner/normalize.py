@@ -0,0 +1,119 @@
+from mindsdb_sql.parser import ast
+from mindsdb_sql.planner.fingerprint import is_literal
+from mindsdb_sql.planner.simplify import simplify_query
+from mindsdb_sql.planner.utils import query_traversal
+
+
+def get_column_values(node):
+    # 'col = value' or 'col in (values...)': returns column and list of values
+    if not isinstance(node, ast.BinaryOperation) or node.alias is not None:
+        return None
+
+    if node.op == '=':
+        col, value = node.args
+        if isinstance(value, ast.Identifier):
+            col, value = value, col
+        if isinstance(col, ast.Identifier) and is_literal(value):
+            return col, [value]
+
+    elif node.op == 'in':
+        col, values = node.args
+        if (
+            isinstance(col, ast.Identifier)
+            and isinstance(values, ast.Tuple)
+            and len(values.items) > 0
+            and all(is_literal(value) for value in values.items)
+        ):
+            return col, values.items
+
+    return None
+
+
+def column_key(col):
+    return tuple(col.parts)
+
+
+def value_key(value):
+    # values of different types are not mixed: 1, 1.0, '1' and TRUE are different values
+    return type(value.value).__name__, value.value
+
+
+def or_to_in(node):
+    """
+    Replaces equalities of the same column in OR chain by one IN:
+      a = 2 or b = 1 or a = 1 or a in (2, 3)  =>  a in (1, 2, 3) or b = 1
+    Values are deduplicated and sorted, other items of the chain keep their order
+    :return: new node or None if the node isn't changed
+    """
+    if not isinstance(node, ast.BinaryOperation) or node.op != 'or':
+        return None
+
+    # nested chains in parentheses are the same chain: (a = 1 or b = 1) or a = 2
+    chain = []
+    stack = list(reversed(node.args))
+    while stack:
+        arg = stack.pop()
+        if isinstance(arg, ast.BinaryOperation) and arg.op == 'or' and arg.alias is None:
+            stack.extend(reversed(arg.args))
+        else:
+            chain.append(arg)
+
+    groups = {}
+    for arg in chain:
+        column_values = get_column_values(arg)
+        if column_values is not None:
+            col, values = column_values
+            groups.setdefault(column_key(col), []).append((arg, col, values))
+
+    groups = {key: items for key, items in groups.items() if len(items) > 1}
+    if not groups:
+        return None
+
+    args = []
+    merged = set()
+    for arg in chain:
+        column_values = get_column_values(arg)
+        key = None if column_values is None else column_key(column_values[0])
+        if key not in groups:
+            args.append(arg)
+            continue
+        if key in merged:
+            # it is in IN of the first item of the group
+            continue
+        merged.add(key)
+        items = groups[key]
+
+        values = {}
+        for _, _, item_values in items:
+            for value in item_values:
+                values.setdefault(value_key(value), value)
+        values = [values[key] for key in sorted(values)]
+
+        args.append(ast.BinaryOperation(op='in', args=[column_values[0], ast.Tuple(values)]))
+
+    if len(args) == 1:
+        new_node = args[0]
+    else:
+        new_node = ast.BinaryOperation(op='or', args=args)
+    new_node.parentheses = node.parentheses
+    new_node.alias = node.alias
+    return new_node
+
+
+def normalize_predicates(node, **kwargs):
+    new_node = or_to_in(node)
+    if new_node is not None:
+        # the items of the chain can contain chains too
+        query_traversal(new_node, normalize_predicates)
+        return new_node
+
+
+def normalize_query(query):
+    """
+    Rewrites predicates of the query to the canonical form before planning:
+    conditions are simplified, OR chains of equalities are replaced with IN.
+    Query is changed in place, frozen query is copied
+    :return: the query
+    """
+    query = simplify_query(query)
+    return query_traversal(query, normalize_predicates) or query
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from mindsdb_sql.planner.fingerprint import fingerprint
+from mindsdb_sql.planner.normalize import normalize_query
+from mindsdb_sql.planner.plan_template import number_params, dump_plan, bind_plan
+from mindsdb_sql.planner.query_planner import QueryPlanner
+
+
+def catalog_hash(planner):
+    # fields filled by planner itself on lookup of predictor are not a part of catalog
+    predictors = {
+        name: {k: v for k, v in info.items() if k not in ('name', 'version')}
+        for name, info in planner.predictor_info.items()
+    }
+    catalog = [
+        planner.integrations,
+        predictors,
+        sorted(planner.projects),
+        planner.default_namespace,
+        planner.predictor_namespace,
+    ]
+    text = json.dumps(catalog, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class PlanCache:
+    """
+    Size-bounded LRU cache of query plans. Plans are stored for templates of queries (see fingerprint):
+    queries different only by literals use the same plan with bound values.
+
+        cache = PlanCache()
+        plan = plan_query(query, integrations=..., predictor_metadata=..., plan_cache=cache)
+
+    The key includes the hash of planner's catalog (integrations, predictors, namespaces),
+      the change of catalog leads to planning of the query from scratch.
+
+    The plan of template is stored only if it is the same as plan of the query after binding of values.
+    Templates which can't be planned this way are remembered and planned as usual.
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError(f'Wrong size of cache: {maxsize}')
+        self.maxsize = maxsize
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key):
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, self._data[key]
+
+    def _put(self, key, plan):
+        with self._lock:
+            self._data[key] = plan
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def plan_query(self, query, *args, **kwargs):
+        # template is made from the normalized query: IN lists depend on values of OR chains
+        query = normalize_query(query)
+        planner = QueryPlanner(query, *args, **kwargs)
+
+        fp = fingerprint(query)
+        key = (fp.hash, catalog_hash(planner))
+
+        found, plan_data = self._get(key)
+        if found:
+            if plan_data is None:
+                # not cacheable
+                return planner.from_query()
+            return bind_plan(plan_data, fp.values)
+
+        plan = planner.from_query()
+
+        try:
+            template_plan = QueryPlanner(number_params(fp.template, fp.values), *args, **kwargs).from_query()
+            plan_data = dump_plan(template_plan)
+            if bind_plan(plan_data, fp.values).steps != plan.steps:
+                plan_data = None
+        except Exception:
+            # planner can fail on parameters instead of literals
+            plan_data = None
+
+        self._put(key, plan_data)
+        return plan
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return dict(
+            size=len(self._data),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def __len__(self):
+        return len(self._data)
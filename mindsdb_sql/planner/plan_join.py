@@ -1,5 +1,4 @@
 from typing import List
-import copy
 from dataclasses import dataclass, field
 
 from mindsdb_sql.exceptions import PlanningException
@@ -18,6 +17,8 @@ class TableInfo:
     table: Identifier
     aliases: List[str] = field(default_factory=List)
     conditions: List = None
+    # original conditions in the query, by index of the condition
+    orig_conditions: List = None
     sub_select: ast.ASTNode = None
     predictor_info: dict = None
     join_condition = None
@@ -109,7 +110,7 @@ class PlanJoinTablesQuery:
                 or len(query.targets) != 1
                 or not isinstance(query.targets[0], Star)
         ):
-            query2 = copy.deepcopy(query)
+            query2 = query.clone()
             query2.from_table = None
             query2.using = None
             query2.cte = None
@@ -120,7 +121,7 @@ class PlanJoinTablesQuery:
 
     def resolve_table(self, table):
         # gets integration for table and name to access to it
-        table = copy.deepcopy(table)
+        table = table.clone()
         # get possible table aliases
         aliases = []
         if table.alias is not None:
@@ -146,7 +147,7 @@ class PlanJoinTablesQuery:
 
         sub_select = getattr(table, 'sub_select', None)
 
-        return TableInfo(integration, table, aliases, conditions=[], sub_select=sub_select)
+        return TableInfo(integration, table, aliases, conditions=[], orig_conditions=[], sub_select=sub_select)
 
     def get_table_for_column(self, column: Identifier):
         if not isinstance(column, Identifier):
@@ -215,7 +216,7 @@ class PlanJoinTablesQuery:
 
         # checked, find table and store condition
 
-        node2 = copy.deepcopy(node)
+        node2 = node.clone()
 
         arg1 = node2.args[col_idx]
 
@@ -229,8 +230,8 @@ class PlanJoinTablesQuery:
         # keep only column name
         arg1.parts = [arg1.parts[-1]]
 
-        node2._orig_node = node
         table_info.conditions.append(node2)
+        table_info.orig_conditions.append(node)
 
     def check_query_conditions(self, query):
         # get conditions for tables
@@ -274,7 +275,7 @@ class PlanJoinTablesQuery:
         query_in.targets = query_traversal(query_in.targets, find_selects)
         query_traversal(query_in.where, find_selects)
 
-        query = copy.deepcopy(query_in)
+        query = query_in.clone()
 
         # replace sub selects, with identifiers with links to original selects
         def replace_subselects(node, **args):
@@ -307,7 +308,7 @@ class PlanJoinTablesQuery:
                     col_parts.append(node.parts[-1])
                     node.parts = col_parts
 
-        query_traversal(query, _check_identifiers)
+        query_traversal(query, _check_identifiers, node_types=Identifier)
 
         self.check_query_conditions(query)
 
@@ -336,7 +337,7 @@ class PlanJoinTablesQuery:
                 step_right = self.step_stack.pop()
                 step_left = self.step_stack.pop()
 
-                new_join = copy.deepcopy(item)
+                new_join = item.clone()
 
                 # TODO
                 new_join.left = Identifier('tab1')
@@ -376,7 +377,7 @@ class PlanJoinTablesQuery:
         self.step_stack.append(step2)
 
     def process_table(self, item, query_in):
-        table = copy.deepcopy(item.table)
+        table = item.table.clone()
         table.parts.insert(0, item.integration)
         query2 = Select(from_table=table, targets=[Star()])
         # parts = tuple(map(str.lower, table_name.parts))
@@ -397,7 +398,7 @@ class PlanJoinTablesQuery:
                     if table_info is None or table_info.table != item.table:
                         order_by = False
                         break
-                    col = copy.deepcopy(col)
+                    col = col.clone()
                     col.field.parts = [col.field.parts[-1]]
                     order_by.append(col)
 
@@ -428,7 +429,8 @@ class PlanJoinTablesQuery:
         columns_map = {}
 
         def _check_conditions(node, **kwargs):
-            if not isinstance(node, BinaryOperation):
+            if not isinstance(node, BinaryOperation) or len(node.args) != 2:
+                # and/or chain
                 return
 
             arg1, arg2 = node.args
@@ -549,7 +551,7 @@ class PlanJoinTablesQuery:
                         row_dict[el.args[0].parts[-1]] = el.args[1].value
 
                     # exclude condition
-                    el._orig_node.args = [Constant(0), Constant(0)]
+                    item.orig_conditions[i].args = [Constant(0), Constant(0)]
 
         # params for model
         model_params = None
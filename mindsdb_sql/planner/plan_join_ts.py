@@ -1,5 +1,3 @@
-import copy
-
 from mindsdb_sql import Latest, OrderBy, NullConstant
 from mindsdb_sql.exceptions import PlanningException
 from mindsdb_sql.parser.ast import (Select, Identifier, BetweenOperation, Join, Star, BinaryOperation, Constant)
@@ -196,7 +194,7 @@ class PlanJoinTSPredictorQuery:
         if len(predictor_group_by_names) > 0:
             allowed_columns += [i.lower() for i in predictor_group_by_names]
 
-        no_time_filter_query = copy.deepcopy(query)
+        no_time_filter_query = query.clone()
 
         preparation_where = no_time_filter_query.where
 
@@ -223,7 +221,7 @@ class PlanJoinTSPredictorQuery:
                 condition = order_field_not_null
             return condition
 
-        preparation_where2 = copy.deepcopy(preparation_where)
+        preparation_where2 = None if preparation_where is None else preparation_where.clone()
         preparation_where = add_order_not_null(preparation_where)
 
         # Obtain integration selects
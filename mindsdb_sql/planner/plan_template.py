@@ -0,0 +1,82 @@
+import pickle
+
+from mindsdb_sql.parser import ast
+from mindsdb_sql.planner import utils
+from mindsdb_sql.planner.steps import PlanStep
+
+
+class TemplateValue:
+    """Reference to a value of parameter inside of the plan of template"""
+    def __init__(self, index):
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, TemplateValue) and self.index == other.index
+
+    def __hash__(self):
+        return hash(('TemplateValue', self.index))
+
+    def __repr__(self):
+        return f'TemplateValue({self.index})'
+
+    def __str__(self):
+        return f'?{self.index}'
+
+
+def number_params(query, values=None):
+    """
+    Parameters of the query are numbered in order of utils.get_query_params:
+      planner can move or copy them between steps, the number is used to bind value later
+    :param query: AST, it is not changed
+    :param values: if set, parameters with AST-node as value are not numbered and stay in the template
+    :return: copy of the query
+    """
+    template = query.clone()
+    counter = iter(range(len(utils.get_query_params(template))))
+
+    def replace_params(node, **kwargs):
+        if isinstance(node, ast.Parameter):
+            index = next(counter)
+            if values is not None and isinstance(values[index], ast.ASTNode):
+                return node
+            return ast.Parameter(TemplateValue(index), alias=node.alias)
+
+    return utils.query_traversal(template, replace_params, node_types=ast.Parameter) or template
+
+
+def bind_values(obj, values):
+    # replaces template values in plan (or its part) with values, steps are changed in place
+
+    def replace_params(node, **kwargs):
+        if isinstance(node, ast.Parameter) and isinstance(node.value, TemplateValue):
+            value = values[node.value.index]
+            if isinstance(value, ast.ASTNode):
+                return value.clone()
+            return ast.Constant(value, alias=node.alias)
+
+    if isinstance(obj, TemplateValue):
+        return values[obj.index]
+    elif isinstance(obj, ast.ASTNode):
+        return utils.query_traversal(obj, replace_params, node_types=ast.Parameter) or obj
+    elif isinstance(obj, PlanStep):
+        for name, value in vars(obj).items():
+            setattr(obj, name, bind_values(value, values))
+    elif isinstance(obj, list):
+        return [bind_values(item, values) for item in obj]
+    elif isinstance(obj, tuple):
+        return tuple(bind_values(item, values) for item in obj)
+    elif isinstance(obj, dict):
+        return {key: bind_values(value, values) for key, value in obj.items()}
+    return obj
+
+
+def dump_plan(plan):
+    # stored plan is pickled: loading is much faster than deepcopy
+    return pickle.dumps(plan, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def bind_plan(plan_data, values):
+    plan = pickle.loads(plan_data)
+    for step in plan.steps:
+        bind_values(step, values)
+    return plan
@@ -1,5 +1,3 @@
-import copy
-
 from mindsdb_sql.exceptions import PlanningException
 from mindsdb_sql.parser import ast
 from mindsdb_sql.parser.ast import (Select, Identifier, Join, Star, BinaryOperation, Constant, Union, CreateTable,
@@ -10,12 +8,15 @@ from mindsdb_sql.planner.query_plan import QueryPlan
 from mindsdb_sql.planner.steps import (FetchDataframeStep, ProjectStep, ApplyPredictorStep,
                                        ApplyPredictorRowStep, UnionStep, GetPredictorColumns, SaveToTable,
                                        InsertToTable, UpdateToTable, SubSelectStep,
-                                       DeleteStep, DataStep, CreateTableStep)
+                                       DeleteStep, DataStep, CreateTableStep, GetTableColumns,
+                                       MapReduceStep, MultipleSteps)
 from mindsdb_sql.planner.utils import (disambiguate_predictor_column_identifier,
                                        get_deepest_select,
                                        recursively_extract_column_values,
                                        query_traversal, filters_to_bin_op)
 from mindsdb_sql.planner.plan_join import PlanJoin
+from mindsdb_sql.planner.normalize import normalize_query
+from mindsdb_sql.planner.simplify import simplify_query, is_empty_select
 from mindsdb_sql.planner.query_prepare import PreparedStatementPlanner
 
 
@@ -166,7 +167,7 @@ class QueryPlanner:
                 select.from_table = None
                 return SubSelectStep(select, self.cte_results[table_name], table_name=table_name)
 
-        fetch_df_select = copy.deepcopy(select)
+        fetch_df_select = select.clone()
         self.prepare_integration_select(integration_name, fetch_df_select)
 
         # remove predictor params
@@ -178,8 +179,25 @@ class QueryPlanner:
     def plan_integration_select(self, select):
         """Plan for a select query that can be fully executed in an integration"""
 
+        if self.is_empty_table_select(select):
+            return self.plan_empty_select(select)
+
         return self.plan.add_step(self.get_integration_select_step(select))
 
+    def is_empty_table_select(self, select):
+        if not is_empty_select(select):
+            return False
+        integration_name, table = self.resolve_database_table(select.from_table)
+        # cte is not a table of integration
+        return not (integration_name == self.default_namespace and table.parts[-1] in self.cte_results)
+
+    def plan_empty_select(self, select):
+        # the result is empty: only columns of the table are needed, integration isn't queried
+        integration_name, table = self.resolve_database_table(select.from_table)
+        # table is a name as in steps of prepared statement
+        last_step = self.plan.add_step(GetTableColumns(namespace=integration_name, table='.'.join(table.parts)))
+        return self.plan_sub_select(select, last_step)
+
     def resolve_database_table(self, node: Identifier):
         # resolves integration name and table name
 
@@ -320,7 +338,8 @@ class QueryPlanner:
 
         skipped_conditions = []
         def replace_functions(node, **kwargs):
-            if not isinstance(node, BinaryOperation):
+            if not isinstance(node, BinaryOperation) or len(node.args) != 2:
+                # and/or chain
                 return
 
             arg1, arg2 = node.args
@@ -399,7 +418,7 @@ class QueryPlanner:
         return self.plan_mdb_nested_select(select)
 
     def plan_integration_nested_select(self, select, integration_name):
-        fetch_df_select = copy.deepcopy(select)
+        fetch_df_select = select.clone()
         deepest_select = get_deepest_select(fetch_df_select)
         self.prepare_integration_select(integration_name, deepest_select)
         return self.plan.add_step(FetchDataframeStep(integration=integration_name, query=fetch_df_select))
@@ -415,7 +434,7 @@ class QueryPlanner:
         # if subselect_alias is not None:
         #     subselect_alias = subselect_alias.parts[0]
 
-        select2 = copy.deepcopy(select.from_table)
+        select2 = select.from_table.clone()
         select2.parentheses = False
         select2.alias = None
         self.plan_select(select2)
@@ -424,7 +443,7 @@ class QueryPlanner:
         return self.plan_sub_select(select, last_step)
 
     def get_predictor_namespace_and_name_from_identifier(self, identifier):
-        new_identifier = copy.deepcopy(identifier)
+        new_identifier = identifier.clone()
 
         info = self.get_predictor(identifier)
         namespace = info['integration_name']
@@ -483,7 +502,7 @@ class QueryPlanner:
         return project_step
 
     def plan_predictor(self, query, table, predictor_namespace, predictor):
-        int_select = copy.deepcopy(query)
+        int_select = query.clone()
         int_select.targets = [Star()]  # TODO why not query.targets?
         int_select.from_table = table
 
@@ -510,6 +529,11 @@ class QueryPlanner:
                 if op in ['and', 'or']:
                     return
 
+                if len(node.args) != 2:
+                    # chain of operations
+                    table_filters.append(node)
+                    return
+
                 arg1, arg2 = node.args
                 if not isinstance(arg1, Identifier):
                     arg1, arg2 = arg2, arg1
@@ -656,7 +680,7 @@ class QueryPlanner:
             last_step = self.plan_select(query.from_select, integration=integration_name)
 
         # plan sub-select first
-        update_command = copy.deepcopy(query)
+        update_command = query.clone()
         # clear subselect
         update_command.from_select = None
 
@@ -709,6 +733,9 @@ class QueryPlanner:
             # if is sql database
             if self.integrations.get(int_name, {}).get('class_type') != 'api':
 
+                if self.is_empty_table_select(query):
+                    return self.plan_empty_select(query)
+
                 # send to this integration
                 self.prepare_integration_select(int_name, query)
 
@@ -765,7 +792,7 @@ class QueryPlanner:
             else:
                 table_name = None
 
-            query2 = copy.deepcopy(query)
+            query2 = query.clone()
             query2.from_table = None
             sup_select = SubSelectStep(query2, prev_step.result, table_name=table_name, add_absent_cols=add_absent_cols)
             self.plan.add_step(sup_select)
@@ -790,10 +817,11 @@ class QueryPlanner:
         if query is None:
             query = self.query
 
+        query = normalize_query(query)
+
         if isinstance(query, (Select, Union, Except, Intersect)):
-            if self.check_single_integration(query):
-                return self.plan
-            self.plan_select(query)
+            if not self.check_single_integration(query):
+                self.plan_select(query)
         elif isinstance(query, CreateTable):
             self.plan_create_table(query)
         elif isinstance(query, Insert):
@@ -805,8 +833,20 @@ class QueryPlanner:
         else:
             raise PlanningException(f'Unsupported query type {type(query)}')
 
+        # remove conditions which were replaced with placeholders during planning
+        self.simplify_steps(self.plan.steps)
+
         return self.plan
 
+    def simplify_steps(self, steps):
+        for step in steps:
+            if isinstance(step, MapReduceStep):
+                self.simplify_steps([step.step])
+            elif isinstance(step, MultipleSteps):
+                self.simplify_steps(step.steps)
+            elif isinstance(getattr(step, 'query', None), ast.ASTNode):
+                simplify_query(step.query)
+
     def prepare_steps(self, query):
         statement_planner = PreparedStatementPlanner(self)
 
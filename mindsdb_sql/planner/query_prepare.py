@@ -1,8 +1,9 @@
-import copy
 from mindsdb_sql.parser import ast
 from mindsdb_sql.exceptions import PlanningException
 from mindsdb_sql.planner import steps
 from mindsdb_sql.planner import utils
+from mindsdb_sql.planner.plan_template import number_params, dump_plan, bind_plan
+from mindsdb_sql.planner.simplify import has_foldable_params
 
 
 def to_string(identifier):
@@ -52,7 +53,8 @@ class Column:
 class Statement:
     def __init__(self):
         self.columns = []
-        # self.query = None
+        # prepared query, it is kept unchanged for repeated executions
+        self.query = None
         self.params = None
         self.result = None
 
@@ -64,6 +66,12 @@ class Statement:
 
         self.offset = 0
 
+        # pickled plan with parameters, None if the plan can't be reused
+        self.plan_data = None
+        # plan was checked on the first execution
+        self.plan_verified = False
+        self.executions = 0
+
 
 
 class PreparedStatementPlanner():
@@ -183,7 +191,7 @@ class PreparedStatementPlanner():
                 if self.planner.is_predictor(node):
                     query_predictors.append(node)
 
-        utils.query_traversal(query, find_predictors)
+        utils.query_traversal(query, find_predictors, node_types=ast.Identifier)
 
         # only 1 predictor is allowed
         # if len(query_predictors) > 1:
@@ -460,12 +468,15 @@ class PreparedStatementPlanner():
 
         self.planner.query = query
 
-        query = copy.deepcopy(query)
+        query = query.clone()
+        stmt.query = query.clone()
 
         params = utils.get_query_params(query)
 
         stmt.params = params
 
+        stmt.plan_data = self.plan_template(query)
+
         # get columns
         if isinstance(query, ast.Select):
             # prepare select
@@ -489,11 +500,28 @@ class PreparedStatementPlanner():
             return []
             # raise NotImplementedError(query.__name__)
 
+    def is_planned(self, query):
+        return isinstance(query, (ast.Select, ast.Union, ast.CreateTable, ast.Insert, ast.Update, ast.Delete))
+
+    def plan_template(self, query):
+        # the plan where parameters are kept as numbered slots. it is planned once and values are bound on execution
+        if not self.is_planned(query):
+            return None
+        if has_foldable_params(query):
+            # simplified plan depends on values
+            return None
+        try:
+            self.planner.from_query(number_params(query))
+            return dump_plan(self.planner.plan)
+        except Exception:
+            # planner can fail on parameters instead of values
+            return None
+
     def execute_steps(self, params=None):
         # find all parameters
         stmt = self.planner.statement
 
-        # is already executed
+        # is not prepared
         if stmt is None:
             if params is not None:
                 raise PlanningException("Can't execute statement")
@@ -508,28 +536,39 @@ class PreparedStatementPlanner():
             if len(params) != len(stmt.params):
                 raise PlanningException("Count of execution parameters don't match prepared statement")
 
+            if stmt.plan_data is not None and stmt.plan_verified:
+                return self.bind_plan(stmt.plan_data, params)
+
+            if stmt.executions > 0:
+                # query was filled by previous execution
+                query = stmt.query.clone()
+            stmt.executions += 1
+
             query = utils.fill_query_params(query, params)
 
             self.planner.query = query
 
-        # prevent from second execution
-        stmt.params = None
-
-        if (
-                isinstance(query, ast.Select)
-                or isinstance(query, ast.Union)
-                or isinstance(query, ast.CreateTable)
-                or isinstance(query, ast.Insert)
-                or isinstance(query, ast.Update)
-                or isinstance(query, ast.Delete)
-        ):
-            return self.plan_query(query)
+        if self.is_planned(query):
+            return self.plan_query(query, params)
         else:
             return []
 
-    def plan_query(self, query):
+    def bind_plan(self, plan_data, params):
+        self.planner.plan = bind_plan(plan_data, params)
+        yield from self.planner.plan.steps
+
+    def plan_query(self, query, params=None):
         # use v1 planner
         self.planner.from_query(query)
+
+        stmt = self.planner.statement
+        if params is not None and stmt.plan_data is not None and not stmt.plan_verified:
+            # the plan with bound values has to be the same as planned from scratch
+            if bind_plan(stmt.plan_data, params).steps == self.planner.plan.steps:
+                stmt.plan_verified = True
+            else:
+                stmt.plan_data = None
+
         step = None
         for step in self.planner.plan.steps:
             # print(step)
@@ -0,0 +1,240 @@
+import operator
+
+from mindsdb_sql.parser import ast
+from mindsdb_sql.parser.utils import JoinType
+from mindsdb_sql.planner.fingerprint import is_literal
+from mindsdb_sql.planner.utils import query_traversal
+
+# only operations which give the same result in all databases are computed:
+#   integer arithmetic (without division) and comparison of numbers
+_arithmetic = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+}
+
+_comparison = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<>': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+# joins where condition can be omitted
+_inner_joins = (JoinType.JOIN, JoinType.INNER_JOIN, JoinType.CROSS_JOIN)
+
+
+def is_integer(node):
+    return is_literal(node) and type(node.value) is int
+
+
+def is_number(node):
+    return is_literal(node) and type(node.value) in (int, float)
+
+
+def get_bool(node):
+    # value of TRUE or FALSE constant, None for anything else
+    if is_literal(node) and type(node.value) is bool:
+        return node.value
+    return None
+
+
+def true_condition():
+    return ast.BinaryOperation(op='=', args=[ast.Constant(1), ast.Constant(1)])
+
+
+def false_condition():
+    # it is also understood by planner as request for columns of predictor
+    return ast.BinaryOperation(op='=', args=[ast.Constant(1), ast.Constant(0)])
+
+
+def fold_constants(node):
+    """
+    Computes operations with constants: 2 * 3 -> 6, 1 = 1 -> TRUE
+    """
+    if not isinstance(node, (ast.BinaryOperation, ast.UnaryOperation)) or node.alias is not None:
+        return node
+
+    node.args = [fold_constants(arg) for arg in node.args]
+
+    if isinstance(node, ast.UnaryOperation):
+        if node.op == '-' and is_integer(node.args[0]):
+            return ast.Constant(-node.args[0].value)
+        return node
+
+    if len(node.args) != 2:
+        return node
+    arg1, arg2 = node.args
+
+    if node.op in _arithmetic and is_integer(arg1) and is_integer(arg2):
+        return ast.Constant(_arithmetic[node.op](arg1.value, arg2.value))
+
+    if node.op in _comparison and is_number(arg1) and is_number(arg2):
+        return ast.Constant(_comparison[node.op](arg1.value, arg2.value))
+
+    return node
+
+
+def _constant_expression(node):
+    # None if node can't be folded to constant, otherwise it says if the node has parameters
+    if isinstance(node, ast.Parameter):
+        return True
+    if is_number(node):
+        return False
+    if not isinstance(node, (ast.BinaryOperation, ast.UnaryOperation)) or node.alias is not None:
+        return None
+    if isinstance(node, ast.UnaryOperation):
+        if node.op != '-':
+            return None
+    elif node.op not in _arithmetic or len(node.args) != 2:
+        return None
+    has_params = False
+    for arg in node.args:
+        arg_params = _constant_expression(arg)
+        if arg_params is None:
+            return None
+        has_params = has_params or arg_params
+    return has_params
+
+
+def has_foldable_params(query):
+    """
+    Checks if simplification of the query can depend on values of parameters:
+      - parameter is an operand of AND, OR or NOT: x = 1 AND ?
+      - parameter is computed with numbers or other parameters: ? + 1, ? = ?
+    The plan of such query can't be reused with other values
+    """
+    found = []
+
+    def check(node, **kwargs):
+        if node.alias is not None:
+            return
+        if node.op in ('and', 'or', 'not'):
+            if any(isinstance(arg, ast.Parameter) for arg in node.args):
+                found.append(node)
+        elif node.op in _comparison and len(node.args) == 2:
+            args_params = [_constant_expression(arg) for arg in node.args]
+            if None not in args_params and any(args_params):
+                found.append(node)
+        elif _constant_expression(node):
+            found.append(node)
+
+    query_traversal(query, check, node_types=(ast.BinaryOperation, ast.UnaryOperation))
+    return len(found) > 0
+
+
+def simplify_condition(node):
+    """
+    Simplifies boolean expression:
+      - constants are folded
+      - TRUE and FALSE are removed from AND/OR: x AND TRUE -> x, x OR TRUE -> TRUE
+      - double negation is removed: NOT NOT x -> x
+    :return: simplified node, it is TRUE or FALSE constant if the result doesn't depend on data
+    """
+    if isinstance(node, ast.BinaryOperation) and node.op in ('and', 'or') and node.alias is None:
+        # TRUE for OR and FALSE for AND define the result
+        absorbing = node.op == 'or'
+
+        args = []
+        for arg in node.args:
+            arg = simplify_condition(arg)
+            value = get_bool(arg)
+            if value is None:
+                args.append(arg)
+            elif value is absorbing:
+                return ast.Constant(absorbing)
+
+        if len(args) == 0:
+            return ast.Constant(not absorbing)
+        if len(args) == 1:
+            return keep_parentheses(args[0], node)
+        if len(args) != len(node.args):
+            return ast.BinaryOperation(op=node.op, args=args, parentheses=node.parentheses)
+        node.args = args
+        return node
+
+    if isinstance(node, ast.UnaryOperation) and node.op == 'not' and node.alias is None:
+        arg = simplify_condition(node.args[0])
+        value = get_bool(arg)
+        if value is not None:
+            return ast.Constant(not value)
+        if isinstance(arg, ast.UnaryOperation) and arg.op == 'not' and arg.alias is None:
+            return keep_parentheses(arg.args[0], node)
+        node.args = [arg]
+        return node
+
+    return fold_constants(node)
+
+
+def keep_parentheses(node, replaced):
+    # node is moved to the place of the replaced node
+    if replaced.parentheses and isinstance(node, (ast.BinaryOperation, ast.UnaryOperation, ast.BetweenOperation)):
+        node.parentheses = True
+    return node
+
+
+def simplify_where(node):
+    # TRUE condition is removed, FALSE is replaced with 1 = 0
+    node = simplify_condition(node)
+    value = get_bool(node)
+    if value is True:
+        return None
+    if value is False:
+        return false_condition()
+    return node
+
+
+def simplify_query(query):
+    """
+    Simplifies conditions of all selects and joins in the query.
+    Query is changed in place, frozen query is copied
+    :return: the query
+    """
+    if query.is_frozen():
+        query = query.clone()
+
+    def _simplify(node, **kwargs):
+        if isinstance(node, ast.Select):
+            if node.where is not None:
+                node.where = simplify_where(node.where)
+            if node.having is not None:
+                node.having = simplify_where(node.having)
+
+        elif isinstance(node, ast.Join) and node.condition is not None:
+            condition = simplify_condition(node.condition)
+            value = get_bool(condition)
+            if value is True:
+                # outer join has to have a condition
+                condition = None if node.join_type in _inner_joins else true_condition()
+            elif value is False:
+                condition = false_condition()
+            node.condition = condition
+
+    query_traversal(query, _simplify, node_types=(ast.Select, ast.Join))
+    return query
+
+
+def is_empty_select(query):
+    """
+    Select from one table with the FALSE condition: the result doesn't depend on the data in the table
+    """
+    if (
+        not isinstance(query, ast.Select)
+        or not isinstance(query.from_table, ast.Identifier)
+        or query.cte is not None
+        or query.where != false_condition()
+    ):
+        return False
+
+    # subqueries have to be executed
+    selects = []
+
+    def find_selects(node, **kwargs):
+        if isinstance(node, ast.Select) and node is not query:
+            selects.append(node)
+
+    query_traversal(query, find_selects, node_types=ast.Select)
+    return len(selects) == 0
@@ -7,12 +7,15 @@ def find_time_filter(op, time_column_name):
     if not op:
         return
     if op.op == 'and':
-        left = find_time_filter(op.args[0], time_column_name)
-        right = find_time_filter(op.args[1], time_column_name)
-        if left and right:
-            raise PlanningException('Can provide only one filter by predictor order_by column, found two')
-
-        return left or right
+        found = None
+        for arg in op.args:
+            time_filter = find_time_filter(arg, time_column_name)
+            if time_filter:
+                if found:
+                    raise PlanningException('Can provide only one filter by predictor order_by column, found two')
+                found = time_filter
+
+        return found
     elif ((isinstance(op.args[0], Identifier) and op.args[0].parts[-1].lower() == time_column_name.lower()) or
           (isinstance(op.args[1], Identifier) and op.args[1].parts[-1].lower() == time_column_name.lower())):
         return op
@@ -22,8 +25,7 @@ def replace_time_filter(op, time_filter, new_filter):
     if op == time_filter:
         return new_filter
     if isinstance(op, BinaryOperation):
-        op.args[0] = replace_time_filter(op.args[0], time_filter, new_filter)
-        op.args[1] = replace_time_filter(op.args[1], time_filter, new_filter)
+        op.args = [replace_time_filter(arg, time_filter, new_filter) for arg in op.args]
     return op
 
 
@@ -35,16 +37,19 @@ def find_and_remove_time_filter(op, time_filter):
             # TODO maybe OR operation too?
 
             # next level
-            left_arg = find_and_remove_time_filter(op.args[0], time_filter)
-            right_arg = find_and_remove_time_filter(op.args[1], time_filter)
-
-            # if found in one arg return other
-            if left_arg is None:
-                return right_arg
-            if right_arg is None:
-                return left_arg
-
-            op.args = [left_arg, right_arg]
+            args = []
+            for arg in op.args:
+                arg = find_and_remove_time_filter(arg, time_filter)
+                if arg is not None:
+                    args.append(arg)
+
+            # if found in one arg return others
+            if not args:
+                return None
+            if len(args) == 1:
+                return args[0]
+
+            op.args = args
             return op
 
     return op
@@ -69,10 +74,9 @@ def validate_ts_where_condition(op, allowed_columns, allow_and=True):
             # remove alias
             arg.parts = [arg.parts[-1]]
 
-    if isinstance(op.args[0], Operation):
-        validate_ts_where_condition(op.args[0], allowed_columns, allow_and=True)
-    if isinstance(op.args[1], Operation):
-        validate_ts_where_condition(op.args[1], allowed_columns, allow_and=True)
+    for arg in op.args:
+        if isinstance(arg, Operation):
+            validate_ts_where_condition(arg, allowed_columns, allow_and=True)
 
 
 def recursively_check_join_identifiers_for_ambiguity(item, aliased_fields=None):
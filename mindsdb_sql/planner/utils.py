@@ -1,4 +1,3 @@
-import copy
 from typing import List
 
 from mindsdb_sql.exceptions import PlanningException
@@ -24,7 +23,7 @@ from mindsdb_sql.parser import ast
 
 
 def get_predictor_name_identifier(identifier):
-    new_identifier = copy.deepcopy(identifier)
+    new_identifier = identifier.clone()
     if len(new_identifier.parts) > 1:
         new_identifier.parts.pop(0)
     return new_identifier
@@ -69,8 +68,8 @@ def recursively_extract_column_values(op, row_dict, predictor):
             value = value.value
         row_dict[str(id)] = value
     elif isinstance(op, BinaryOperation) and op.op == 'and':
-        recursively_extract_column_values(op.args[0], row_dict, predictor)
-        recursively_extract_column_values(op.args[1], row_dict, predictor)
+        for arg in op.args:
+            recursively_extract_column_values(arg, row_dict, predictor)
     else:
         raise PlanningException(f'Only \'and\' and \'=\' operations allowed in WHERE clause, found: {op.to_tree()}')
 
@@ -81,221 +80,226 @@ def get_deepest_select(select):
     return get_deepest_select(select.from_table)
 
 
-def query_traversal(node, callback, is_table=False, is_target=False, parent_query=None):
+# kinds of children of nodes in query tree
+_NODE = 0  # node in attribute
+_LIST = 1  # list of nodes
+_TARGETS = 2  # list of nodes, a list returned by callback is put instead of the node
+_ROWS = 3  # list of lists of nodes
+_DICT = 4  # values of dict, the dict is changed in place
+_CTE = 5  # queries of common table expressions
+_VISIT = 6  # node in attribute which is traversed but not replaced
+
+# per class: (children take the node as parent_query, [(attribute, kind, is_table), ...])
+_CHILDREN = {
+    ast.Select: (True, (
+        ('from_table', _NODE, True),
+        ('targets', _TARGETS, False),
+        ('cte', _CTE, False),
+        ('where', _NODE, False),
+        ('group_by', _LIST, False),
+        ('having', _NODE, False),
+        ('order_by', _LIST, False),
+    )),
+    ast.Union: (True, (('left', _NODE, False), ('right', _NODE, False))),
+    ast.Intersect: (True, (('left', _NODE, False), ('right', _NODE, False))),
+    ast.Except: (True, (('left', _NODE, False), ('right', _NODE, False))),
+    ast.Join: (False, (('right', _NODE, True), ('left', _NODE, True), ('condition', _NODE, False))),
+    ast.Function: (False, (('args', _LIST, False),)),
+    ast.BinaryOperation: (False, (('args', _LIST, False),)),
+    ast.UnaryOperation: (False, (('args', _LIST, False),)),
+    ast.BetweenOperation: (False, (('args', _LIST, False),)),
+    ast.Exists: (False, (('args', _LIST, False),)),
+    ast.NotExists: (False, (('args', _LIST, False),)),
+    ast.WindowFunction: (False, (
+        ('function', _VISIT, False),
+        ('partition', _LIST, False),
+        ('order_by', _LIST, False),
+    )),
+    ast.TypeCast: (False, (('arg', _NODE, False),)),
+    ast.Tuple: (False, (('items', _LIST, False),)),
+    ast.Insert: (True, (('table', _NODE, True), ('values', _ROWS, False), ('from_select', _NODE, False))),
+    ast.Update: (True, (
+        ('table', _NODE, True),
+        ('where', _NODE, False),
+        ('update_columns', _DICT, False),
+        ('from_select', _NODE, False),
+    )),
+    ast.CreateTable: (True, (('columns', _LIST, False), ('name', _NODE, True), ('from_select', _NODE, False))),
+    ast.Delete: (True, (('where', _NODE, False),)),
+    ast.OrderBy: (False, (('field', _NODE, False),)),
+    ast.Case: (False, (('rules', _ROWS, False), ('default', _NODE, False))),
+}
+
+# resolved for subclasses (dialects, frozen nodes) on the first use
+_children_cache = dict(_CHILDREN)
+
+# markers of stack entries: attribute of node to traverse, targets to flatten after traversal of them
+_FIELD = object()
+_FLATTEN = object()
+
+
+def _get_children(cls):
+    children = None
+    for base in cls.__mro__:
+        if base in _CHILDREN:
+            children = _CHILDREN[base]
+            break
+    _children_cache[cls] = children
+    return children
+
+
+def _replace_item(slot, index, value):
+    # slot of list in the tree is [items, owner, key, copied]:
+    #   the list is copied and put to the owner on the first replacement of its item
+    if not slot[3]:
+        items = slot[0] = list(slot[0])
+        slot[3] = True
+        owner = slot[1]
+        if type(owner) is list and owner[3]:
+            # nested list (rows of insert, rules of case): the outer list is already copied
+            owner[0][slot[2]] = items
+        else:
+            _assign(owner, slot[2], items)
+    slot[0][index] = value
+
+
+def _assign(owner, key, value):
+    if type(owner) is list:
+        _replace_item(owner, key, value)
+    elif isinstance(owner, dict):
+        owner[key] = value
+    elif owner is not None:
+        setattr(owner, key, value)
+
+
+def _push_items(stack, slot, is_target, parent_query):
+    # first item is on the top of the stack
+    items = slot[0]
+    for i in range(len(items) - 1, -1, -1):
+        stack.append((items[i], slot, i, False, is_target, parent_query))
+
+
+def _push_fields(stack, node, parent_query):
+    children = _children_cache[type(node)] if type(node) in _children_cache else _get_children(type(node))
+    if children is None:
+        return
+    is_query, fields = children
+    if is_query:
+        parent_query = node
+    for i in range(len(fields) - 1, -1, -1):
+        stack.append((node, _FIELD, fields[i], False, False, parent_query))
+
+
+def _flatten_targets(slot):
+    # callback can replace target with list of targets
+    if not slot[3] or not any(isinstance(item, list) for item in slot[0]):
+        return
+    targets = []
+    for item in slot[0]:
+        if isinstance(item, list):
+            targets.extend(item)
+        else:
+            targets.append(item)
+    _assign(slot[1], slot[2], targets)
+
+
+def query_traversal(node, callback, is_table=False, is_target=False, parent_query=None, node_types=None):
     '''
     :param node: element
     :param callback: function applied to every element
     :param is_table: it is table in query
     :param is_target: it is the target in select
     :param parent_query: current query (select/update/create/...) where we are now
+    :param node_types: class or tuple of classes, callback is applied only to elements of these types
     :return:
        new element if it is needed to be replaced
        or None to keep element and traverse over it
     '''
-    # traversal query tree to find and replace nodes
-
-    res = callback(node, is_table=is_table, is_target=is_target, parent_query=parent_query)
-    if res is not None:
-        # node is going to be replaced
-        return res
-
-    if isinstance(node, ast.Select):
-        if node.from_table is not None:
-            node_out = query_traversal(node.from_table, callback, is_table=True, parent_query=node)
-            if node_out is not None:
-                node.from_table = node_out
-
-        array = []
-        for node2 in node.targets:
-            node_out = query_traversal(node2, callback, parent_query=node, is_target=True) or node2
-            if isinstance(node_out, list):
-                array.extend(node_out)
-            else:
-                array.append(node_out)
-        node.targets = array
-
-        if node.cte is not None:
-            array = []
-            for cte in node.cte:
-                node_out = query_traversal(cte.query, callback, parent_query=node) or cte
-                array.append(node_out)
-            node.cte = array
-
-        if node.where is not None:
-            node_out = query_traversal(node.where, callback, parent_query=node)
-            if node_out is not None:
-                node.where = node_out
-
-        if node.group_by is not None:
-            array = []
-            for node2 in node.group_by:
-                node_out = query_traversal(node2, callback, parent_query=node) or node2
-                array.append(node_out)
-            node.group_by = array
-
-        if node.having is not None:
-            node_out = query_traversal(node.having, callback, parent_query=node)
-            if node_out is not None:
-                node.having = node_out
-
-        if node.order_by is not None:
-            array = []
-            for node2 in node.order_by:
-                node_out = query_traversal(node2, callback, parent_query=node) or node2
-                array.append(node_out)
-            node.order_by = array
-
-    elif isinstance(node, (ast.Union, ast.Intersect, ast.Except)):
-        node_out = query_traversal(node.left, callback, parent_query=node)
-        if node_out is not None:
-            node.left = node_out
-        node_out = query_traversal(node.right, callback, parent_query=node)
-        if node_out is not None:
-            node.right = node_out
-
-    elif isinstance(node, ast.Join):
-        node_out = query_traversal(node.right, callback, is_table=True, parent_query=parent_query)
-        if node_out is not None:
-            node.right = node_out
-        node_out = query_traversal(node.left, callback, is_table=True, parent_query=parent_query)
-        if node_out is not None:
-            node.left = node_out
-        if node.condition is not None:
-            node_out = query_traversal(node.condition, callback, parent_query=parent_query)
-            if node_out is not None:
-                node.condition = node_out
-
-    elif isinstance(node, (ast.Function, ast.BinaryOperation, ast.UnaryOperation, ast.BetweenOperation,
-                           ast.Exists, ast.NotExists)):
-        array = []
-        for arg in node.args:
-            node_out = query_traversal(arg, callback, parent_query=parent_query) or arg
-            array.append(node_out)
-        node.args = array
-
-    elif isinstance(node, ast.WindowFunction):
-        query_traversal(node.function, callback, parent_query=parent_query)
-        if node.partition is not None:
-            array = []
-            for node2 in node.partition:
-                node_out = query_traversal(node2, callback, parent_query=parent_query) or node2
-                array.append(node_out)
-            node.partition = array
-        if node.order_by is not None:
-            array = []
-            for node2 in node.order_by:
-                node_out = query_traversal(node2, callback, parent_query=parent_query) or node2
-                array.append(node_out)
-            node.order_by = array
-
-    elif isinstance(node, ast.TypeCast):
-        node_out = query_traversal(node.arg, callback, parent_query=parent_query)
-        if node_out is not None:
-            node.arg = node_out
-
-    elif isinstance(node, ast.Tuple):
-        array = []
-        for node2 in node.items:
-            node_out = query_traversal(node2, callback, parent_query=parent_query) or node2
-            array.append(node_out)
-        node.items = array
-
-    elif isinstance(node, ast.Insert):
-        if node.table is not None:
-            node_out = query_traversal(node.table, callback, is_table=True, parent_query=node)
-            if node_out is not None:
-                node.table = node_out
-
-        if node.values is not None:
-            rows = []
-            for row in node.values:
-                items = []
-                for item in row:
-                    item2 = query_traversal(item, callback, parent_query=node) or item
-                    items.append(item2)
-                rows.append(items)
-            node.values = rows
-
-        if node.from_select is not None:
-            node_out = query_traversal(node.from_select, callback, parent_query=node)
-            if node_out is not None:
-                node.from_select = node_out
-
-    elif isinstance(node, ast.Update):
-        if node.table is not None:
-            node_out = query_traversal(node.table, callback, is_table=True, parent_query=node)
-            if node_out is not None:
-                node.table = node_out
-
-        if node.where is not None:
-            node_out = query_traversal(node.where, callback, parent_query=node)
-            if node_out is not None:
-                node.where = node_out
-
-        if node.update_columns is not None:
-            changes = {}
-            for k, v in node.update_columns.items():
-                v2 = query_traversal(v, callback, parent_query=node)
-                if v2 is not None:
-                    changes[k] = v2
-            if changes:
-                node.update_columns.update(changes)
-
-        if node.from_select is not None:
-            node_out = query_traversal(node.from_select, callback, parent_query=node)
-            if node_out is not None:
-                node.from_select = node_out
-
-    elif isinstance(node, ast.CreateTable):
-        array = []
-        if node.columns is not None:
-            for node2 in node.columns:
-                node_out = query_traversal(node2, callback, parent_query=node) or node2
-                array.append(node_out)
-            node.columns = array
-
-        if node.name is not None:
-            node_out = query_traversal(node.name, callback, is_table=True, parent_query=node)
-            if node_out is not None:
-                node.name = node_out
-
-        if node.from_select is not None:
-            node_out = query_traversal(node.from_select, callback, parent_query=node)
-            if node_out is not None:
-                node.from_select = node_out
-
-    elif isinstance(node, ast.Delete):
-        if node.where is not None:
-            node_out = query_traversal(node.where, callback, parent_query=node)
-            if node_out is not None:
-                node.where = node_out
-
-    elif isinstance(node, ast.OrderBy):
-        if node.field is not None:
-            node_out = query_traversal(node.field, callback, parent_query=parent_query)
-            if node_out is not None:
-                node.field = node_out
-
-    elif isinstance(node, ast.Case):
-        rules = []
-        for condition, result in node.rules:
-            condition2 = query_traversal(condition, callback, parent_query=parent_query)
-            result2 = query_traversal(result, callback, parent_query=parent_query)
-
-            condition = condition if condition2 is None else condition2
-            result = result if result2 is None else result2
-            rules.append([condition, result])
-        node.rules = rules
-        default = query_traversal(node.default, callback, parent_query=parent_query)
-        if default is not None:
-            node.default = default
-
-    elif isinstance(node, list):
-        array = []
-        for node2 in node:
-            node_out = query_traversal(node2, callback, parent_query=parent_query) or node2
-            array.append(node_out)
-        return array
+    # traversal query tree to find and replace nodes: pre-order, with explicit stack.
+    # lists of nodes are copied only if their items are replaced
+
+    if node_types is None or isinstance(node, node_types):
+        res = callback(node, is_table=is_table, is_target=is_target, parent_query=parent_query)
+        if res is not None:
+            # node is going to be replaced
+            return res
+
+    stack = []
+    root_slot = None
+    if isinstance(node, list):
+        root_slot = [node, None, None, False]
+        _push_items(stack, root_slot, False, parent_query)
+    else:
+        _push_fields(stack, node, parent_query)
+
+    children_cache = _children_cache
+    while stack:
+        node, owner, key, is_table, is_target, parent_query = stack.pop()
+
+        if owner is _FIELD:
+            # attribute is read when traversal reaches it: callbacks can change next attributes of the node
+            name, kind, is_table = key
+            value = getattr(node, name, None)
+            if value is None:
+                continue
+            if kind == _LIST:
+                # inlined _push_items
+                slot = [value, node, name, False]
+                for i in range(len(value) - 1, -1, -1):
+                    stack.append((value[i], slot, i, False, False, parent_query))
+            elif kind == _NODE:
+                stack.append((value, node, name, is_table, False, parent_query))
+            elif kind == _TARGETS:
+                slot = [value, node, name, False]
+                stack.append((slot, _FLATTEN, None, False, False, None))
+                _push_items(stack, slot, True, parent_query)
+            elif kind == _ROWS:
+                slot = [value, node, name, False]
+                for i in range(len(value) - 1, -1, -1):
+                    _push_items(stack, [value[i], slot, i, False], False, parent_query)
+            elif kind == _DICT:
+                for column, item in reversed(list(value.items())):
+                    stack.append((item, value, column, False, False, parent_query))
+            elif kind == _CTE:
+                for cte in reversed(value):
+                    stack.append((cte.query, cte, 'query', False, False, parent_query))
+            elif kind == _VISIT:
+                stack.append((value, None, None, False, False, parent_query))
+            continue
+
+        if owner is _FLATTEN:
+            _flatten_targets(node)
+            continue
+
+        if node_types is None or isinstance(node, node_types):
+            res = callback(node, is_table=is_table, is_target=is_target, parent_query=parent_query)
+            if res is not None:
+                if type(owner) is list:
+                    # falsy result keeps the item of list
+                    if res:
+                        if owner[3]:
+                            # the list is already copied
+                            owner[0][key] = res
+                        else:
+                            _replace_item(owner, key, res)
+                else:
+                    _assign(owner, key, res)
+                continue
+
+        try:
+            children = children_cache[type(node)]
+        except KeyError:
+            children = _get_children(type(node))
+        if children is not None:
+            # inlined _push_fields
+            is_query, fields = children
+            if is_query:
+                parent_query = node
+            for i in range(len(fields) - 1, -1, -1):
+                stack.append((node, _FIELD, fields[i], False, False, parent_query))
+
+    if root_slot is not None:
+        return root_slot[0]
 
     # keep original node
     return None
@@ -338,24 +342,69 @@ def get_query_params(query):
             params.append(node)
             return node
 
-    query_traversal(query, params_find)
+    query_traversal(query, params_find, node_types=ast.Parameter)
     return params
 
 def fill_query_params(query, params):
+    # query is changed in place, frozen query is copied
+
+    if query.is_frozen():
+        query = query.clone()
 
-    params = copy.deepcopy(params)
+    params_iter = iter(params)
 
     def params_replace(node, **kwargs):
         if isinstance(node, ast.Parameter):
-            value = params.pop(0)
-            return ast.Constant(value)
+            try:
+                value = next(params_iter)
+            except StopIteration:
+                raise PlanningException('Not enough values for parameters of query')
+            if isinstance(value, ast.ASTNode):
+                # node is passed as is
+                return value.clone()
+            return ast.Constant(value, alias=node.alias)
 
     # put parameters into query
-    query_traversal(query, params_replace)
+    query_traversal(query, params_replace, node_types=ast.Parameter)
 
     return query
 
 
+class ParamsBinder:
+    """
+    Binds values of parameters by index, without traversal and copying of the query on every binding:
+      parameters are found once and replaced with constants, binding changes values of these constants.
+
+    The query returned by bind is the same object for all bindings: it is valid until the next binding
+      and has to be copied to be kept or changed.
+    """
+
+    def __init__(self, query):
+        self.slots = []
+
+        def replace_params(node, **kwargs):
+            if isinstance(node, ast.Parameter):
+                slot = ast.Constant(None, alias=node.alias)
+                self.slots.append(slot)
+                return slot
+
+        query = query.clone()
+        self.query = query_traversal(query, replace_params, node_types=ast.Parameter) or query
+
+    def bind(self, params):
+        if len(params) != len(self.slots):
+            raise PlanningException("Count of execution parameters don't match prepared statement")
+
+        for slot, value in zip(self.slots, params):
+            slot.value = value
+        return self.query
+
+    def bind_many(self, params_list):
+        # the batch of rows of parameters
+        for params in params_list:
+            yield self.bind(params)
+
+
 def filters_to_bin_op(filters: List[BinaryOperation]):
     # make a new where clause without params
     where = None
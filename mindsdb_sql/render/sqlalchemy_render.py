@@ -175,8 +175,9 @@ class SqlalchemyRender:
                 "or": sa.or_,
             }
 
-            arg0 = self.to_expression(t.args[0])
-            arg1 = self.to_expression(t.args[1])
+            # chains of 'and', 'or', '||' can have more than two arguments
+            args = [self.to_expression(arg) for arg in t.args]
+            arg0, arg1 = args[0], args[1]
 
             op = t.op.lower()
             if op in ('in', 'not in'):
@@ -185,12 +186,12 @@ class SqlalchemyRender:
 
             method = methods.get(op)
             if method is not None:
-                sa_op = getattr(arg0, method)
-
-                col = sa_op(arg1)
+                col = arg0
+                for arg in args[1:]:
+                    col = getattr(col, method)(arg)
             elif t.op.lower() in functions:
                 func = functions[t.op.lower()]
-                col = func(arg0, arg1)
+                col = func(*args)
             else:
                 col = arg0.op(t.op)(arg1)
 
@@ -180,6 +180,92 @@ class LexerMeta(type):
         cls._build()
         return cls
 
+# Pattern of a keyword rule which can be found by lookup: a word between word boundaries, like r'\bSELECT\b'
+_keyword_pattern = re.compile(r'\\b(\w+)\\b')
+_word_char = re.compile(r'\w')
+_word = re.compile(r'\w+')
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre_constants
+except ImportError:
+    import sre_parse as _sre_parse, sre_constants as _sre_constants
+
+_ASCII = frozenset(range(128))
+_CATEGORY_CHARS = {
+    _sre_constants.CATEGORY_DIGIT: frozenset(range(ord('0'), ord('9') + 1)),
+    _sre_constants.CATEGORY_SPACE: frozenset(map(ord, ' \t\n\r\f\v')),
+    _sre_constants.CATEGORY_WORD: frozenset(
+        c for c in range(128) if chr(c).isalnum() or c == ord('_')
+    ),
+}
+
+def _first_chars(pattern, flags):
+    '''
+    Returns the set of ASCII codes which can be the first character of a match of the pattern.
+    It can be a superset: unknown constructions allow any character
+    '''
+    def with_case(codes):
+        if not flags & re.IGNORECASE:
+            return set(codes)
+        result = set()
+        for code in codes:
+            if code > 127:
+                # non-ASCII letter can match ASCII letter ignoring case
+                return set(_ASCII)
+            result.update((ord(chr(code).lower()), ord(chr(code).upper())))
+        return result
+
+    def item_first(op, av):
+        # returns (codes, can be empty)
+        c = _sre_constants
+        if op is c.LITERAL:
+            return with_case([av]), False
+        if op is c.NOT_LITERAL:
+            return _ASCII - with_case([av]), False
+        if op is c.AT:
+            return set(), True
+        if op is c.IN:
+            codes = set()
+            for in_op, in_av in av:
+                if in_op is c.LITERAL:
+                    codes |= with_case([in_av])
+                elif in_op is c.RANGE and in_av[1] < 128:
+                    codes |= with_case(range(in_av[0], in_av[1] + 1))
+                elif in_op is c.CATEGORY and in_av in _CATEGORY_CHARS:
+                    codes |= _CATEGORY_CHARS[in_av]
+                else:
+                    return set(_ASCII), False
+            return codes, False
+        if op is c.SUBPATTERN:
+            return seq_first(av[-1])
+        if op is c.BRANCH:
+            codes, nullable = set(), False
+            for branch in av[1]:
+                branch_codes, branch_nullable = seq_first(branch)
+                codes |= branch_codes
+                nullable = nullable or branch_nullable
+            return codes, nullable
+        if op in (c.MAX_REPEAT, c.MIN_REPEAT, getattr(c, 'POSSESSIVE_REPEAT', None)):
+            codes, nullable = seq_first(av[2])
+            return codes, nullable or av[0] == 0
+        return set(_ASCII), True
+
+    def seq_first(items):
+        codes = set()
+        for op, av in items:
+            item_codes, nullable = item_first(op, av)
+            codes |= item_codes
+            if not nullable:
+                return codes, False
+        return codes, True
+
+    try:
+        items = _sre_parse.parse(pattern, flags)
+    except Exception:
+        # syntax of another regex module
+        return set(_ASCII)
+    return seq_first(items)[0] & _ASCII
+
 class Lexer(metaclass=LexerMeta):
     # These attributes may be defined in subclasses
     tokens = set()
@@ -188,10 +274,22 @@ class Lexer(metaclass=LexerMeta):
     reflags = 0
     regex_module = re
 
+    # Name of the token of words (identifiers). If it is set, keyword rules like r'\bSELECT\b' are not
+    # included in the master regex: a word is matched once by the rule of this token and is classified
+    # by the dictionary of keywords. Rules with other patterns (r'\bGROUP BY\b') stay in the master regex
+    keyword_token = None
+
     _token_names = set()
     _token_funcs = {}
     _ignored_tokens = set()
     _remapping = {}
+    _keywords = {}
+    _keywords_ignorecase = False
+    _special_tokens = frozenset()
+    _ignore_re = None
+    _parts = []
+    _first_char_rules = {}
+    _scanners = {}
     _delete = {}
     _remap = {}
 
@@ -252,7 +350,7 @@ class Lexer(metaclass=LexerMeta):
                     rules.append((key, value))
                     existing[key] = value
 
-            elif isinstance(value, str) and not key.startswith('_') and key not in {'ignore', 'literals'}:
+            elif isinstance(value, str) and not key.startswith('_') and key not in {'ignore', 'literals', 'keyword_token'}:
                 raise LexerBuildError(f'{key} does not match a name in tokens')
 
         # Apply deletion rules
@@ -290,7 +388,9 @@ class Lexer(metaclass=LexerMeta):
 
         cls._collect_rules()
 
+        cls._keywords = {}
         parts = []
+        first_chars = []
         for tokname, value in cls._rules:
             if tokname.startswith('ignore_'):
                 tokname = tokname[7:]
@@ -299,6 +399,15 @@ class Lexer(metaclass=LexerMeta):
             if isinstance(value, str):
                 pattern = value
 
+                keyword = _keyword_pattern.fullmatch(pattern)
+                if cls.keyword_token is not None and keyword and tokname not in cls._ignored_tokens:
+                    word = keyword.group(1)
+                    if cls.reflags & re.IGNORECASE:
+                        word = word.upper()
+                    # the first rule wins, like in the master regex
+                    cls._keywords.setdefault(word, tokname)
+                    continue
+
             elif callable(value):
                 cls._token_funcs[tokname] = value
                 pattern = getattr(value, 'pattern')
@@ -319,6 +428,7 @@ class Lexer(metaclass=LexerMeta):
                 raise PatternError(f'Regex for token {tokname} matches empty input')
 
             parts.append(part)
+            first_chars.append(_first_chars(part, cls.reflags))
 
         if not parts:
             return
@@ -328,10 +438,28 @@ class Lexer(metaclass=LexerMeta):
         # cls._master_re = cls.regex_module.compile('|'.join(parts) + previous, cls.reflags)
         cls._master_re = cls.regex_module.compile('|'.join(parts), cls.reflags)
 
+        # Rules that can match from every ASCII character: the scanner of the character
+        # is a regex only of these rules (in the same order). It is compiled on first use
+        cls._parts = parts
+        cls._first_char_rules = {}
+        for code in range(128):
+            cls._first_char_rules[chr(code)] = tuple(i for i, chars in enumerate(first_chars) if code in chars)
+        cls._scanners = {}
+
         # Verify that that ignore and literals specifiers match the input type
         if not isinstance(cls.ignore, str):
             raise LexerBuildError('ignore specifier must be a string')
 
+        # Precomputed data for tokenize
+        cls._ignore_re = None
+        if cls.ignore:
+            cls._ignore_re = re.compile('[' + ''.join(re.escape(char) for char in cls.ignore) + ']*').match
+        cls._keywords_ignorecase = bool(cls.reflags & re.IGNORECASE)
+        # tokens which are changed or skipped after matching
+        cls._special_tokens = frozenset(
+            set(cls._remapping) | set(cls._token_funcs) | cls._ignored_tokens | {cls.keyword_token}
+        )
+
         if not all(isinstance(lit, str) for lit in cls.literals):
             raise LexerBuildError('literals must be specified as strings')
 
@@ -359,18 +487,75 @@ class Lexer(metaclass=LexerMeta):
         '''
         self.begin(self.__state_stack.pop())
 
+    @classmethod
+    def _lookup_keyword(cls, text, tok):
+        '''
+        Returns the type of keyword for a token of word or None.
+        The same as it would be matched by r'\bKEYWORD\b' rule at the start of the token
+        '''
+        start = tok.index
+        if start > 0 and _word_char.match(text, start - 1):
+            return None
+
+        word = tok.value
+        keyword = cls._keywords.get(word.upper() if cls._keywords_ignorecase else word)
+        if keyword is not None:
+            # the word has to end here
+            if _word_char.match(text, tok.end):
+                return None
+            return keyword
+
+        if '$' not in word:
+            return None
+
+        # the token has non-word chars inside: keyword can be the beginning of it
+        word = _word.match(text, start)
+        if word is None:
+            return None
+        end = word.end()
+        word = word.group()
+        keyword = cls._keywords.get(word.upper() if cls._keywords_ignorecase else word)
+        if keyword is not None:
+            tok.value = word
+            tok.end = end
+        return keyword
+
+    @classmethod
+    def _get_scanner(cls, char):
+        rules = cls._first_char_rules.get(char)
+        if rules is None:
+            # non-ASCII character
+            return cls._master_re.match
+
+        scanner = cls._scanners.get(rules)
+        if scanner is None:
+            if rules:
+                scanner = cls.regex_module.compile('|'.join(cls._parts[i] for i in rules), cls.reflags).match
+            else:
+                # nothing can be matched
+                scanner = lambda text, index: None
+            cls._scanners[rules] = scanner
+        cls._scanners[char] = scanner
+        return scanner
+
     def tokenize(self, text, lineno=1, index=0):
-        _ignored_tokens = _master_re = _ignore = _token_funcs = _literals = _remapping = None
+        _master_re = _scanners = _get_scanner = _ignore_re = _special_tokens = _literals = None
+        _ignored_tokens = _token_funcs = _remapping = _keyword_token = None
 
         # --- Support for state changes
         def _set_state(cls):
-            nonlocal _ignored_tokens, _master_re, _ignore, _token_funcs, _literals, _remapping
-            _ignored_tokens = cls._ignored_tokens
+            nonlocal _master_re, _scanners, _get_scanner, _ignore_re, _special_tokens, _literals
+            nonlocal _ignored_tokens, _token_funcs, _remapping, _keyword_token
             _master_re = cls._master_re
-            _ignore = cls.ignore
-            _token_funcs = cls._token_funcs
+            _scanners = cls._scanners
+            _get_scanner = cls._get_scanner
+            _ignore_re = cls._ignore_re
+            _special_tokens = cls._special_tokens
             _literals = cls.literals
+            _ignored_tokens = cls._ignored_tokens
+            _token_funcs = cls._token_funcs
             _remapping = cls._remapping
+            _keyword_token = cls.keyword_token if cls._keywords else None
 
         self.__set_state = _set_state
         _set_state(type(self))
@@ -391,26 +576,43 @@ class Lexer(metaclass=LexerMeta):
             _set_state(cls)
         self.reject = _reject
 
+        text_len = len(text)
 
         # --- Main tokenization function
         self.text = text
         try:
             while True:
-                try:
-                    if text[index] in _ignore:
-                        index += 1
-                        continue
-                except IndexError:
+                # skip ignored characters at once
+                if _ignore_re is not None:
+                    index = _ignore_re(text, index).end()
+                if index >= text_len:
                     return
 
-                tok = Token()
-                tok.lineno = lineno
-                tok.index = index
-                m = _master_re.match(text, index)
+                # only rules which can start with the character
+                char = text[index]
+                scanner = _scanners.get(char) or _get_scanner(char)
+                m = scanner(text, index)
                 if m:
+                    tok = Token()
+                    tok.lineno = lineno
+                    tok.index = index
                     tok.end = index = m.end()
                     tok.value = m.group()
-                    tok.type = m.lastgroup
+                    tok.type = tok_type = m.lastgroup
+
+                    # most of tokens don't require any processing
+                    if tok_type not in _special_tokens:
+                        yield tok
+                        continue
+
+                    if tok_type == _keyword_token:
+                        keyword = self._lookup_keyword(text, tok)
+                        if keyword is not None:
+                            tok.type = keyword
+                            index = tok.end
+                            if keyword not in _special_tokens:
+                                yield tok
+                                continue
 
                     if tok.type in _remapping:
                         tok.type = _remapping[tok.type].get(tok.value, tok.type)
@@ -430,6 +632,9 @@ class Lexer(metaclass=LexerMeta):
                     yield tok
 
                 else:
+                    tok = Token()
+                    tok.lineno = lineno
+                    tok.index = index
                     # No match, see if the character is in literals
                     if text[index] in _literals:
                         tok.value = text[index]
@@ -31,9 +31,13 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # -----------------------------------------------------------------------------
 
+import os
 import sys
+import pickle
+import hashlib
 import inspect
-from collections import OrderedDict, defaultdict, Counter
+import tempfile
+from collections import OrderedDict, defaultdict, Counter, deque
 
 __all__        = [ 'Parser' ]
 
@@ -52,6 +56,7 @@ class YaccError(Exception):
 
 ERROR_COUNT = 3                # Number of symbols that must be shifted to leave recovery mode
 MAXINT = sys.maxsize
+TABLE_CACHE_VERSION = 1        # Format version of cached parsing tables. Bump it to invalidate old files
 
 # This object is a stand-in for a logging object created by the
 # logging module.   SLY will use this by default to create things
@@ -87,6 +92,13 @@ class SlyLogger(object):
 # ----------------------------------------------------------------------
 
 class YaccSymbol:
+    # Position attributes are set only if positions are tracked
+    __slots__ = ('type', 'value', 'lineno', 'index', 'end')
+
+    def __init__(self, type, value=None):
+        self.type = type
+        self.value = value
+
     def __str__(self):
         return self.type
 
@@ -842,6 +854,25 @@ class Grammar(object):
             p.lr_items = lr_items
 
 
+    # -----------------------------------------------------------------------------
+    # signature()
+    #
+    # Returns a hash of everything the LR tables are computed from: the
+    # productions (in order, with precedence and definition line that is used
+    # to resolve reduce/reduce conflicts), the terminals and the precedence
+    # table.  Two grammars with the same signature produce identical tables.
+    # -----------------------------------------------------------------------------
+
+    def signature(self):
+        digest = hashlib.sha256()
+        digest.update(f'version={TABLE_CACHE_VERSION}\n'.encode())
+        for p in self.Productions:
+            digest.update(f'{p.number}:{p}:{p.prec}:{p.line}\n'.encode())
+        digest.update(' '.join(sorted(self.Terminals)).encode())
+        for term in sorted(self.Precedence):
+            digest.update(f'\n{term}:{self.Precedence[term]}'.encode())
+        return digest.hexdigest()
+
     # ----------------------------------------------------------------------
     # Debugging output.  Printing the grammar will produce a detailed
     # description along with some diagnostics.
@@ -1566,6 +1597,75 @@ class LRTable(object):
 
         return '\n'.join(out)
 
+# -----------------------------------------------------------------------------
+#                             == LRTableCache ==
+#
+# Persistent storage for computed LR tables.  Building the LALR tables is by far
+# the most expensive part of defining a parser class, so the action, goto and
+# defaulted-state tables are pickled into a file keyed by the grammar signature
+# and loaded back instead of being recomputed while the grammar is unchanged.
+# -----------------------------------------------------------------------------
+
+class CachedLRTable(object):
+    '''
+    LR tables restored from the cache. It holds only the data used by the
+    parsing runtime (diagnostic information is not stored).
+    '''
+    def __init__(self, lr_action, lr_goto, defaulted_states):
+        self.lr_action = lr_action
+        self.lr_goto = lr_goto
+        self.defaulted_states = defaulted_states
+        self.sr_conflicts = []
+        self.rr_conflicts = []
+
+class LRTableCache(object):
+    def __init__(self, tabledir, name, signature):
+        self.path = os.path.join(tabledir, f'{name}.lrtab')
+        self.signature = signature
+
+    def load(self):
+        '''
+        Returns the cached tables or None if the file is absent, unreadable
+        or was made for another grammar.
+        '''
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return None
+
+        if not isinstance(data, dict) or data.get('signature') != self.signature:
+            return None
+        return CachedLRTable(data['lr_action'], data['lr_goto'], data['defaulted_states'])
+
+    def save(self, lrtable):
+        '''
+        Writes tables to the cache. The file is replaced atomically, so
+        concurrent processes never see a partially written file. Failures
+        (read-only location, etc) are ignored: the cache is only an optimization.
+        '''
+        data = {
+            'signature': self.signature,
+            'lr_action': lrtable.lr_action,
+            'lr_goto': lrtable.lr_goto,
+            'defaulted_states': lrtable.defaulted_states,
+        }
+        tabledir = os.path.dirname(self.path)
+        try:
+            os.makedirs(tabledir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=tabledir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return False
+        return True
+
 # Collect grammar rules from a function
 def _collect_grammar_rules(func):
     grammar = []
@@ -1821,7 +1921,7 @@ class ParserMeta(type):
         return cls
 
 class Parser(metaclass=ParserMeta):
-    # Automatic tracking of position information
+    # Automatic tracking of position information (see line_position() and index_position())
     track_positions = True
     
     # Logging object where debugging/diagnostic messages are sent
@@ -1830,6 +1930,9 @@ class Parser(metaclass=ParserMeta):
     # Debugging filename where parsetab.out data can be written
     debugfile = None
 
+    # Directory where computed LR tables are cached between runs. None disables the cache
+    tabledir = None
+
     @classmethod
     def __validate_tokens(cls):
         if not hasattr(cls, 'tokens'):
@@ -1967,7 +2070,18 @@ class Parser(metaclass=ParserMeta):
         '''
         Build the LR Parsing tables from the grammar
         '''
+        # Diagnostic output needs the full table, don't use the cache for it
+        table_cache = None
+        if cls.tabledir and not cls.debugfile:
+            table_cache = LRTableCache(cls.tabledir, f'{cls.__module__}.{cls.__qualname__}', cls._grammar.signature())
+            lrtable = table_cache.load()
+            if lrtable is not None:
+                cls._lrtable = lrtable
+                return True
+
         lrtable = LRTable(cls._grammar)
+        if table_cache is not None:
+            table_cache.save(lrtable)
         num_sr = len(lrtable.sr_conflicts)
 
         # Report shift/reduce and reduce/reduce conflicts
@@ -2043,6 +2157,12 @@ class Parser(metaclass=ParserMeta):
         else:
             sys.stderr.write('sly: Parse error in input. EOF\n')
  
+    def stop(self):
+        '''
+        Skips the rest of input. It can be called by error handler to finish parsing on the first error
+        '''
+        deque(self._input, maxlen=0)
+
     def errok(self):
         '''
         Clear the error status
@@ -2055,9 +2175,7 @@ class Parser(metaclass=ParserMeta):
         '''
         del self.statestack[:]
         del self.symstack[:]
-        sym = YaccSymbol()
-        sym.type = '$end'
-        self.symstack.append(sym)
+        self.symstack.append(YaccSymbol('$end'))
         self.statestack.append(0)
         self.state = 0
 
@@ -2074,19 +2192,27 @@ class Parser(metaclass=ParserMeta):
         pslice  = YaccProduction(None)                    # Production object passed to grammar rules
         errorcount = 0                                    # Used during error recovery
 
-        # Set up the state and symbol stacks
+        # Tokens are kept in a list which is shared with rules and error handler,
+        # it is dropped after successful parsing
+        if not isinstance(tokens, list):
+            tokens = list(tokens)
         self.tokens = tokens
-        self.used_tokens = []
+        self._input = token_iter = iter(tokens)
+
+        # Set up the state and symbol stacks
         self.statestack = statestack = []                 # Stack of parsing states
         self.symstack = symstack = []                     # Stack of grammar symbols
         pslice._stack = symstack                          # Associate the stack with the production
         self.restart()
 
-        # Set up position tracking
+        # Set up position tracking. Positions are stored only for the last parse: the tables are
+        # replaced on every call, so a long-living parser doesn't accumulate them. Values are
+        # referenced until the next parse, that way id() of a tracked value can't be reused
         track_positions = self.track_positions
-        if not hasattr(self, '_line_positions'):
+        if track_positions:
             self._line_positions = { }           # id: -> lineno
             self._index_positions = { }          # id: -> (start, end)
+            self._position_values = [ ]          # tracked values
 
         errtoken   = None                                 # Err token
         while True:
@@ -2096,13 +2222,11 @@ class Parser(metaclass=ParserMeta):
             if self.state not in defaulted_states:
                 if not lookahead:
                     if not lookaheadstack:
-                        lookahead = next(tokens, None)  # Get the next token
-                        self.used_tokens.append(lookahead)
+                        lookahead = next(token_iter, None)  # Get the next token
                     else:
                         lookahead = lookaheadstack.pop()
                     if not lookahead:
-                        lookahead = YaccSymbol()
-                        lookahead.type = '$end'
+                        lookahead = YaccSymbol('$end')
                     
                 # Check the action table
                 ltype = lookahead.type
@@ -2134,13 +2258,11 @@ class Parser(metaclass=ParserMeta):
                     # Call the production function
                     pslice._slice = symstack[-plen:] if plen else []
 
-                    sym = YaccSymbol()
-                    sym.type = pname       
                     value = p.func(self, pslice)
                     if value is pslice:
                         value = (pname, *(s.value for s in pslice._slice))
 
-                    sym.value = value
+                    sym = YaccSymbol(pname, value)
                         
                     # Record positions
                     if track_positions:
@@ -2155,6 +2277,7 @@ class Parser(metaclass=ParserMeta):
                             sym.end = None
                         self._line_positions[id(value)] = sym.lineno
                         self._index_positions[id(value)] = (sym.index, sym.end)
+                        self._position_values.append(value)
                             
                     if plen:
                         del symstack[-plen:]
@@ -2166,9 +2289,8 @@ class Parser(metaclass=ParserMeta):
                     continue
 
                 if t == 0:
-                    n = symstack[-1]
-                    result = getattr(n, 'value', None)
-                    return result
+                    self.tokens = self._input = None
+                    return symstack[-1].value
 
             if t is None:
                 # We have some kind of parsing error here.  To handle
@@ -2233,8 +2355,7 @@ class Parser(metaclass=ParserMeta):
                         continue
 
                     # Create the error symbol for the first time and make it the new lookahead symbol
-                    t = YaccSymbol()
-                    t.type = 'error'
+                    t = YaccSymbol('error')
 
                     if hasattr(lookahead, 'lineno'):
                         t.lineno = lookahead.lineno
@@ -2254,10 +2375,42 @@ class Parser(metaclass=ParserMeta):
             # Call an error function here
             raise RuntimeError('sly: internal parser error!!!\n')
 
-    # Return position tracking information
+    # Return position tracking information for a value produced by the last parse
     def line_position(self, value):
         return self._line_positions[id(value)]
 
     def index_position(self, value):
         return self._index_positions[id(value)]
+
+    def feed_state(self, statestack, ltype):
+        '''
+        Moves the automaton by one input symbol of type ltype without calling of grammar rules,
+        it is used to check input. statestack is changed in place.
+        Returns the count of done shifts and reductions, 0 on syntax error and -1 if input is accepted
+        '''
+        actions = self._lrtable.lr_action
+        goto = self._lrtable.lr_goto
+        prod = self._grammar.Productions
+        defaulted_states = self._lrtable.defaulted_states
+
+        steps = 0
+        while True:
+            state = statestack[-1]
+            t = defaulted_states.get(state)
+            if t is None:
+                t = actions[state].get(ltype)
+            if t is None:
+                return 0
+
+            steps += 1
+            if t > 0:
+                statestack.append(t)
+                return steps
+            if t == 0:
+                return -1
+
+            p = prod[-t]
+            if p.len:
+                del statestack[-p.len:]
+            statestack.append(goto[statestack[-1]][p.name])
     
@@ -1,7 +1,11 @@
+import copy
+import pickle
+
 import pytest
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import *
+from mindsdb_sql.parser.ast.base import transform
 
 
 class TestAST:
@@ -27,3 +31,215 @@ class TestAST:
         # change
         ast.where.args[0] = Constant(1)
         assert ast.to_tree() != ast2.to_tree()
+
+    def test_clone(self):
+        sql = "select a, sum(b) as c from tab join (select * from t2) as t2 using x=1 where x in (1, 'a') group by a"
+        query = parse_sql(sql)
+        query2 = query.clone()
+        assert query2 == query
+        assert query2.to_string() == query.to_string()
+
+        # nodes and containers are not shared
+        query2.targets[0].parts.append('b')
+        query2.from_table.right.where = BinaryOperation(op='=', args=[Identifier('y'), Constant(1)])
+        query2.using['x'] = 2
+        assert query == parse_sql(sql)
+
+        # private attributes are copied, not set attributes stay not set
+        create = parse_sql('retrain pred', dialect='mindsdb')
+        assert create.clone().to_string() == create.to_string()
+        assert not hasattr(Identifier('a').clone(), 'sub_select')
+
+
+class TestCompare:
+    def test_equal(self):
+        sql = "select a, b + 1 as c from tab where x = 1 and y in (1, 'a') order by a limit 10"
+        assert parse_sql(sql) == parse_sql(sql)
+        assert parse_sql(sql) != parse_sql(sql.replace("'a'", "'b'"))
+
+        # lists and tuples are the same
+        assert BinaryOperation(op='=', args=[Identifier('x'), Constant(1)]) == \
+               BinaryOperation(op='=', args=(Identifier('x'), Constant(1)))
+
+        # types of values are compared
+        assert Constant(1) != Constant(1.0)
+        assert Constant(1) != Constant(True)
+        assert Constant('1') != Constant(1)
+
+        # alias and parentheses are part of node
+        assert Identifier('a') != Identifier('a', alias=Identifier('b'))
+        assert Constant(1) != Constant(1, parentheses=True)
+        assert Identifier('a') != Constant('a')
+        assert Identifier('a') != 'a'
+
+    def test_not_structural_fields(self):
+        # plain values of insert
+        insert = Insert(table=Identifier('t'), values=[[1, 'a', None]], is_plain=True)
+        insert2 = Insert(table=Identifier('t'), values=[[Constant(1), Constant('a'), NullConstant()]])
+        assert insert == insert2
+        assert hash(insert) == hash(insert2)
+
+    def test_hash(self):
+        queries = [
+            'select a from tab where x = 1',
+            'select a from tab where x = 2',
+            'select a from tab where x = 1.0',
+            'select a as b from tab where x = 1',
+        ]
+        index = {parse_sql(sql): i for i, sql in enumerate(queries)}
+        assert len(index) == 4
+        for i, sql in enumerate(queries):
+            assert index[parse_sql(sql)] == i
+
+        assert len({Identifier('a'), Identifier(parts=['a']), Identifier('b')}) == 2
+
+    def test_no_rendering(self):
+        query = parse_sql('select a, b + 1 as c from tab where x = 1')
+        query2 = query.copy()
+
+        def fail(*args, **kwargs):
+            raise AssertionError('rendering is not expected')
+
+        classes = [ASTNode]
+        for cls in classes:
+            classes.extend(cls.__subclasses__())
+        saved = [(cls, cls.__dict__.get('to_tree'), cls.__dict__.get('get_string')) for cls in classes]
+        for cls in classes:
+            cls.to_tree = cls.get_string = fail
+        try:
+            assert query == query2
+            assert hash(query) == hash(query2)
+        finally:
+            for cls, to_tree, get_string in saved:
+                for name, method in (('to_tree', to_tree), ('get_string', get_string)):
+                    if method is None:
+                        delattr(cls, name)
+                    else:
+                        setattr(cls, name, method)
+
+    def test_deep_tree(self):
+        node1, node2 = Constant(0), Constant(0)
+        for i in range(10000):
+            node1 = UnaryOperation(op='-', args=[node1], parentheses=True)
+            node2 = UnaryOperation(op='-', args=[node2], parentheses=True)
+        assert node1 == node2
+        assert hash(node1) == hash(node2)
+
+
+class TestSlots:
+    def test_no_dict(self):
+        # dialect nodes are registered as subclasses too
+        parse_sql('show index from tab', dialect='mysql')
+        parse_sql('retrain pred', dialect='mindsdb')
+
+        classes = [ASTNode]
+        for cls in classes:
+            classes.extend(cls.__subclasses__())
+        for cls in classes:
+            assert cls.__dictoffset__ == 0, cls
+
+        node = Identifier('a')
+        with pytest.raises(AttributeError):
+            node.unknown = 1
+
+    def test_copy(self):
+        query = parse_sql('select a, sum(b) as c from tab where x in (1, 2) group by a limit 1')
+        assert pickle.loads(pickle.dumps(query)) == query
+        assert copy.deepcopy(query) == query
+        assert copy.copy(query).targets is query.targets
+
+        # not set attribute
+        identifier = Identifier('a')
+        assert not hasattr(identifier, 'sub_select')
+        identifier.sub_select = Select(targets=[Star()])
+        assert identifier.copy().sub_select == identifier.sub_select
+        assert identifier != Identifier('a')
+
+
+class TestFrozen:
+    def test_freeze(self):
+        sql = "select a, sum(b) as c from tab where x in (1, 'a') group by a using p=[1, 2], q={'x': 1}"
+        query = parse_sql(sql)
+        assert query.freeze() is query
+        assert query.is_frozen() and query.where.args[1].is_frozen()
+        assert isinstance(query, Select) and query.node_class is Select
+        assert query == parse_sql(sql)
+        assert query.to_string() == parse_sql(sql).to_string()
+        assert hash(query) == hash(parse_sql(sql))
+
+        for change in (
+            lambda: setattr(query, 'where', None),
+            lambda: delattr(query, 'alias'),
+            lambda: setattr(query.targets[0], 'parts', ['b']),
+            lambda: query.targets.append(Identifier('b')),
+            lambda: query.targets[0].parts.pop(0),
+            lambda: query.using.update(p=1),
+            lambda: query.using['p'].append(3),
+        ):
+            with pytest.raises((AttributeError, TypeError)):
+                change()
+
+        # copies are mutable
+        query2 = query.clone()
+        assert not query2.is_frozen() and query2 == query
+        query2.targets[0].parts.append('b')
+        query2.using['q']['x'] = 2
+        assert copy.deepcopy(query).is_frozen() is False
+        assert copy.copy(query) is query
+
+        # pickle keeps frozen state
+        query3 = pickle.loads(pickle.dumps(query))
+        assert query3.is_frozen() and query3 == query
+
+    def test_transform(self):
+        query = parse_sql('select a, b from tab t where t.x = 1 and (y = 2 or t.x > 3)').freeze()
+
+        def rename(node):
+            if isinstance(node, Identifier) and node.parts == ['t', 'x']:
+                return Identifier('t.z')
+
+        query2 = transform(query, rename)
+        assert query2.to_string() == 'SELECT a, b FROM tab AS t WHERE t.z = 1 AND (y = 2 OR t.z > 3)'
+        assert query.to_string() == 'SELECT a, b FROM tab AS t WHERE t.x = 1 AND (y = 2 OR t.x > 3)'
+
+        # unchanged subtrees are shared, new tree is frozen
+        assert query2.targets is query.targets
+        assert query2.from_table is query.from_table
+        assert query2.where.args[1].args[0] is query.where.args[1].args[0]
+        assert query2.is_frozen() and query2.where.args[0].args[0].is_frozen()
+
+        # nothing to replace
+        assert transform(query, lambda node: None) is query
+
+        # mutable tree stays mutable
+        query = parse_sql('select t.x from tab')
+        query2 = transform(query, rename)
+        assert str(query2) == 'SELECT t.z FROM tab' and str(query) == 'SELECT t.x FROM tab'
+        assert not query2.is_frozen()
+
+    def test_chain(self):
+        # frozen chain is flattened as the mutable one
+        query = parse_sql('select * from tab where a = 1 and b = 2').freeze()
+        thawed = query.clone()
+        cond = BinaryOperation('=', args=[Identifier('c'), Constant(3)])
+
+        frozen_chain = BinaryOperation('and', args=[query.where, cond])
+        thawed_chain = BinaryOperation('and', args=[thawed.where, cond])
+        assert len(frozen_chain.args) == len(thawed_chain.args) == 3
+        assert frozen_chain == thawed_chain
+        assert frozen_chain.freeze() == thawed_chain
+
+        # chain of parser doesn't change frozen node
+        chain = BinaryOperation.chain('and', query.where, cond)
+        assert chain == thawed_chain
+        assert len(query.where.args) == 2
+
+    def test_planner(self):
+        from mindsdb_sql.planner import plan_query
+
+        sql = 'select * from int.tab1 t1 join int.tab2 t2 on t1.id = t2.id where t1.a = 1 or t1.a = 2'
+        query = parse_sql(sql).freeze()
+        # query is not changed by planner
+        plan = plan_query(query, integrations=['int'])
+        assert plan.steps == plan_query(parse_sql(sql), integrations=['int']).steps
+        assert query == parse_sql(sql)
@@ -95,4 +95,44 @@ class TestInsertMDB:
         )
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
\ No newline at end of file
+        assert ast.to_tree() == expected_ast.to_tree()
+
+    def test_insert_plain_values(self):
+        sql = "INSERT INTO tbl_name(a, b, c, d) VALUES (1, 'x', NULL, TRUE), (-2.5, 'y''z', 3, FALSE)"
+
+        ast = parse_sql(sql)
+        assert ast.is_plain
+        assert ast.values == [
+            [1, 'x', None, True],
+            [-2.5, "y'z", 3, False],
+        ]
+
+        expected_ast = Insert(
+            table=Identifier('tbl_name'),
+            columns=[Identifier('a'), Identifier('b'), Identifier('c'), Identifier('d')],
+            values=[
+                [Constant(1), Constant('x'), NullConstant(), Constant(True)],
+                [Constant(-2.5), Constant("y'z"), Constant(3), Constant(False)],
+            ]
+        )
+        assert str(ast) == str(expected_ast)
+        assert ast.to_tree() == expected_ast.to_tree()
+
+    def test_insert_not_plain_values(self):
+        sql = "INSERT INTO tbl_name(a, b) VALUES (1, 'x'), (now(), upper('y'))"
+
+        ast = parse_sql(sql)
+        # only rows with expressions are kept as AST
+        assert not ast.is_plain
+        assert ast.values[0] == [1, 'x']
+        assert ast.values[1] == [Function('now', args=[]), Function('upper', args=[Constant('y')])]
+        assert str(ast) == sql
+
+    def test_insert_many_rows(self):
+        count = 3000
+        sql = 'INSERT INTO tbl_name(a, b) VALUES ' + ', '.join(f"({i}, 'x{i}')" for i in range(count))
+
+        ast = parse_sql(sql)
+        assert ast.is_plain
+        assert len(ast.values) == count
+        assert ast.values[-1] == [count - 1, f'x{count - 1}']
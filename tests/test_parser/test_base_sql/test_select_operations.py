@@ -118,6 +118,40 @@ class TestOperations:
         assert str(ast).lower() == str(expected_ast).lower()
         assert ast.to_tree() == expected_ast.to_tree()
 
+    def test_chain_is_flat(self, dialect):
+        # parentheses are required: the chain in them isn't merged with the outer one after rendering
+        sql = 'SELECT * FROM tab WHERE a = 1 OR a = 2 OR (a = 3 OR a = 4) AND b = 1 AND c = 2'
+        ast = parse_sql(sql, dialect=dialect)
+
+        where = ast.where
+        assert where.op == 'or'
+        assert len(where.args) == 3
+        assert where.args[2].op == 'and'
+        assert len(where.args[2].args) == 3
+        # parentheses are kept
+        assert where.args[2].args[0].parentheses
+        assert len(where.args[2].args[0].args) == 2
+        assert str(ast) == sql
+
+        # nested operations are flattened by constructor
+        a, b, c = Identifier('a'), Identifier('b'), Identifier('c')
+        assert where.args[2] == BinaryOperation('and', args=[
+            BinaryOperation('and', args=[where.args[2].args[0],
+                                         BinaryOperation('=', args=[Identifier('b'), Constant(1)])]),
+            BinaryOperation('=', args=[Identifier('c'), Constant(2)])
+        ])
+        assert len(BinaryOperation('or', args=[a, BinaryOperation('or', args=[b, c])]).args) == 3
+        assert len(BinaryOperation('or', args=[a, BinaryOperation('and', args=[b, c])]).args) == 2
+
+    def test_long_chain(self, dialect):
+        count = 5000
+        sql = 'SELECT * FROM tab WHERE ' + ' OR '.join(f'a = {i}' for i in range(count))
+        ast = parse_sql(sql, dialect=dialect)
+
+        assert len(ast.where.args) == count
+        assert str(ast) == sql
+        assert ast.copy() == ast
+
     def test_operator_precedence_or_and(self, dialect):
         sql = f'SELECT column1 OR column2 AND column3'
         ast = parse_sql(sql, dialect=dialect)
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mindsdb_sql import DIALECTS, get_lexer_parser, parse_sql, pooled_lexer_parser, warmup
+from mindsdb_sql.exceptions import ParsingException
+
+
+class TestDialects:
+    def test_lazy_import(self):
+        # no parser is built on import of the package
+        code = '''
+import sys
+import mindsdb_sql
+from mindsdb_sql.parser.ast import Identifier
+str(Identifier('a'))
+loaded = [name for name in sys.modules if name.endswith('parser.parser')]
+assert loaded == [], loaded
+mindsdb_sql.parse_sql('select 1', dialect='sqlite')
+assert 'mindsdb_sql.parser.parser' in sys.modules
+assert 'mindsdb_sql.parser.dialects.mindsdb.parser' not in sys.modules
+'''
+        subprocess.check_call([sys.executable, '-c', code])
+
+    def test_warmup(self):
+        warmup(['mysql'])
+        warmup()
+
+        for dialect in DIALECTS:
+            lexer, parser = get_lexer_parser(dialect)
+            ast = parse_sql('select a from b', dialect=dialect)
+            assert str(ast) == 'SELECT a FROM b'
+
+    def test_unknown_dialect(self):
+        with pytest.raises(ParsingException):
+            parse_sql('select 1', dialect='oracle')
+
+        with pytest.raises(ParsingException):
+            warmup(['oracle'])
+
+
+class TestParserPool:
+    def test_reuse(self):
+        with pooled_lexer_parser('mindsdb') as (lexer, parser):
+            # nested usage gets another instance
+            with pooled_lexer_parser('mindsdb') as (lexer2, parser2):
+                assert parser2 is not parser
+                assert lexer2 is not lexer
+
+        parse_sql('select 1')
+        with pooled_lexer_parser('mindsdb') as (lexer3, parser3):
+            assert parser3 in (parser, parser2)
+
+        # instance is usable after error
+        with pytest.raises(ParsingException):
+            parse_sql('select 1 from')
+        assert str(parse_sql('select 1 from x')) == 'SELECT 1 FROM x'
+
+    def test_threads(self):
+        def parse(i):
+            if i % 5 == 0:
+                try:
+                    parse_sql(f'select {i} from tbl where')
+                except ParsingException as e:
+                    return str(e)
+            return str(parse_sql(f'select col{i} from tbl{i} where x = {i}'))
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(parse, range(1000)))
+
+        for i, result in enumerate(results):
+            if i % 5 == 0:
+                assert f'select {i} from tbl where' in result
+            else:
+                assert result == f'SELECT col{i} FROM tbl{i} WHERE x = {i}'
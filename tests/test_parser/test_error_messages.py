@@ -0,0 +1,63 @@
+import pytest
+
+from mindsdb_sql import ErrorHandling, get_lexer_parser, parse_sql
+from mindsdb_sql.exceptions import ParsingException
+
+
+def get_suggestions(msg):
+    # order depends on parsing tables
+    prefix, _, values = msg.splitlines()[-1].partition(': ')
+    return prefix, set(values.split(', '))
+
+
+def get_error(sql, **kwargs):
+    with pytest.raises(ParsingException) as e:
+        parse_sql(sql, **kwargs)
+    return str(e.value)
+
+
+class TestSuggestions:
+    def test_suggestions(self):
+        msg = get_error('select a from t where x = 1 group by a a, b')
+        assert get_suggestions(msg) == ('Possible inputs', {'"ORDER BY"', '"FROM"', '"GROUP BY"'})
+
+        msg = get_error('select a from (select b from t2 where x = 1 group b) as x')
+        assert 'Syntax error, unknown input:' in msg
+
+        # end of the query: suggestions are not checked
+        msg = get_error('select a from')
+        assert msg.splitlines()[-1] == 'Expected symbol: "[identifier]"'
+
+    def test_no_suggestions(self):
+        sql = 'select a from t where x = 1 group by a a, b'
+        msg = get_error(sql, suggestions=False)
+        assert 'Possible inputs' not in msg
+        assert msg.splitlines() == get_error(sql).splitlines()[:-1]
+
+    def test_budget(self):
+        lexer, parser = get_lexer_parser('mindsdb')
+        sql = 'select a from t where ' + ' and '.join(f'x{i} = {i}' for i in range(500)) + ' group by a a, b'
+        assert parser.parse(lexer.tokenize(sql)) is None
+
+        # checks are stopped when budget is exhausted
+        eh = ErrorHandling(lexer, parser, budget=100)
+        msg = eh.process(parser.error_info)
+        assert eh.budget < 0
+        assert 'Possible inputs' not in msg
+
+        msg = ErrorHandling(lexer, parser).process(parser.error_info)
+        assert get_suggestions(msg) == ('Possible inputs', {'"ORDER BY"', '"FROM"', '"GROUP BY"'})
+
+    def test_feed_state(self):
+        lexer, parser = get_lexer_parser('mindsdb')
+
+        def check(sql):
+            statestack = [0]
+            for token in lexer.tokenize(sql):
+                if parser.feed_state(statestack, token.type) <= 0:
+                    return False
+            return parser.feed_state(statestack, '$end') == -1
+
+        assert check('select a, b from t where x in (1, 2) order by a')
+        assert not check('select a, b from t where')
+        assert not check('select from t')
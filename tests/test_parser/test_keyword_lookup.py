@@ -0,0 +1,44 @@
+import pytest
+
+from sly.lex import LexerMeta
+
+from mindsdb_sql.parser.lexer import SQLLexer
+from mindsdb_sql.parser.dialects.mysql.lexer import MySQLLexer
+from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
+
+
+def make_regex_lexer(lexer_class):
+    # the same lexer without lookup of keywords
+    namespace = LexerMeta.__prepare__(lexer_class.__name__, (lexer_class,))
+    namespace['tokens'] = lexer_class.tokens
+    namespace['keyword_token'] = None
+    return LexerMeta(lexer_class.__name__, (lexer_class,), namespace)
+
+
+def get_tokens(lexer_class, sql):
+    return [(t.type, t.value, t.lineno, t.index, t.end) for t in lexer_class().tokenize(sql)]
+
+
+@pytest.mark.parametrize('lexer_class', [SQLLexer, MySQLLexer, MindsDBLexer])
+class TestKeywordLookup:
+    def test_keywords_not_in_master_regex(self, lexer_class):
+        assert lexer_class._keywords['SELECT'] == 'SELECT'
+        assert r'\bSELECT\b' not in lexer_class._master_re.pattern
+        # not a single word
+        assert 'GROUP_BY' not in lexer_class._keywords.values()
+
+    def test_same_tokens(self, lexer_class):
+        regex_lexer = make_regex_lexer(lexer_class)
+        assert 'SELECT' in regex_lexer._master_re.groupindex
+
+        for sql in (
+            'SeLeCt a, b AS c FROM db.tbl WHERE x IS NOT NULL and y NOT IN (1, 2) GROUP BY a ORDER BY b NULLS LAST',
+            'select$x from t',
+            'select a$from, _select, select_, from1, `select` from x.select',
+            '1.5select',
+            'select--comment\nfrom /* where */ where\n',
+            "select 'from' from \"where\" where not  exists (select 1)",
+            'create table t (id int primary key, x text)',
+            'select * from t where a is\tnot true and b notin (1)',
+        ):
+            assert get_tokens(lexer_class, sql) == get_tokens(regex_lexer, sql), sql
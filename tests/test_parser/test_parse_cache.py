@@ -0,0 +1,94 @@
+import pytest
+
+from mindsdb_sql import parse_sql, ParseCache
+from mindsdb_sql.exceptions import ParsingException
+from mindsdb_sql.parser.ast import Identifier, Constant
+from mindsdb_sql.planner import plan_query
+from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
+
+
+class TestParseCache:
+    def test_hits(self):
+        cache = ParseCache(maxsize=10)
+
+        ast = parse_sql('select a from tbl where x = 1', cache=cache)
+        ast2 = parse_sql('  select a from tbl where x = 1 ; ', cache=cache)
+        assert cache.stats() == dict(size=1, maxsize=10, hits=1, misses=1, evictions=0)
+        assert ast == ast2
+        assert ast is not ast2
+
+        # another dialect is another key
+        parse_sql('select a from tbl where x = 1', dialect='mysql', cache=cache)
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+        # errors are not cached
+        for _ in range(2):
+            with pytest.raises(ParsingException):
+                parse_sql('select a from', cache=cache)
+        assert len(cache) == 2
+
+    def test_returned_tree_is_a_copy(self):
+        cache = ParseCache()
+        sql = 'select a from tbl where x = 1'
+
+        ast = parse_sql(sql, cache=cache)
+        ast.targets.append(Identifier('b'))
+        ast.where.args[1].value = 2
+
+        ast2 = parse_sql(sql, cache=cache)
+        assert str(ast2) == 'SELECT a FROM tbl WHERE x = 1'
+
+        ast2.where.args[1] = Constant(3)
+        ast2.from_table.parts[0] = 'tbl2'
+        assert str(parse_sql(sql, cache=cache)) == 'SELECT a FROM tbl WHERE x = 1'
+
+    def test_exists_subquery(self):
+        # subquery of exists is one node in the copy from cache
+        cache = ParseCache()
+        sql = 'select * from int.t1 where exists (select 1 from int.t2 where t2.x = t1.x)'
+
+        parse_sql(sql, cache=cache)
+        ast = parse_sql(sql, cache=cache)
+        assert cache.hits == 1
+        assert ast.where.query is ast.where.args[0]
+
+        plan = plan_query(ast, integrations=['int'])
+        query = plan.steps[0].query
+        rendered = SqlalchemyRender('mysql').get_string(query, with_failback=False)
+        # render uses query of exists, planner changes args
+        assert 'FROM t2' in str(query)
+        assert 'FROM t2' in rendered
+
+    def test_eviction(self):
+        cache = ParseCache(maxsize=2)
+
+        parse_sql('select 1', cache=cache)
+        parse_sql('select 2', cache=cache)
+        parse_sql('select 1', cache=cache)
+        # 'select 2' is the least recently used
+        parse_sql('select 3', cache=cache)
+
+        assert cache.evictions == 1
+        parse_sql('select 1', cache=cache)
+        assert cache.hits == 2
+        parse_sql('select 2', cache=cache)
+        assert cache.misses == 4
+
+        cache.clear()
+        assert cache.stats() == dict(size=0, maxsize=2, hits=0, misses=0, evictions=0)
+
+    def test_frozen(self):
+        cache = ParseCache(frozen=True)
+        sql = 'select a from tbl where x = 1'
+
+        # the same frozen tree is returned
+        ast = parse_sql(sql, cache=cache)
+        assert ast.is_frozen()
+        assert parse_sql(sql, cache=cache) is ast
+        with pytest.raises(AttributeError):
+            ast.where = None
+
+        ast2 = ast.clone()
+        ast2.where = None
+        assert str(parse_sql(sql, cache=cache)) == 'SELECT a FROM tbl WHERE x = 1'
@@ -0,0 +1,47 @@
+import itertools
+
+from mindsdb_sql import parse_sql, parse_many, iter_parse_many
+from mindsdb_sql.exceptions import ParsingException
+
+
+def make_queries(count):
+    for i in range(count):
+        if i % 7 == 0:
+            yield f'select {i} from'
+        elif i % 11 == 0:
+            # error of lexer
+            yield f"select 'x{i}"
+        else:
+            yield f'select col{i}, count(*) from tbl{i} where x = {i} group by col{i}'
+
+
+class TestParseMany:
+    def check_results(self, results, count):
+        assert len(results) == count
+        for sql, result in zip(make_queries(count), results):
+            if sql.endswith('from') or "'" in sql:
+                assert isinstance(result, ParsingException)
+                assert sql in str(result)
+            else:
+                assert result == parse_sql(sql)
+
+    def test_workers(self):
+        results = parse_many(make_queries(500), dialect='mindsdb', workers=2, chunksize=30)
+        self.check_results(results, 500)
+
+    def test_current_process(self):
+        results = parse_many(make_queries(50), dialect='mysql', workers=0, chunksize=7)
+        assert len(results) == 50
+        assert str(results[1]) == 'SELECT col1, count(*) FROM tbl1 WHERE x = 1 GROUP BY col1'
+
+    def test_streaming(self):
+        # input is read only when workers need it
+        queries = (f'select {i}' for i in itertools.count())
+        results = iter_parse_many(queries, workers=2, chunksize=10)
+
+        first = list(itertools.islice(results, 25))
+        results.close()
+
+        assert [str(ast) for ast in first] == [f'SELECT {i}' for i in range(25)]
+        # chunk of results which is returned now and 2 chunks per worker in process
+        assert next(queries) == 'select 60'
@@ -0,0 +1,106 @@
+import io
+import itertools
+import mmap
+
+import pytest
+
+from mindsdb_sql import parse_sql, parse_sql_stream
+from mindsdb_sql.exceptions import ParsingException
+from mindsdb_sql.parser.splitter import read_chunks, split_statements
+
+
+SCRIPT = '''
+-- migration; with semicolons in comments
+create table tbl (id int, name text);
+/* block; comment */
+insert into tbl values (1, 'a;b'), (2, 'it''s; ok'), (3, 'escaped \\'; quote');
+select `weird;name`, "dquote; string" from tbl where x = 1-2 / 3;
+select * from int1 (select 1; select 2) as t;
+-- only comment at the end; it is skipped
+'''
+
+STATEMENTS = [
+    # comments are kept in text of statements
+    '-- migration; with semicolons in comments\ncreate table tbl (id int, name text)',
+    '/* block; comment */\ninsert into tbl values (1, \'a;b\'), (2, \'it\'\'s; ok\'), (3, \'escaped \\\'; quote\')',
+    'select `weird;name`, "dquote; string" from tbl where x = 1-2 / 3',
+    'select * from int1 (select 1; select 2) as t',
+]
+
+
+class TestSplitStatements:
+    def test_split(self):
+        assert list(split_statements([SCRIPT])) == STATEMENTS
+
+    def test_chunks(self):
+        # any boundaries of chunks
+        for size in (1, 2, 3, 7, 50):
+            chunks = [SCRIPT[i: i + size] for i in range(0, len(SCRIPT), size)]
+            assert list(split_statements(chunks)) == STATEMENTS, size
+
+    def test_last_statement(self):
+        assert list(split_statements(['select 1; select 2'])) == ['select 1', 'select 2']
+        assert list(split_statements(['select 1 -', '-comment'])) == ['select 1 --comment']
+        assert list(split_statements(['select 1 -'])) == ['select 1 -']
+        assert list(split_statements(['select \'1;'])) == ['select \'1;']
+        assert list(split_statements([';;  ; -- x\n'])) == []
+
+    def test_backslash_escapes(self):
+        sql = "select 'a\\'; select 'b'"
+        assert list(split_statements([sql])) == [sql]
+        assert list(split_statements([sql], backslash_escapes=False)) == ["select 'a\\'", "select 'b'"]
+
+    def test_long_statement(self):
+        # statement of many chunks
+        chunks = ["insert into tbl values (0, 'a;b')"] + [f", ({i}, 'a;b')" for i in range(1, 100000)] + [';']
+        statements = list(split_statements(chunks))
+        assert len(statements) == 1
+        assert statements[0] == ''.join(chunks[:-1])
+
+    def test_lazy(self):
+        # the statement is returned before the end of the input
+        chunks = itertools.chain(['select 1; sel'], itertools.repeat('ect 2 '))
+        assert next(split_statements(chunks)) == 'select 1'
+
+    def test_read_chunks(self):
+        text = 'select \'ünïcode\'; select 2'
+
+        assert list(read_chunks(text)) == [text]
+        assert ''.join(read_chunks(io.StringIO(text), chunk_size=3)) == text
+
+        # multibyte chars are split between chunks
+        data = text.encode('utf-8')
+        assert ''.join(read_chunks(io.BytesIO(data), chunk_size=1)) == text
+        assert ''.join(read_chunks([data[i: i + 1] for i in range(len(data))])) == text
+        assert ''.join(read_chunks(data)) == text
+
+
+class TestParseSqlStream:
+    def test_parse(self):
+        expected = [parse_sql(sql) for sql in STATEMENTS]
+
+        assert list(parse_sql_stream(SCRIPT)) == expected
+        assert list(parse_sql_stream(io.StringIO(SCRIPT))) == expected
+        assert list(parse_sql_stream(io.BytesIO(SCRIPT.encode()), dialect='mindsdb')) == expected
+
+    def test_mmap(self, tmp_path):
+        path = tmp_path / 'dump.sql'
+        path.write_text(''.join(f"insert into tbl values ({i}, 'name;{i}');\n" for i in range(5000)))
+
+        with open(path, 'rb') as fd, mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            count = 0
+            for i, query in enumerate(parse_sql_stream(data)):
+                assert query.values == [[i, f'name;{i}']]
+                count += 1
+        assert count == 5000
+
+    def test_dialect(self):
+        # backslash is a usual char in strings of sqlite
+        queries = list(parse_sql_stream("select 'a\\'; select 'b'", dialect='sqlite'))
+        assert [query.targets[0].value for query in queries] == ['a\\', 'b']
+
+    def test_error(self):
+        queries = parse_sql_stream('select 1; select 2 from; select 3')
+        assert str(next(queries)) == 'SELECT 1'
+        with pytest.raises(ParsingException):
+            next(queries)
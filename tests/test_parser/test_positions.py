@@ -0,0 +1,58 @@
+import gc
+import os
+import tracemalloc
+
+from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
+from mindsdb_sql.parser.dialects.mindsdb.parser import MindsDBParser
+
+from tests.test_parser.test_table_cache import CalcLexer, make_parser
+
+
+class TestPositions:
+    def test_positions_of_last_parse(self):
+        parser = make_parser(None)()
+        lexer = CalcLexer()
+
+        for i in range(1000):
+            parser.parse(lexer.tokenize(f'{i} + 2 * 3'))
+
+        # only the last parse is tracked: 3 numbers and 2 operations
+        assert len(parser._line_positions) == len(parser._index_positions) == 5
+
+        value = parser.parse(lexer.tokenize('1 + 2 * 3'))
+        assert parser.line_position(value) == 1
+        assert parser.index_position(value) == (0, 9)
+
+    def test_parser_memory(self):
+        # one parser instance is used for many statements, it doesn't keep anything from previous parses
+        lexer, parser = MindsDBLexer(), MindsDBParser()
+        sql = 'select a, b + 1 as c from db.tbl where x = {} and y in (1, 2, 3) order by a limit 10'
+
+        def parse_many(count):
+            for i in range(count):
+                parser.parse(lexer.tokenize(sql.format(i)))
+
+        def get_size():
+            # only memory allocated by parser: other threads can allocate at the same time
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(True, os.path.join('*', 'sly', '*')),
+                tracemalloc.Filter(True, os.path.join('*', 'mindsdb_sql', '*')),
+            ])
+            return sum(stat.size for stat in snapshot.statistics('filename'))
+
+        parse_many(50)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            parse_many(50)
+            gc.collect()
+            size1 = get_size()
+
+            parse_many(500)
+            gc.collect()
+            size2 = get_size()
+        finally:
+            tracemalloc.stop()
+
+        # some noise is possible, but not kilobytes per statement
+        assert size2 - size1 < 10000
@@ -0,0 +1,60 @@
+import gc
+import tracemalloc
+
+from sly.lex import Token
+from sly.yacc import YaccSymbol
+
+from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
+from mindsdb_sql.parser.dialects.mindsdb.parser import MindsDBParser
+
+
+class TestSymbols:
+    def test_slots(self):
+        assert not hasattr(Token(), '__dict__')
+
+        sym = YaccSymbol('expr', 1)
+        assert not hasattr(sym, '__dict__')
+        assert (sym.type, sym.value) == ('expr', 1)
+        # positions are not set if not tracked
+        assert getattr(sym, 'lineno', None) is None
+
+    def test_parse_memory(self):
+        # memory used by parsing itself doesn't depend on count of tokens: symbols are freed on reduce
+        lexer, parser = MindsDBLexer(), MindsDBParser()
+
+        def measure(count):
+            sql = 'select ' + ', '.join(f'col_{i} + {i} as c{i}' for i in range(count)) + ' from tbl'
+            tokens = list(lexer.tokenize(sql))
+            parser.parse(tokens)
+            gc.collect()
+
+            tracemalloc.start()
+            try:
+                ast = parser.parse(tokens)
+                size, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(ast.targets) == count
+            return peak - size
+
+        overhead1 = measure(100)
+        overhead2 = measure(3000)
+
+        assert overhead2 - overhead1 < 50000
+
+
+class TestTokenList:
+    def test_shared_tokens(self):
+        lexer, parser = MindsDBLexer(), MindsDBParser()
+
+        # list is used as is and dropped after parsing
+        tokens = list(lexer.tokenize('select * from int1 (select a, (b) from t; select ()) where x = 1'))
+        ast = parser.parse(tokens)
+        assert ast.from_table.query == 'select a, (b) from t; select ()'
+        assert parser.tokens is None
+
+        # error handler gets all tokens of the query, the rest of input is not parsed after the error
+        tokens = list(lexer.tokenize('select a from from t where where'))
+        assert parser.parse(iter(tokens)) is None
+        assert parser.error_info['tokens'] == tokens
+        assert parser.error_info['bad_token'] is tokens[3]
@@ -0,0 +1,87 @@
+from sly import Lexer, Parser
+from sly.yacc import CachedLRTable, LRTable
+
+
+class CalcLexer(Lexer):
+    tokens = {NUMBER, PLUS, TIMES}
+    ignore = ' '
+
+    NUMBER = r'\d+'
+    PLUS = r'\+'
+    TIMES = r'\*'
+
+
+def make_parser(cache_dir, times_rule=True):
+    # class is built (and tables are computed or loaded) on definition
+
+    class CalcParser(Parser):
+        tokens = CalcLexer.tokens
+        tabledir = cache_dir
+        precedence = (
+            ('left', PLUS),
+            ('left', TIMES),
+        )
+
+        @_('expr PLUS expr')
+        def expr(self, p):
+            return p.expr0 + p.expr1
+
+        if times_rule:
+            @_('expr TIMES expr')
+            def expr(self, p):
+                return p.expr0 * p.expr1
+
+        @_('NUMBER')
+        def expr(self, p):
+            return int(p.NUMBER)
+
+    return CalcParser
+
+
+class TestTableCache:
+    def test_cache_is_used(self, tmp_path):
+        parser_cls = make_parser(None)
+        assert isinstance(parser_cls._lrtable, LRTable)
+
+        # first build: tables are computed and saved
+        CachedParser = make_parser(str(tmp_path))
+        assert isinstance(CachedParser._lrtable, LRTable)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # second build: tables are loaded
+        CachedParser = make_parser(str(tmp_path))
+        lrtable = CachedParser._lrtable
+        assert isinstance(lrtable, CachedLRTable)
+        assert lrtable.lr_action == parser_cls._lrtable.lr_action
+        assert lrtable.lr_goto == parser_cls._lrtable.lr_goto
+        assert lrtable.defaulted_states == parser_cls._lrtable.defaulted_states
+
+        result = CachedParser().parse(CalcLexer().tokenize('2 + 3 * 4'))
+        assert result == 14
+
+    def test_grammar_change_invalidates_cache(self, tmp_path):
+        parser_cls = make_parser(None)
+        parser_cls2 = make_parser(None, times_rule=False)
+
+        assert parser_cls._grammar.signature() == make_parser(None)._grammar.signature()
+        assert parser_cls._grammar.signature() != parser_cls2._grammar.signature()
+
+        make_parser(str(tmp_path))
+
+        # the same name, but another grammar: cached file is ignored and replaced
+        CachedParser = make_parser(str(tmp_path), times_rule=False)
+        assert isinstance(CachedParser._lrtable, LRTable)
+
+        CachedParser = make_parser(str(tmp_path), times_rule=False)
+        assert isinstance(CachedParser._lrtable, CachedLRTable)
+        assert CachedParser().parse(CalcLexer().tokenize('2 + 3')) == 5
+
+    def test_broken_cache_file(self, tmp_path):
+        make_parser(str(tmp_path))
+
+        for path in tmp_path.iterdir():
+            path.write_bytes(b'garbage')
+
+        CachedParser = make_parser(str(tmp_path))
+        assert isinstance(CachedParser._lrtable, LRTable)
+        assert CachedParser().parse(CalcLexer().tokenize('2 * 3')) == 6
@@ -0,0 +1,106 @@
+import ast
+import glob
+import os
+
+import pytest
+
+from sly.lex import LexError, Token
+
+from mindsdb_sql.parser.lexer import SQLLexer
+from mindsdb_sql.parser.dialects.mysql.lexer import MySQLLexer
+from mindsdb_sql.parser.dialects.mindsdb.lexer import MindsDBLexer
+
+
+def reference_tokenize(lexer, text):
+    # straightforward scanner: one master regex for all rules, whitespace is skipped char by char
+    cls = type(lexer)
+    index, lineno = 0, 1
+    lexer.text = text
+    while True:
+        try:
+            if text[index] in cls.ignore:
+                index += 1
+                continue
+        except IndexError:
+            return
+
+        tok = Token()
+        tok.lineno = lineno
+        tok.index = index
+        m = cls._master_re.match(text, index)
+        if m:
+            tok.end = index = m.end()
+            tok.value = m.group()
+            tok.type = m.lastgroup
+
+            if tok.type == cls.keyword_token and cls._keywords:
+                keyword = cls._lookup_keyword(text, tok)
+                if keyword is not None:
+                    tok.type = keyword
+                    index = tok.end
+
+            if tok.type in cls._remapping:
+                tok.type = cls._remapping[tok.type].get(tok.value, tok.type)
+
+            if tok.type in cls._token_funcs:
+                lexer.index = index
+                lexer.lineno = lineno
+                tok = cls._token_funcs[tok.type](lexer, tok)
+                index = lexer.index
+                lineno = lexer.lineno
+                if not tok:
+                    continue
+
+            if tok.type in cls._ignored_tokens:
+                continue
+            yield tok
+
+        elif text[index] in cls.literals:
+            tok.value = tok.type = text[index]
+            tok.end = index + 1
+            index += 1
+            yield tok
+        else:
+            lexer.index = index
+            lexer.lineno = lineno
+            tok.type = 'ERROR'
+            tok.value = text[index:]
+            tok = lexer.error(tok)
+            if tok is not None:
+                tok.end = lexer.index
+                yield tok
+            index = lexer.index
+            lineno = lexer.lineno
+
+
+def get_tokens(tokens):
+    return [(t.type, t.value, t.lineno, t.index, t.end) for t in tokens]
+
+
+def corpus():
+    # all string constants of the tests
+    strings = set()
+    tests_dir = os.path.dirname(os.path.dirname(__file__))
+    for path in glob.glob(os.path.join(tests_dir, '**', '*.py'), recursive=True):
+        with open(path) as fd:
+            tree = ast.parse(fd.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                strings.add(node.value)
+    strings.update([
+        '', '   ', 'select\t\n\r a', 'select$x from t', 'selecté', 'é', 'x = 1.5e3', "'unclosed",
+        'a <= b <> c != d || e', '@@session.x', 'select/*x*/from', '`quoted``name`',
+    ])
+    return sorted(strings)
+
+
+@pytest.mark.parametrize('lexer_class', [SQLLexer, MySQLLexer, MindsDBLexer])
+def test_same_tokens_as_reference(lexer_class):
+    for sql in corpus():
+        try:
+            expected = get_tokens(reference_tokenize(lexer_class(), sql))
+        except LexError:
+            with pytest.raises(LexError):
+                get_tokens(lexer_class().tokenize(sql))
+            continue
+        assert get_tokens(lexer_class().tokenize(sql)) == expected, sql
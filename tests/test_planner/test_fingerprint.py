@@ -0,0 +1,57 @@
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast import Identifier, Parameter
+from mindsdb_sql.planner import fingerprint
+from mindsdb_sql.planner.utils import get_query_params
+
+
+class TestFingerprint:
+    def test_same_template(self):
+        fp1 = fingerprint("SELECT * FROM t WHERE id = 5 and name in ('a', 'b') and x is null")
+        fp2 = fingerprint("select * from t where id = 7 and name in ('c', 'd') and x is null;")
+
+        assert fp1.hash == fp2.hash
+        assert fp1.template == fp2.template
+        assert fp1.values == [5, 'a', 'b']
+        assert fp2.values == [7, 'c', 'd']
+
+        # template has parameters in the same order as values
+        assert len(get_query_params(fp1.template)) == 3
+
+        assert fp1.bind() == parse_sql("SELECT * FROM t WHERE id = 5 and name in ('a', 'b') and x is null")
+        assert fp2.bind(fp1.values) == fp1.bind()
+
+    def test_different_template(self):
+        fp1 = fingerprint('select * from t where id = 5')
+        for sql in (
+            'select * from t where id > 5',
+            'select * from t where id = 5 limit 1',
+            'select * from t where id is null',
+            'select * from t2 where id = 5',
+            'select * from t where id in (5, 6)',
+        ):
+            fp2 = fingerprint(sql)
+            assert fp1.hash != fp2.hash, sql
+
+    def test_ast(self):
+        query = parse_sql("select a, 1 as one from t where b = 'x'")
+        query_str = str(query)
+
+        fp = fingerprint(query)
+        # original query isn't changed
+        assert str(query) == query_str
+        assert fp.values == [1, 'x']
+        assert fp.template.targets[1] == Parameter('?', alias=Identifier('one'))
+        assert fp.bind() == query
+
+    def test_insert(self):
+        fp1 = fingerprint("insert into t (a, b) values (1, 'x'), (2, null)")
+        fp2 = fingerprint("insert into t (a, b) values (3, 'y'), (4, null)")
+        assert fp1.hash == fp2.hash
+        assert fp1.values == [1, 'x', 2]
+
+    def test_query_parameters(self):
+        # parameters of the query stay in template
+        fp = fingerprint('select * from t where a = ? and b = 1')
+        assert fp.values[1] == 1
+        assert fp.bind() == parse_sql('select * from t where a = ? and b = 1')
+        assert fp.bind([10, 1]) == parse_sql('select * from t where a = 10 and b = 1')
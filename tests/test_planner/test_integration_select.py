@@ -781,7 +781,7 @@ class TestPlanIntegrationSelect:
             steps=[
                 FetchDataframeStep(
                     integration='int1',
-                    query=parse_sql('select * from tab1 where 0=0 order by x limit 2'),
+                    query=parse_sql('select * from tab1 order by x limit 2'),
                 ),
                 SubSelectStep(
                     dataframe=Result(0),
@@ -798,4 +798,20 @@ class TestPlanIntegrationSelect:
             predictor_metadata=[{'name': 'pred', 'integration_name': 'mindsdb'}]
         )
 
-        assert plan.steps == expected_plan.steps
\ No newline at end of file
+        assert plan.steps == expected_plan.steps
+    def test_user_functions_in_chain(self):
+        # and-chain of 3 conditions: only the condition with user function is skipped for integration
+        query = parse_sql('select * from int1.tab1 where x = 1 and y = 2 and my.fnc(a) = 1', dialect='mindsdb')
+
+        sub_query = parse_sql('select * from tab1 where x = 1 and y = 2 and my.fnc(a) = 1')
+        sub_query.from_table = None
+
+        plan = plan_query(query, integrations=['int1'])
+
+        expected_plan = QueryPlan(
+            steps=[
+                FetchDataframeStep(integration='int1', query=parse_sql('select * from tab1 where x = 1 and y = 2')),
+                SubSelectStep(dataframe=Result(0), query=sub_query, table_name='tab1'),
+            ],
+        )
+        assert plan.steps == expected_plan.steps
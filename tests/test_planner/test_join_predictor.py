@@ -527,7 +527,7 @@ class TestPredictorVersion:
 
         subquery = parse_sql("""
             select * from x
-            where a.x=1 and 0=0 and p.ttt=2 and a.y=3 and 0=0
+            where a.x=1 and p.ttt=2 and a.y=3
         """)
         subquery.from_table = None
 
@@ -599,7 +599,7 @@ class TestPredictorParams:
 
         subquery = parse_sql("""
             select * from x
-            where 0=0 and t.b=2
+            where t.b=2
         """)
         subquery.from_table = None
 
@@ -631,7 +631,6 @@ class TestPredictorParams:
 
         subquery = parse_sql("""
             select * from x
-            where 0=0
         """)
         subquery.from_table = None
 
@@ -671,19 +670,18 @@ class TestPredictorParams:
         '''
 
         q_table2 = parse_sql('select * from tab2 as t2 where x=0 and b=2 AND a IN 1')
-        q_table2.where.args[0].args[0].args[1] = Parameter(Result(2))
-        q_table2.where.args[1].args[1] = Parameter(Result(4))
+        q_table2.where.args[0].args[1] = Parameter(Result(2))
+        q_table2.where.args[2].args[1] = Parameter(Result(4))
 
         subquery = parse_sql("""
             select t2.x, m.id, x 
             from x
-            where 0=0 
-                  and t2.x=x
+            where t2.x=x
                   and t1.b=1 and t2.b=2 and t1.a = t2.a
         """)
         subquery.from_table = None
         subquery.targets[2] = Parameter(Result(0))
-        subquery.where.args[0].args[0].args[0].args[1].args[1] = Parameter(Result(2))
+        subquery.where.args[0].args[1] = Parameter(Result(2))
 
 
         query = parse_sql(sql)
@@ -735,7 +733,6 @@ class TestPredictorParams:
 
         subquery = parse_sql("""
             select * from x
-            where 0=0
         """)
         subquery.from_table = None
 
@@ -793,10 +790,6 @@ class TestPredictorParams:
                         left=Identifier('tab1'),
                         right=Identifier('tab2'),
                         join_type=JoinType.JOIN,
-                        condition=BinaryOperation('and', args=[
-                            BinaryOperation('=', args=[Constant(0), Constant(0)]),
-                            BinaryOperation('=', args=[Constant(0), Constant(0)])
-                        ])
                     ),
                 ),
             ],
@@ -807,6 +800,19 @@ class TestPredictorParams:
 
         assert plan.steps == expected_plan.steps
 
+    def test_model_column_map_chain(self):
+        # and-chain of 3 conditions in join
+        query = parse_sql('select * from int.tab1 a join mindsdb.pred p on a.x = p.x and a.y = p.y and a.z = p.z')
+
+        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb',
+                          predictor_metadata={'pred': {}})
+
+        assert plan.steps[1] == ApplyPredictorStep(
+            step_num=1, namespace='mindsdb', dataframe=Result(0),
+            predictor=Identifier('pred', alias=Identifier('p')),
+            columns_map={'x': Identifier('a.x'), 'y': Identifier('a.y'), 'z': Identifier('a.z')}
+        )
+
     def test_partition(self):
 
         sql = '''
@@ -336,6 +336,8 @@ class TestPlanJoinTables:
 
         subquery = copy.deepcopy(query)
         subquery.from_table = None
+        # 1=1 is removed
+        subquery.where.args.pop()
 
         q_table3 = parse_sql('select * from tbl3 where id in 0')
         q_table3.where.args[1] = Parameter(Result(5))
@@ -0,0 +1,86 @@
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast import Select, Star, Identifier, BinaryOperation, Constant, Tuple
+from mindsdb_sql.planner import plan_query, PlanCache
+from mindsdb_sql.planner.normalize import normalize_query
+from mindsdb_sql.planner.steps import FetchDataframeStep
+
+
+def normalize(sql):
+    return normalize_query(parse_sql(sql)).to_string()
+
+
+class TestOrToIn:
+    def test_rewrite(self):
+        assert normalize('select * from t where a = 3 or a = 1 or 2 = a') == \
+               'SELECT * FROM t WHERE a IN (1, 2, 3)'
+
+        # duplicates and existing lists
+        assert normalize("select * from t where a = 'x' or a in ('z', 'x') or a = 'y'") == \
+               "SELECT * FROM t WHERE a IN ('x', 'y', 'z')"
+
+        # other items of the chain keep the order
+        assert normalize('select * from t where b > 1 or a = 2 or c = 1 or a = 1 or c = 2 or d = 1') == \
+               'SELECT * FROM t WHERE b > 1 OR a IN (1, 2) OR c IN (1, 2) OR d = 1'
+
+        # types are not mixed
+        assert normalize("select * from t where a = 1 or a = '1' or a = 1.0 or a = 1") == \
+               "SELECT * FROM t WHERE a IN (1.0, 1, '1')"
+
+    def test_ast(self):
+        query = normalize_query(parse_sql('select * from t where x = 1 and (t.a = 2 or t.a = 1)'))
+        expected = Select(
+            targets=[Star()],
+            from_table=Identifier('t'),
+            where=BinaryOperation(op='and', args=[
+                BinaryOperation(op='=', args=[Identifier('x'), Constant(1)]),
+                BinaryOperation(op='in', parentheses=True, args=[
+                    Identifier('t.a'), Tuple([Constant(1), Constant(2)])
+                ]),
+            ])
+        )
+        assert query.to_tree() == expected.to_tree()
+        assert str(query) == str(expected)
+
+    def test_nested(self):
+        assert normalize('select * from t where (a = 1 or (b = 1 or b = 2)) or a = 2') == \
+               'SELECT * FROM t WHERE a IN (1, 2) OR b IN (1, 2)'
+
+        # in subqueries and targets
+        assert normalize('select x = 1 or x = 2 as f from (select * from t where y = 2 or y = 1)') == \
+               'SELECT x IN (1, 2) AS f FROM (SELECT * FROM t WHERE y IN (1, 2))'
+
+    def test_not_changed(self):
+        for sql in (
+            'SELECT * FROM t WHERE a = 1 OR b = 1',
+            'SELECT * FROM t WHERE a = 1 AND a = 2',
+            'SELECT * FROM t WHERE a = b OR a = c',
+            'SELECT * FROM t WHERE a = 1 OR a > 2',
+            'SELECT * FROM t WHERE a = ? OR a = ?',
+            'SELECT * FROM t WHERE a = NULL OR a = NULL',
+            'SELECT * FROM t WHERE a = 1 OR a IN (SELECT x FROM t2)',
+        ):
+            assert normalize(sql) == parse_sql(sql).to_string()
+
+
+class TestPlanner:
+    def test_integration_select(self):
+        plan = plan_query(
+            parse_sql('select * from int.tab where a = 2 or a = 1 or a = 2'),
+            integrations=['int']
+        )
+        assert plan.steps == [
+            FetchDataframeStep(step_num=0, integration='int', query=parse_sql('select * from tab where a in (1, 2)')),
+        ]
+
+    def test_plan_cache(self):
+        # the same template for any order and count of duplicates
+        cache = PlanCache()
+        sqls = [
+            'select * from int.tab where a = 1 or a = 2',
+            'select * from int.tab where a = 4 or a = 3',
+            'select * from int.tab where a = 5 or a = 6 or a = 5',
+        ]
+        for sql in sqls:
+            plan = plan_query(parse_sql(sql), integrations=['int'], plan_cache=cache)
+            assert plan.steps == plan_query(parse_sql(sql), integrations=['int']).steps
+        assert cache.stats()['hits'] == 2
@@ -0,0 +1,58 @@
+from mindsdb_sql import parse_sql
+from mindsdb_sql.planner import plan_query, PlanCache
+
+
+class TestPlanCache:
+    def check_queries(self, sqls, **kwargs):
+        cache = PlanCache()
+        for sql in sqls:
+            expected_plan = plan_query(parse_sql(sql), **kwargs)
+            plan = plan_query(parse_sql(sql), plan_cache=cache, **kwargs)
+            assert plan.steps == expected_plan.steps
+        return cache
+
+    def test_integration_select(self):
+        cache = self.check_queries([
+            "select a, 1 as one from int.tab where x = 1 and y in ('a', 'b') limit 10",
+            "select a, 2 as one from int.tab where x = 2 and y in ('c', 'd') limit 10",
+            "select a, 3 as one from int.tab where x = 3 and y in ('e', 'f') limit 10",
+        ], integrations=['int'])
+        assert cache.stats() == dict(size=1, maxsize=1024, hits=2, misses=1, evictions=0)
+
+    def test_join_predictor(self):
+        cache = self.check_queries([
+            'select t.a, p.y from int.tab t join mindsdb.pred p where t.x = 1 limit 5',
+            'select t.a, p.y from int.tab t join mindsdb.pred p where t.x = 2 limit 5',
+            "select * from mindsdb.pred where x = 1 and y = 'a'",
+            "select * from mindsdb.pred where x = 2 and y = 'b'",
+        ], integrations=['int'], predictor_metadata={'pred': {}})
+        assert cache.hits == 2
+
+    def test_not_cacheable(self):
+        # values are used by planner: template is planned differently
+        cache = self.check_queries([
+            'select * from mindsdb.pred where 1 = 0',
+            'select * from mindsdb.pred where 1 = 0',
+        ], predictor_metadata={'pred': {}})
+        assert cache.hits == 1
+        assert list(cache._data.values()) == [None]
+
+    def test_catalog_change(self):
+        cache = PlanCache()
+        query = parse_sql('select * from int.tab join mindsdb.pred where x = 1')
+
+        plan_query(query, integrations=['int'], predictor_metadata={'pred': {}}, plan_cache=cache)
+
+        # another predictor: it is a table now
+        plan = plan_query(query, integrations=['int'], predictor_metadata={'pred2': {}}, plan_cache=cache)
+        assert cache.misses == 2
+        assert plan.steps == plan_query(query, integrations=['int'], predictor_metadata={'pred2': {}}).steps
+
+        plan_query(query, integrations=['int'], predictor_metadata={'pred': {}}, plan_cache=cache)
+        assert cache.hits == 1
+
+    def test_eviction(self):
+        cache = PlanCache(maxsize=2)
+        for sql in ('select 1 from int.t1', 'select 1 from int.t2', 'select 1 from int.t3', 'select 2 from int.t1'):
+            plan_query(parse_sql(sql), integrations=['int'], plan_cache=cache)
+        assert cache.stats() == dict(size=2, maxsize=2, hits=0, misses=4, evictions=2)
@@ -1,7 +1,12 @@
 import inspect
 
-from mindsdb_sql.planner import query_planner
+import pytest
+
+from mindsdb_sql import parse_sql
+from mindsdb_sql.exceptions import PlanningException
+from mindsdb_sql.planner import query_planner, plan_query
 from mindsdb_sql.planner import steps
+from mindsdb_sql.planner.utils import fill_query_params
 
 from tests.test_planner import test_integration_select
 from tests.test_planner import test_join_predictor
@@ -144,3 +149,65 @@ class TestPreparedStatement:
                         else:
                             raise e
 
+
+
+class TestPreparedPlan:
+    def prepare(self, sql, **kwargs):
+        planner = query_planner.QueryPlanner(**kwargs)
+        for step in planner.prepare_steps(parse_sql(sql)):
+            step.set_result(executor.execute(step))
+        return planner
+
+    def check_executions(self, sql, params_list, **kwargs):
+        planner = self.prepare(sql, **kwargs)
+        for params in params_list:
+            steps = list(planner.execute_steps(params))
+
+            query = parse_sql(sql)
+            expected_plan = plan_query(fill_query_params(query, params), **kwargs)
+            assert steps == expected_plan.steps
+        return planner
+
+    def test_plan_is_reused(self, monkeypatch):
+        sql = "select a, ? as b from int.tab where x = ? and y in (?, 'z') limit 10"
+        params_list = [[1, 2, 'c'], ['d', 3.5, 'e']]
+        planner = self.check_executions(sql, params_list, integrations=['int'])
+        assert planner.statement.plan_verified
+
+        # next executions don't use planner
+        def from_query(*args, **kwargs):
+            raise AssertionError('planner is used')
+        monkeypatch.setattr(planner, 'from_query', from_query)
+
+        steps = list(planner.execute_steps([5, 6, 'f']))
+        expected_plan = plan_query(parse_sql("select a, 5 as b from int.tab where x = 6 and y in ('f', 'z') limit 10"),
+                                   integrations=['int'])
+        assert steps == expected_plan.steps
+
+    def test_join_predictor(self):
+        sql = 'select t.column1, p.predicted from int.tab1 t join mindsdb.pred p where t.x = ? and t.col1 > ?'
+        params_list = [[1, 2], [3, 4], ['a', 'b']]
+        planner = self.check_executions(sql, params_list, integrations=['int'], predictor_metadata={'pred': {}})
+        assert planner.statement.plan_verified
+
+    def test_not_verified(self):
+        # template is planned differently: the query is planned on every execution
+        sql = 'select * from mindsdb.pred where ? = ?'
+        params_list = [[1, 0], [1, 0]]
+        planner = self.check_executions(sql, params_list, predictor_metadata={'pred': {}})
+        assert planner.statement.plan_data is None
+
+    def test_simplified_params(self):
+        # condition is simplified by values: the plan can't be reused with other values
+        for sql, params_list in (
+            ('select * from int.tab where x = ? and ?', [[1, 1], [2, False]]),
+            ('select * from int.tab where x = ? or ?', [[1, 0], [3, True]]),
+            ('select * from int.tab where x = ? and ? + 1 > 2', [[1, 2], [2, 0]]),
+        ):
+            planner = self.check_executions(sql, params_list, integrations=['int'])
+            assert planner.statement.plan_data is None
+
+    def test_wrong_params(self):
+        planner = self.prepare('select * from int.tab where x = ?', integrations=['int'])
+        with pytest.raises(PlanningException):
+            planner.execute_steps([1, 2])
@@ -0,0 +1,35 @@
+import pytest
+
+from mindsdb_sql import parse_sql
+from mindsdb_sql.exceptions import PlanningException
+from mindsdb_sql.planner.utils import fill_query_params, ParamsBinder
+
+
+class TestQueryParams:
+    def test_fill_query_params(self):
+        params = [1, 'a', 2.5]
+        query = fill_query_params(parse_sql('select ? as x from t where a = ? and b in (?, 1)'), params)
+        assert query == parse_sql("select 1 as x from t where a = 'a' and b in (2.5, 1)")
+        # list of params isn't changed
+        assert params == [1, 'a', 2.5]
+
+        with pytest.raises(PlanningException):
+            fill_query_params(parse_sql('select * from t where a = ? and b = ?'), [1])
+
+    def test_binder(self):
+        sql = 'insert into t (a, b) values (?, ?), (?, 1)'
+        query = parse_sql(sql)
+        binder = ParamsBinder(query)
+
+        assert binder.bind([1, 'a', 2]) == parse_sql("insert into t (a, b) values (1, 'a'), (2, 1)")
+        # source query isn't changed
+        assert query == parse_sql(sql)
+
+        queries = [q.to_string() for q in binder.bind_many([[1, 2, 3], [4, 5, 6]])]
+        assert queries == [
+            'INSERT INTO t(a, b) VALUES (1, 2), (3, 1)',
+            'INSERT INTO t(a, b) VALUES (4, 5), (6, 1)',
+        ]
+
+        with pytest.raises(PlanningException):
+            binder.bind([1, 2])
@@ -0,0 +1,94 @@
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast import Identifier
+from mindsdb_sql.planner import plan_query
+from mindsdb_sql.planner.simplify import simplify_query
+from mindsdb_sql.planner.steps import FetchDataframeStep, GetTableColumns, GetPredictorColumns, SubSelectStep
+from mindsdb_sql.planner.step_result import Result
+
+
+def simplify(sql):
+    return simplify_query(parse_sql(sql)).to_string()
+
+
+class TestSimplify:
+    def test_where(self):
+        for sql, expected in (
+            ('select * from t where 1=1 and x = 1', 'SELECT * FROM t WHERE x = 1'),
+            ('select * from t where x = 1 and true', 'SELECT * FROM t WHERE x = 1'),
+            ('select * from t where not not x', 'SELECT * FROM t WHERE x'),
+            ('select * from t where not (not x = 1)', 'SELECT * FROM t WHERE x = 1'),
+            ('select * from t where x = 1 or 2 > 3', 'SELECT * FROM t WHERE x = 1'),
+            ('select * from t where (x = 1 or false) and not (y = 2 and 1 = 1)',
+             'SELECT * FROM t WHERE (x = 1) AND not (y = 2)'),
+            ('select * from t where x > -(1 + 2) * 3', 'SELECT * FROM t WHERE x > -9'),
+
+            # the result is known
+            ('select * from t where 0 = 0', 'SELECT * FROM t'),
+            ('select * from t where x = 1 or not false', 'SELECT * FROM t'),
+            ('select * from t where x = 1 and 2 < 1', 'SELECT * FROM t WHERE 1 = 0'),
+            ('select x from t group by x having 1 = 1', 'SELECT x FROM t GROUP BY x'),
+
+            # subqueries
+            ('select * from (select * from t where 1 = 1) where x in (select y from t2 where 3 = 1 + 2)',
+             'SELECT * FROM (SELECT * FROM t) WHERE x IN (SELECT y FROM t2)'),
+        ):
+            assert simplify(sql) == expected
+
+    def test_not_changed(self):
+        for sql in (
+            # results depend on database: type of division, collation of strings, float arithmetic
+            'SELECT * FROM t WHERE 1 / 2 = 0',
+            "SELECT * FROM t WHERE 'a' = 'A'",
+            'SELECT * FROM t WHERE 0.1 + 0.2 = 0.3',
+            'SELECT * FROM t WHERE NULL = NULL',
+            # targets are not changed: it could change names of columns
+            'SELECT 1 + 1, 1 = 1 FROM t',
+        ):
+            assert simplify(sql) == parse_sql(sql).to_string()
+
+    def test_join_condition(self):
+        assert simplify('select * from t1 join t2 on 0 = 0') == 'SELECT * FROM t1 JOIN t2'
+        assert simplify('select * from t1 join t2 on t1.x = t2.x and 1 = 1') == \
+               'SELECT * FROM t1 JOIN t2 ON t1.x = t2.x'
+        # outer join keeps condition
+        assert simplify('select * from t1 left join t2 on 0 = 0 and true') == \
+               'SELECT * FROM t1 LEFT JOIN t2 ON 1 = 1'
+
+
+class TestPlanner:
+    def test_integration_select(self):
+        query = parse_sql('select * from int.tab where x = 1 and 2 = 2')
+        plan = plan_query(query, integrations=['int'])
+
+        assert plan.steps == [
+            FetchDataframeStep(step_num=0, integration='int', query=parse_sql('select * from tab where x = 1')),
+        ]
+
+    def test_empty_result(self):
+        # integration is not queried
+        query = parse_sql('select count(*) from int.tab where x = 1 and 2 = 3')
+        plan = plan_query(query, integrations=['int'])
+
+        sub_query = parse_sql('select count(*) from x where 1 = 0')
+        sub_query.from_table = None
+        assert plan.steps == [
+            GetTableColumns(step_num=0, namespace='int', table='tab'),
+            SubSelectStep(step_num=1, dataframe=Result(0), query=sub_query, table_name='tab'),
+        ]
+
+        # table is passed as name
+        query = parse_sql('select * from int.sch.tab t where 2 = 3')
+        plan = plan_query(query, integrations=['int'])
+        assert plan.steps[0] == GetTableColumns(step_num=0, namespace='int', table='sch.tab')
+
+        # subquery has to be executed
+        query = parse_sql('select * from int.tab where 2 = 3 or x = (select 1 from int.tab2)')
+        plan = plan_query(query, integrations=['int'])
+        assert isinstance(plan.steps[0], FetchDataframeStep)
+
+        # predictor
+        query = parse_sql('select * from mindsdb.pred where x = 1 and not true')
+        plan = plan_query(query, predictor_metadata={'pred': {}})
+        assert plan.steps == [
+            GetPredictorColumns(step_num=0, namespace='mindsdb', predictor=Identifier('pred')),
+        ]
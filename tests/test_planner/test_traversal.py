@@ -0,0 +1,108 @@
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser import ast
+from mindsdb_sql.planner.utils import query_traversal
+
+
+class TestQueryTraversal:
+    def test_order(self):
+        query = parse_sql('select a, b from t1 join t2 on t1.x = t2.y where c = 1 order by d')
+
+        visited = []
+
+        def callback(node, is_table, is_target, parent_query):
+            if isinstance(node, ast.Identifier):
+                visited.append((node.parts_to_str(), is_table, is_target, parent_query is query))
+
+        query_traversal(query, callback)
+        assert visited == [
+            ('t2', True, False, True),
+            ('t1', True, False, True),
+            ('t1.x', False, False, True),
+            ('t2.y', False, False, True),
+            ('a', False, True, True),
+            ('b', False, True, True),
+            ('c', False, False, True),
+            ('d', False, False, True),
+        ]
+
+    def test_node_types(self):
+        query = parse_sql('select a + 1, f(?) from t where b = ? and c in (select d from t2 where e = ?)')
+
+        visited = []
+
+        def callback(node, **kwargs):
+            visited.append(type(node))
+
+        query_traversal(query, callback, node_types=ast.Parameter)
+        assert visited == [ast.Parameter] * 3
+
+        visited.clear()
+        query_traversal(query, callback, node_types=(ast.Select, ast.Parameter))
+        assert visited == [ast.Select, ast.Parameter, ast.Parameter, ast.Select, ast.Parameter]
+
+    def test_replace(self):
+        query = parse_sql('select a, b from t where x in (1, 2) and y = 3')
+        targets, args = query.targets, query.where.args
+
+        def callback(node, **kwargs):
+            if isinstance(node, ast.Constant) and node.value == 2:
+                return ast.Constant(20)
+
+        query_traversal(query, callback)
+        assert query == parse_sql('select a, b from t where x in (1, 20) and y = 3')
+
+        # lists without replaced items are kept
+        assert query.targets is targets
+        assert query.where.args is args
+
+        # list with replaced item is copied
+        tuple_items = query.where.args[0].args[1].items
+        query_traversal(query, lambda node, **kwargs: ast.Constant(0) if node is tuple_items[0] else None)
+        assert query.where.args[0].args[1].items is not tuple_items
+        assert tuple_items[0] == ast.Constant(1)
+
+    def test_replace_targets(self):
+        query = parse_sql('select a, b, c from t')
+
+        def callback(node, is_target, **kwargs):
+            if is_target and node.parts == ['b']:
+                return [ast.Identifier('b1'), ast.Identifier('b2')]
+
+        query_traversal(query, callback)
+        assert query == parse_sql('select a, b1, b2, c from t')
+
+    def test_replace_cte(self):
+        query = parse_sql('with t1 as (select * from t) select * from t1')
+
+        def callback(node, parent_query, **kwargs):
+            if isinstance(node, ast.Select) and node is not query:
+                return parse_sql('select x from t2')
+
+        query_traversal(query, callback)
+        assert query == parse_sql('with t1 as (select x from t2) select * from t1')
+
+    def test_deep_tree(self):
+        # is deeper than recursion limit
+        where = ast.Identifier('x0')
+        for i in range(1, 5000):
+            where = ast.BinaryOperation(op='and', args=[where, ast.Identifier(f'x{i}')])
+        query = ast.Select(targets=[ast.Star()], from_table=ast.Identifier('t'), where=where)
+
+        names = []
+
+        def callback(node, **kwargs):
+            names.append(node.parts[0])
+            return ast.Identifier(node.parts[0].upper())
+
+        query_traversal(query, callback, node_types=ast.Identifier)
+        assert names == ['t'] + [f'x{i}' for i in range(5000)]
+        assert query.from_table.parts == ['T']
+
+    def test_frozen(self):
+        query = parse_sql('select a from t where b = ?')
+        query.freeze()
+
+        # tree isn't changed: traversal doesn't assign attributes
+        params = []
+        query_traversal(query, lambda node, **kwargs: params.append(node), node_types=ast.Parameter)
+        assert len(params) == 1
@@ -1276,6 +1276,7 @@ class TestJoinTimeseriesPredictor:
                     'a': Identifier('df.a'),
                     'b': Identifier('df.b'),
                 },
+                from_select_alias=Identifier('df'),
                 where=BinaryOperation(op='=', args=[
                     Identifier('c'),
                     Identifier('df.c')
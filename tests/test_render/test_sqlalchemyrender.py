@@ -209,3 +209,14 @@ class TestRender:
         assert params == values
 
 
+
+    def test_operation_chains(self):
+        sql = "SELECT a || b || 'c' AS x FROM t WHERE x = 1 AND y = 2 AND (z = 3 OR z = 4 OR z = 5)"
+        sql2 = SqlalchemyRender('postgres').get_string(parse_sql(sql), with_failback=False)
+        assert sql2.replace('\n', '').replace('  ', ' ') == sql
+
+        # long chains don't reach recursion limit
+        count = 5000
+        sql = 'SELECT * FROM t WHERE ' + ' OR '.join(f'a = {i}' for i in range(count))
+        sql2 = SqlalchemyRender('postgres').get_string(parse_sql(sql), with_failback=False)
+        assert sql2.replace('\n', '').replace('  ', ' ') == sql